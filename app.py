@@ -11,13 +11,14 @@
 =====================================================================
 """
 
-from flask import Flask, render_template, request, jsonify
+from itertools import islice
+
+from flask import Flask, request, jsonify
 from newton_cooling.core.calculations import (
     calcular_temperatura,
     calcular_tiempo_para_temperatura,
     calcular_constante_K,
-    calcular_constante_C,
-    generar_tabla_enfriamiento
+    calcular_constante_C
 )
 from desintegracion_radiactiva.core.calculations import (
     calcular_constante_k,
@@ -25,29 +26,351 @@ from desintegracion_radiactiva.core.calculations import (
     calcular_tiempo_t,
     calcular_N0,
     calcular_media_vida,
-    calcular_k_desde_datos,
-    generar_tabla_desintegracion
+    calcular_k_desde_datos
+)
+from curvas.basis_cache import CacheBases, combinar_afin
+from curvas.deadline import PlazoExcedido, plazo_de_resultado, verificar_plazo
+from curvas.downsampling import reducir_tabla
+from curvas.incremental import (
+    exponencial_en,
+    generar_exponenciales,
+    generar_filas_enfriamiento,
+    generar_filas_desintegracion,
+    codificar_cursor,
+    decodificar_cursor
+)
+from web.api_v2 import es_pesada_v2, estimar_puntos_exportacion, estimar_puntos_v2, instalar_api_v2
+from web.compression import instalar_compresion
+from web.deadlines import instalar_plazos
+from web.jobs import estimar_puntos_trabajo, instalar_trabajos
+from web.json_provider import TablaFija
+from web.metrics import instalar_metricas, registrar_cache, registrar_rechazo, registrar_tamano_tabla
+from web.pages import instalar_paginas
+from web.phases import medir_fase
+from web.ratelimit import instalar_limites, instalar_proxies
+from web.singleflight import SingleFlight
+from web.streaming import (
+    MIN_FPS,
+    duracion_flujo,
+    generar_cuadros,
+    liberar_flujo,
+    reservar_flujo,
+    respuesta_sse,
+    verificar_extremos
 )
+from web.timing import instalar_server_timing
 
 app = Flask(__name__)
+instalar_proxies(app)
+instalar_metricas(app)
+instalar_server_timing(app)
+instalar_trabajos(app)
+instalar_plazos(app)
+instalar_compresion(app)
+paginas = instalar_paginas(app)
+
+# Máximo de puntos que se devuelven en una respuesta de tabla
+MAX_PUNTOS_RESPUESTA = 1000
+
+# Máximo de puntos que se calculan cuando el cliente pide max_points
+MAX_PUNTOS_CALCULO = 200000
+
+# Límites de los flujos SSE
+MAX_FPS_STREAM = 60
+MAX_PUNTOS_POR_FRAME = 1000
+
+# Peticiones de tabla idénticas y simultáneas comparten un solo cálculo
+tablas_en_curso = SingleFlight('tablas')
+
+# Bases e^(c*t) compartidas entre tablas que solo cambian Tm, C o N0
+bases_exponenciales = CacheBases(observador=lambda acierto: registrar_cache('bases', acierto))
+
+
+def estimar_puntos_tabla(peticion):
+    """
+    Estima cuántos puntos calculará una petición de tabla o flujo.
+    
+    Parámetros:
+        peticion (Request): Petición con tiempo_total, intervalo y limit
+                            en el cuerpo JSON o en la URL
+    
+    Retorna:
+        int: Puntos estimados (0 si los datos no son válidos)
+    """
+    data = peticion.get_json(silent=True) if peticion.is_json else peticion.args
+    try:
+        puntos = int(float(data['tiempo_total']) / float(data['intervalo'])) + 1
+        if data.get('limit') is not None:
+            puntos = min(puntos, int(data['limit']))
+    except (KeyError, ValueError, TypeError, ZeroDivisionError, OverflowError, AttributeError):
+        return 0
+    return min(max(puntos, 0), MAX_PUNTOS_CALCULO)
+
+
+# Límite de tasa por cliente ponderado por puntos. Las tablas completas
+# además comparten un límite de peticiones simultáneas.
+instalar_limites(app, {
+    'api_generar_tabla': (estimar_puntos_tabla, True),
+    'api_generar_tabla_radiactiva': (estimar_puntos_tabla, True),
+    'api_stream_newton': (estimar_puntos_tabla, False),
+    'api_stream_radiactiva': (estimar_puntos_tabla, False),
+    'api_v2_accion': (estimar_puntos_v2, es_pesada_v2),
+    'api_v2_exportar': (estimar_puntos_exportacion, True),
+    'api_enviar_trabajo': (estimar_puntos_trabajo, False)
+}, al_rechazar=registrar_rechazo)
+
+# API unificada de modelos (comparte la caché de bases con las tablas)
+instalar_api_v2(app, bases_exponenciales)
+
+
+def leer_max_points(data):
+    """
+    Lee el parámetro opcional max_points de una petición de tabla.
+    
+    Parámetros:
+        data (dict): Cuerpo JSON de la petición
+    
+    Retorna:
+        int: Número máximo de puntos a devolver, o None si no se pidió
+    """
+    if data.get('max_points') is None:
+        return None
+    
+    max_points = int(data['max_points'])
+    if max_points < 3 or max_points > MAX_PUNTOS_RESPUESTA:
+        raise ValueError(f'max_points debe estar entre 3 y {MAX_PUNTOS_RESPUESTA}')
+    return max_points
+
+
+def leer_paginacion(data, modelo, parametros):
+    """
+    Lee los parámetros opcionales de paginación de una petición de tabla.
+    
+    Se puede pedir una página con offset/limit, o continuar una tabla
+    (siguiente página o horizonte extendido) con el cursor de la
+    respuesta anterior.
+    
+    Parámetros:
+        data (dict): Cuerpo JSON de la petición
+        modelo (str): Nombre del modelo de la tabla
+        parametros (list): Parámetros que definen la curva y la malla
+    
+    Retorna:
+        tuple: (inicio, limite, exp_inicio) o None si no se pidió paginación
+    """
+    if data.get('cursor') is None and data.get('offset') is None and data.get('limit') is None:
+        return None
+    
+    if data.get('max_points') is not None:
+        raise ValueError('max_points no se puede combinar con paginación')
+    
+    limite = int(data.get('limit', MAX_PUNTOS_RESPUESTA))
+    if limite < 1 or limite > MAX_PUNTOS_RESPUESTA:
+        raise ValueError(f'limit debe estar entre 1 y {MAX_PUNTOS_RESPUESTA}')
+    
+    if data.get('cursor') is not None:
+        modelo_cursor, parametros_cursor, inicio, exp_inicio = decodificar_cursor(data['cursor'])
+        if modelo_cursor != modelo or parametros_cursor != parametros:
+            raise ValueError('El cursor no corresponde a estos parámetros')
+        return inicio, limite, exp_inicio
+    
+    inicio = int(data.get('offset', 0))
+    if inicio < 0:
+        raise ValueError('offset debe ser mayor o igual a 0')
+    return inicio, limite, None
+
+
+def obtener_base(c, intervalo, num_puntos):
+    """
+    Obtiene la base e^(c*t) de una tabla respetando el plazo de la petición.
+    
+    Parámetros:
+        c (float): Coeficiente del exponente de la curva
+        intervalo (float): Intervalo entre puntos
+        num_puntos (int): Puntos de la tabla
+    
+    Retorna:
+        tuple: (base, completo). Si el plazo venció, base contiene solo
+               los puntos calculados y completo es False
+    """
+    try:
+        return bases_exponenciales.obtener(c, intervalo, num_puntos), True
+    except PlazoExcedido as e:
+        return e.parcial if e.parcial is not None else [], False
+
+
+def obtener_columnas(c, intervalo, num_puntos, coeficientes):
+    """
+    Calcula columnas a + b * e^(c*t) de una tabla respetando el plazo.
+    
+    Si la base ya quedó parcial, las columnas se combinan sin plazo (el
+    trabajo es proporcional a lo calculado). Si el plazo vence al
+    combinar, todas las columnas se recortan a las filas combinadas.
+    
+    Parámetros:
+        c (float): Coeficiente del exponente de la curva
+        intervalo (float): Intervalo entre puntos
+        num_puntos (int): Puntos de la tabla
+        coeficientes (list): Pares (a, b), uno por columna
+    
+    Retorna:
+        tuple: (columnas, completo)
+    """
+    base, completo = obtener_base(c, intervalo, num_puntos)
+    columnas = []
+    for a, b in coeficientes:
+        try:
+            with plazo_de_resultado(completo):
+                columnas.append(combinar_afin(a, b, base))
+        except PlazoExcedido as e:
+            completo = False
+            base = base[:len(e.parcial)]
+            columnas = [columna[:len(base)] for columna in columnas] + [e.parcial]
+    return columnas, completo
+
+
+def datos_tabla_parcial(modelo, parametros, c, intervalo, calculados):
+    """
+    Campos de una respuesta de tabla cortada por el plazo.
+    
+    Parámetros:
+        modelo (str): Nombre del modelo de la tabla
+        parametros (list): Parámetros que definen la curva y la malla
+        c (float): Coeficiente del exponente de la curva
+        intervalo (float): Intervalo entre puntos
+        calculados (int): Filas calculadas antes del plazo
+    
+    Retorna:
+        dict: Error, completo=False y cursor para continuar la tabla
+    """
+    return {
+        'exito': False,
+        'error': 'El cálculo superó el tiempo máximo permitido. Se devuelven las filas calculadas; usa cursor_siguiente para continuar.',
+        'completo': False,
+        'cursor_siguiente': codificar_cursor(modelo, parametros, calculados,
+                                             exponencial_en(c, intervalo, calculados))
+    }
+
+
+def tabla_completa(resultado):
+    """Indica si un resultado (cuerpo, estado) de tabla compartido está completo."""
+    return resultado[1] == 200
+
+
+def responder_pagina(modelo, parametros, c, intervalo, tiempo_total, paginacion,
+                     campos, construir_fila, datos_extra):
+    """
+    Calcula solo las filas de una página con el motor incremental.
+    
+    Parámetros:
+        modelo (str): Nombre del modelo de la tabla
+        parametros (list): Parámetros que definen la curva y la malla
+        c (float): Coeficiente del exponente de la curva
+        intervalo (float): Intervalo entre puntos
+        tiempo_total (float): Horizonte de la tabla
+        paginacion (tuple): (inicio, limite, exp_inicio) de leer_paginacion
+        campos (list): Pares (nombre, decimales) de las columnas
+        construir_fila (callable): construir_fila(t, e) -> tupla de valores
+        datos_extra (dict): Campos adicionales de la respuesta
+    
+    Retorna:
+        Response: Página de la tabla con el cursor para continuarla
+    """
+    inicio, limite, exp_inicio = paginacion
+    num_puntos_total = int(tiempo_total / intervalo) + 1
+    fin = max(min(inicio + limite, num_puntos_total), inicio)
+    
+    with medir_fase('compute'):
+        exponenciales = generar_exponenciales(c, intervalo, inicio, exp_inicio)
+        pagina = list(islice(exponenciales, fin - inicio))
+        _, _, exp_siguiente = next(exponenciales)
+        # Una página tiene como máximo MAX_PUNTOS_RESPUESTA filas
+        verificar_plazo()
+        filas = [construir_fila(t, e) for _, t, e in pagina]
+    registrar_tamano_tabla(len(filas))
+    
+    # Las filas se formatean en bloque con decimales fijos al serializar
+    return jsonify({
+        'exito': True,
+        'tabla': TablaFija(campos, filas),
+        **datos_extra,
+        'offset': inicio,
+        'num_puntos': len(filas),
+        'num_puntos_total': num_puntos_total,
+        'completo': fin >= num_puntos_total,
+        'cursor_siguiente': codificar_cursor(modelo, parametros, fin, exp_siguiente)
+    })
+
+
+def leer_parametros_stream(args, tiempo_total, intervalo):
+    """
+    Lee y valida los parámetros comunes de un flujo SSE.
+    
+    Parámetros:
+        args (MultiDict): Parámetros de la URL
+        tiempo_total (float): Tiempo total a simular
+        intervalo (float): Intervalo entre puntos
+    
+    Retorna:
+        tuple: (total_puntos, fps, puntos_por_frame)
+    """
+    fps = float(args.get('fps', 10))
+    puntos_por_frame = int(args.get('puntos_por_frame', 1))
+    
+    if tiempo_total <= 0:
+        raise ValueError('El tiempo total debe ser mayor a 0')
+    if intervalo <= 0:
+        raise ValueError('El intervalo debe ser mayor a 0')
+    if not MIN_FPS <= fps <= MAX_FPS_STREAM:
+        raise ValueError(f'fps debe estar entre {MIN_FPS} y {MAX_FPS_STREAM}')
+    if not 1 <= puntos_por_frame <= MAX_PUNTOS_POR_FRAME:
+        raise ValueError(f'puntos_por_frame debe estar entre 1 y {MAX_PUNTOS_POR_FRAME}')
+    
+    total_puntos = int(tiempo_total / intervalo) + 1
+    if total_puntos > MAX_PUNTOS_CALCULO:
+        raise ValueError(f'Demasiados puntos de datos ({total_puntos}). El máximo es {MAX_PUNTOS_CALCULO}.')
+    duracion_flujo(total_puntos, fps, puntos_por_frame)
+    return total_puntos, fps, puntos_por_frame
+
+
+def abrir_flujo(eventos):
+    """
+    Responde un flujo SSE si el worker tiene un cupo de flujo libre.
+    
+    Parámetros:
+        eventos (generator): Generador de eventos SSE en texto
+    
+    Retorna:
+        Response: Flujo SSE, o 503 con Retry-After si no hay cupo
+    """
+    if not reservar_flujo():
+        registrar_rechazo('concurrencia')
+        response = jsonify({
+            'exito': False,
+            'error': 'Hay demasiados flujos abiertos. Intente de nuevo en unos segundos.'
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = '5'
+        return response
+    return respuesta_sse(eventos, al_cerrar=liberar_flujo)
 
 
 @app.route('/')
 def index():
     """Página principal - Panel de bienvenida."""
-    return render_template('index.html')
+    return paginas.responder('index.html')
 
 
 @app.route('/newton')
 def newton():
     """Página de Ley de Enfriamiento de Newton."""
-    return render_template('newton.html')
+    return paginas.responder('newton.html')
 
 
 @app.route('/radiactiva')
 def radiactiva():
     """Página de Desintegración Radiactiva."""
-    return render_template('radiactiva.html')
+    return paginas.responder('radiactiva.html')
 
 
 @app.route('/api/calcular-temperatura', methods=['POST'])
@@ -261,8 +584,9 @@ def api_generar_tabla():
     """
     Endpoint para generar tabla de enfriamiento.
     
-    Espera: {Tm, C, K, tiempo_total, intervalo}
-    Retorna: {tabla, exito}
+    Espera: {Tm, C, K, tiempo_total, intervalo, max_points (opcional)}
+            Paginación opcional: {offset, limit} o {cursor, limit}
+    Retorna: {tabla, exito} (+ cursor_siguiente al paginar)
     """
     try:
         data = request.get_json()
@@ -284,33 +608,62 @@ def api_generar_tabla():
                 'error': 'El intervalo debe ser mayor a 0'
             }), 400
         
-        # Limitar el número de puntos para evitar respuestas muy grandes
+        # Paginación / continuación: solo se calculan las filas pedidas
+        parametros = [Tm, C, K, intervalo]
+        paginacion = leer_paginacion(data, 'enfriamiento', parametros)
+        if paginacion is not None:
+            return responder_pagina(
+                'enfriamiento', parametros, K, intervalo, tiempo_total, paginacion,
+                [('tiempo', 2), ('temperatura', 2)],
+                lambda t, e: (t, Tm + C * e),
+                {'Tm': Tm, 'C': C, 'K': K})
+        
+        # Limitar el número de puntos para evitar respuestas muy grandes.
+        # Con max_points la curva se reduce en el servidor, así que se
+        # permite calcular a mayor resolución.
+        max_points = leer_max_points(data)
+        limite = MAX_PUNTOS_CALCULO if max_points else MAX_PUNTOS_RESPUESTA
         num_puntos = int(tiempo_total / intervalo) + 1
-        if num_puntos > 1000:
+        if num_puntos > limite:
             return jsonify({
                 'exito': False,
-                'error': f'Demasiados puntos de datos ({num_puntos}). El máximo es 1000. Aumenta el intervalo o reduce el tiempo total.'
+                'error': f'Demasiados puntos de datos ({num_puntos}). El máximo es {limite}. Aumenta el intervalo o reduce el tiempo total.'
             }), 400
         
-        tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
-        
-        # Convertir a formato JSON-friendly
-        tabla_json = [
-            {
-                'tiempo': round(t, 2),
-                'temperatura': round(temp, 2)
+        def calcular():
+            with medir_fase('compute'):
+                (temperaturas,), completo = obtener_columnas(K, intervalo, num_puntos, [(Tm, C)])
+                tiempos = [i * intervalo for i in range(len(temperaturas))]
+                tabla = list(zip(tiempos, temperaturas))
+                num_calculados = len(tabla)
+                if max_points:
+                    with plazo_de_resultado(completo):
+                        tabla = reducir_tabla(tabla, max_points)
+            registrar_tamano_tabla(num_calculados)
+            
+            # Las filas se formatean en bloque con decimales fijos al serializar
+            tabla_json = TablaFija([('tiempo', 2), ('temperatura', 2)], tabla)
+            
+            datos = {
+                'exito': True,
+                'tabla': tabla_json,
+                'Tm': Tm,
+                'C': C,
+                'K': K,
+                'num_puntos': len(tabla),
+                'num_puntos_calculados': num_calculados
             }
-            for t, temp in tabla
-        ]
+            if not completo:
+                datos.update(datos_tabla_parcial('enfriamiento', parametros, K, intervalo, num_calculados))
+            with plazo_de_resultado(completo):
+                return jsonify(datos).get_data(), 200 if completo else 503
         
-        return jsonify({
-            'exito': True,
-            'tabla': tabla_json,
-            'Tm': Tm,
-            'C': C,
-            'K': K,
-            'num_puntos': len(tabla_json)
-        })
+        clave = ('enfriamiento', Tm, C, K, tiempo_total, intervalo, max_points)
+        cuerpo, estado = tablas_en_curso.ejecutar(clave, calcular, tabla_completa)
+        return app.response_class(cuerpo, status=estado, mimetype='application/json')
+    except PlazoExcedido:
+        # Respuesta 503 del manejador de web.deadlines
+        raise
     except (KeyError, ValueError, TypeError):
         return jsonify({
             'exito': False,
@@ -600,8 +953,9 @@ def api_generar_tabla_radiactiva():
     """
     Endpoint para generar tabla de desintegración.
     
-    Espera: {N0, k, tiempo_total, intervalo}
-    Retorna: {tabla, exito}
+    Espera: {N0, k, tiempo_total, intervalo, max_points (opcional)}
+            Paginación opcional: {offset, limit} o {cursor, limit}
+    Retorna: {tabla, exito} (+ cursor_siguiente al paginar)
     """
     try:
         data = request.get_json()
@@ -634,37 +988,64 @@ def api_generar_tabla_radiactiva():
                 'error': 'El intervalo debe ser mayor a 0'
             }), 400
         
+        # Paginación / continuación: solo se calculan las filas pedidas
+        parametros = [N0, k, intervalo]
+        paginacion = leer_paginacion(data, 'desintegracion', parametros)
+        if paginacion is not None:
+            return responder_pagina(
+                'desintegracion', parametros, -k, intervalo, tiempo_total, paginacion,
+                [('tiempo', 4), ('N', 4), ('porcentaje', 2)],
+                lambda t, e: (t, N0 * e, e * 100),
+                {'N0': N0, 'k': k, 't_media': round(calcular_media_vida(k), 4)})
+        
         # Limitar el número de puntos
+        max_points = leer_max_points(data)
+        limite = MAX_PUNTOS_CALCULO if max_points else MAX_PUNTOS_RESPUESTA
         num_puntos = int(tiempo_total / intervalo) + 1
-        if num_puntos > 1000:
+        if num_puntos > limite:
             return jsonify({
                 'exito': False,
-                'error': f'Demasiados puntos de datos ({num_puntos}). El máximo es 1000. Aumenta el intervalo o reduce el tiempo total.'
+                'error': f'Demasiados puntos de datos ({num_puntos}). El máximo es {limite}. Aumenta el intervalo o reduce el tiempo total.'
             }), 400
         
-        tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
-        
-        # Convertir a formato JSON-friendly
-        tabla_json = [
-            {
-                'tiempo': round(t, 4),
-                'N': round(N, 4),
-                'porcentaje': round(porcentaje, 2)
+        def calcular():
+            with medir_fase('compute'):
+                (cantidades, porcentajes), completo = obtener_columnas(
+                    -k, intervalo, num_puntos, [(0, N0), (0, 100)])
+                tiempos = [i * intervalo for i in range(len(cantidades))]
+                tabla = list(zip(tiempos, cantidades, porcentajes))
+                num_calculados = len(tabla)
+                if max_points:
+                    with plazo_de_resultado(completo):
+                        tabla = reducir_tabla(tabla, max_points)
+            registrar_tamano_tabla(num_calculados)
+            
+            # Las filas se formatean en bloque con decimales fijos al serializar
+            tabla_json = TablaFija([('tiempo', 4), ('N', 4), ('porcentaje', 2)], tabla)
+            
+            # Calcular vida media para información adicional
+            t_media = calcular_media_vida(k)
+            
+            datos = {
+                'exito': True,
+                'tabla': tabla_json,
+                'N0': N0,
+                'k': k,
+                't_media': round(t_media, 4),
+                'num_puntos': len(tabla),
+                'num_puntos_calculados': num_calculados
             }
-            for t, N, porcentaje in tabla
-        ]
+            if not completo:
+                datos.update(datos_tabla_parcial('desintegracion', parametros, -k, intervalo, num_calculados))
+            with plazo_de_resultado(completo):
+                return jsonify(datos).get_data(), 200 if completo else 503
         
-        # Calcular vida media para información adicional
-        t_media = calcular_media_vida(k)
-        
-        return jsonify({
-            'exito': True,
-            'tabla': tabla_json,
-            'N0': N0,
-            'k': k,
-            't_media': round(t_media, 4),
-            'num_puntos': len(tabla_json)
-        })
+        clave = ('desintegracion', N0, k, tiempo_total, intervalo, max_points)
+        cuerpo, estado = tablas_en_curso.ejecutar(clave, calcular, tabla_completa)
+        return app.response_class(cuerpo, status=estado, mimetype='application/json')
+    except PlazoExcedido:
+        # Respuesta 503 del manejador de web.deadlines
+        raise
     except (KeyError, ValueError, TypeError):
         return jsonify({
             'exito': False,
@@ -677,5 +1058,76 @@ def api_generar_tabla_radiactiva():
         }), 500
 
 
+# =====================================================================
+# API ENDPOINTS - FLUJOS EN VIVO (SERVER-SENT EVENTS)
+# =====================================================================
+
+@app.route('/api/stream/newton', methods=['GET'])
+def api_stream_newton():
+    """
+    Flujo SSE con cuadros sucesivos de la curva de enfriamiento.
+    
+    Espera (URL): Tm, C, K, tiempo_total, intervalo, fps, puntos_por_frame
+    Emite: eventos 'frame' {frame, filas: [[tiempo, temperatura]], descartados}
+           y un evento final 'fin'
+    """
+    try:
+        Tm = float(request.args['Tm'])
+        C = float(request.args['C'])
+        K = float(request.args['K'])
+        tiempo_total = float(request.args['tiempo_total'])
+        intervalo = float(request.args['intervalo'])
+        total_puntos, fps, puntos_por_frame = leer_parametros_stream(
+            request.args, tiempo_total, intervalo)
+        
+        def crear_filas(inicio):
+            return generar_filas_enfriamiento(Tm, C, K, intervalo, inicio)
+        
+        verificar_extremos(crear_filas, total_puntos)
+    except (KeyError, ValueError, TypeError, OverflowError) as e:
+        return jsonify({
+            'exito': False,
+            'error': f'Datos inválidos: {e}'
+        }), 400
+    
+    return abrir_flujo(generar_cuadros(crear_filas, total_puntos, fps, puntos_por_frame))
+
+
+@app.route('/api/stream/radiactiva', methods=['GET'])
+def api_stream_radiactiva():
+    """
+    Flujo SSE con cuadros sucesivos de la curva de desintegración.
+    
+    Espera (URL): N0, k, tiempo_total, intervalo, fps, puntos_por_frame
+    Emite: eventos 'frame' {frame, filas: [[tiempo, N, porcentaje]], descartados}
+           y un evento final 'fin'
+    """
+    try:
+        N0 = float(request.args['N0'])
+        k = float(request.args['k'])
+        tiempo_total = float(request.args['tiempo_total'])
+        intervalo = float(request.args['intervalo'])
+        
+        if N0 <= 0:
+            raise ValueError('La cantidad inicial N0 debe ser mayor a 0')
+        if k <= 0:
+            raise ValueError('La constante k debe ser mayor a 0')
+        
+        total_puntos, fps, puntos_por_frame = leer_parametros_stream(
+            request.args, tiempo_total, intervalo)
+        
+        def crear_filas(inicio):
+            return generar_filas_desintegracion(N0, k, intervalo, inicio)
+        
+        verificar_extremos(crear_filas, total_puntos)
+    except (KeyError, ValueError, TypeError, OverflowError) as e:
+        return jsonify({
+            'exito': False,
+            'error': f'Datos inválidos: {e}'
+        }), 400
+    
+    return abrir_flujo(generar_cuadros(crear_filas, total_puntos, fps, puntos_por_frame))
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
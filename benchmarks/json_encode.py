@@ -0,0 +1,98 @@
+"""
+=====================================================================
+    JSON ENCODE - Benchmark de serialización de tablas
+=====================================================================
+Compara el costo de serializar una tabla de enfriamiento de 1k, 100k
+y 1M filas:
+
+    stdlib + round  - comprensión con round() por valor y json.dumps
+                      (el camino anterior de los endpoints)
+    stdlib + fija   - ProveedorJSONRapido con el módulo json y TablaFija
+    orjson + round  - round() por valor serializado con orjson
+    orjson + fija   - ProveedorJSONRapido con orjson y TablaFija
+
+Uso:
+    python -m benchmarks.json_encode [--filas 1000 100000 1000000]
+=====================================================================
+"""
+
+import argparse
+import json
+import time
+
+from flask import Flask
+
+from curvas.basis_cache import CacheBases, combinar_afin
+from web.json_provider import ProveedorJSONRapido, TablaFija, orjson
+
+FILAS_POR_DEFECTO = (1000, 100000, 1000000)
+
+
+def crear_tabla(num_filas):
+    """Tabla (tiempo, temperatura) con la curva de ejemplo Tm=20, C=70, K=-0.05."""
+    intervalo = 0.01
+    base = CacheBases().obtener(-0.05, intervalo, num_filas)
+    tiempos = [i * intervalo for i in range(num_filas)]
+    return list(zip(tiempos, combinar_afin(20.0, 70.0, base)))
+
+
+def codificar_round(tabla):
+    """Camino anterior: round() por valor y json estándar."""
+    filas = [{'tiempo': round(t, 2), 'temperatura': round(temp, 2)} for t, temp in tabla]
+    return json.dumps({'exito': True, 'tabla': filas}, separators=(',', ':')).encode('utf-8')
+
+
+def codificar_round_orjson(tabla):
+    """round() por valor serializado con orjson."""
+    filas = [{'tiempo': round(t, 2), 'temperatura': round(temp, 2)} for t, temp in tabla]
+    return orjson.dumps({'exito': True, 'tabla': filas})
+
+
+def crear_codificador_fija(codificador):
+    """Retorna una función que serializa con ProveedorJSONRapido y TablaFija."""
+    ProveedorJSONRapido.codificador = codificador
+    proveedor = ProveedorJSONRapido(Flask(__name__))
+
+    def codificar(tabla):
+        campos = [('tiempo', 2), ('temperatura', 2)]
+        return proveedor.codificar({'exito': True, 'tabla': TablaFija(campos, tabla)})
+
+    return codificar
+
+
+def medir(funcion, tabla, repeticiones):
+    """Retorna (mejor tiempo en segundos, bytes producidos)."""
+    mejor, tamano = float('inf'), 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        datos = funcion(tabla)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        tamano = len(datos)
+    return mejor, tamano
+
+
+def main():
+    """Ejecuta el benchmark e imprime una tabla de resultados."""
+    parser = argparse.ArgumentParser(description='Benchmark de serialización JSON de tablas')
+    parser.add_argument('--filas', type=int, nargs='+', default=FILAS_POR_DEFECTO)
+    args = parser.parse_args()
+
+    variantes = [('stdlib + round', codificar_round),
+                 ('stdlib + fija', crear_codificador_fija('stdlib'))]
+    if orjson is not None:
+        variantes.append(('orjson + round', codificar_round_orjson))
+        variantes.append(('orjson + fija', crear_codificador_fija('orjson')))
+
+    print(f"{'Filas':>10} {'Variante':<16} {'Tiempo (ms)':>12} {'Filas/s':>14} {'MB/s':>8}")
+    print("-" * 64)
+    for num_filas in args.filas:
+        tabla = crear_tabla(num_filas)
+        repeticiones = 5 if num_filas <= 100000 else 2
+        for nombre, funcion in variantes:
+            segundos, tamano = medir(funcion, tabla, repeticiones)
+            print(f"{num_filas:>10} {nombre:<16} {segundos * 1000:>12.2f} "
+                  f"{num_filas / segundos:>14,.0f} {tamano / segundos / 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
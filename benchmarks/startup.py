@@ -0,0 +1,130 @@
+"""
+=====================================================================
+    STARTUP - Presupuesto de arranque del lanzador
+=====================================================================
+Mide el arranque en frío de un cálculo simple por lotes:
+
+    python main.py newton evaluate --in - --out -   (una fila)
+
+Cada repetición es un intérprete nuevo con -X importtime. Se reporta
+la mediana del tiempo total y del tiempo de importación de los módulos
+de primer nivel, y se comprueba que no se cargaron módulos prohibidos
+(Flask, las interfaces de consola, el historial con sqlite3,
+multiprocessing).
+
+Termina con código 1 si la mediana de importación supera el
+presupuesto (EC_ARRANQUE_MAX_MS o --max-ms), así sirve como control
+en integración continua. Las importaciones toman unos 30-40 ms en una
+máquina de un núcleo; el presupuesto por defecto deja margen para
+máquinas más lentas y el control vigila sobre todo los módulos
+prohibidos, que son los que hacen crecer el arranque.
+
+Uso:
+    python -m benchmarks.startup [--repeticiones 10] [--max-ms 80]
+=====================================================================
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRESUPUESTO_MS = float(os.environ.get('EC_ARRANQUE_MAX_MS', '80'))
+ENTRADA = "Tm,C,K,t\n20,70,-0.05,10\n"
+COMANDO = ['main.py', 'newton', 'evaluate', '--in', '-', '--out', '-']
+PROHIBIDOS = (
+    'flask',
+    'app',
+    'newton_cooling.ui',
+    'desintegracion_radiactiva.ui',
+    'modelos_exponenciales.ui',
+    'consola.historial',
+    'sqlite3',
+    'multiprocessing'
+)
+
+
+def leer_importaciones(texto):
+    """
+    Lee la salida de -X importtime.
+
+    Parámetros:
+        texto (str): Salida de error del intérprete
+
+    Retorna:
+        tuple: (milisegundos de importación de primer nivel, módulos cargados)
+    """
+    total_us = 0
+    modulos = set()
+    for linea in texto.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, nombre = linea[len('import time:'):].split('|')
+        modulos.add(nombre.strip())
+        # Los módulos de primer nivel no tienen sangría extra
+        if not nombre.startswith('  ') and nombre.strip() not in ('site', 'encodings'):
+            total_us += int(acumulado)
+    return total_us / 1000, modulos
+
+
+def medir_arranque():
+    """
+    Ejecuta el comando una vez en un intérprete nuevo.
+
+    Retorna:
+        tuple: (ms totales, ms de importación, módulos cargados)
+
+    Lanza:
+        RuntimeError: Si el comando falla
+    """
+    inicio = time.perf_counter()
+    proceso = subprocess.run([sys.executable, '-X', 'importtime'] + COMANDO,
+                             input=ENTRADA, capture_output=True, text=True, cwd=RAIZ)
+    total_ms = (time.perf_counter() - inicio) * 1000
+    if proceso.returncode != 0:
+        raise RuntimeError(f'El comando falló ({proceso.returncode}): {proceso.stderr[-500:]}')
+    importacion_ms, modulos = leer_importaciones(proceso.stderr)
+    return total_ms, importacion_ms, modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[3].strip())
+    parser.add_argument('--repeticiones', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=PRESUPUESTO_MS,
+                        help='Presupuesto de importación en milisegundos')
+    args = parser.parse_args()
+
+    totales, importaciones, cargados = [], [], set()
+    for _ in range(args.repeticiones):
+        total_ms, importacion_ms, modulos = medir_arranque()
+        totales.append(total_ms)
+        importaciones.append(importacion_ms)
+        cargados |= modulos
+
+    mediana_total = statistics.median(totales)
+    mediana_importacion = statistics.median(importaciones)
+    print(f"Comando: python {' '.join(COMANDO)}")
+    print(f"Arranque total (mediana):   {mediana_total:8.1f} ms")
+    print(f"Importaciones (mediana):    {mediana_importacion:8.1f} ms "
+          f"(presupuesto {args.max_ms:.1f} ms)")
+
+    fallos = []
+    prohibidos = sorted(m for m in cargados
+                        if any(m == p or m.startswith(p + '.') for p in PROHIBIDOS))
+    if prohibidos:
+        fallos.append(f"se importaron módulos prohibidos: {', '.join(prohibidos)}")
+    if mediana_importacion > args.max_ms:
+        fallos.append(f"las importaciones superan el presupuesto "
+                      f"({mediana_importacion:.1f} > {args.max_ms:.1f} ms)")
+    for fallo in fallos:
+        print(f"❌ {fallo}")
+    if not fallos:
+        print("✅ Dentro del presupuesto")
+    return 1 if fallos else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,550 @@
+"""
+=====================================================================
+    SUITE - Benchmarks del núcleo con línea base y control de regresión
+=====================================================================
+Mide las funciones de cálculo y los endpoints de Flask con 1, 1k y 1M
+puntos (o llamadas, o peticiones):
+
+    lib.*   calcular_temperatura, los despejes inversos de Newton y de
+            desintegración y los dos generar_tabla_*
+    web.*   Cada endpoint de cálculo, las páginas y /metrics, con el
+            cliente de pruebas de Flask (sin red)
+
+Los casos que no admiten un tamaño (por ejemplo, una tabla de 1M de
+puntos en /api/generar-tabla) se omiten y se indica el límite. Las
+tablas cambian K en cada petición para medir el cálculo y no la caché
+de bases. Los flujos SSE y los trabajos asíncronos no se miden: su
+duración la fijan los fps y el pool de procesos.
+
+Cada muestra ejecuta la operación las veces necesarias para durar al
+menos DURACION_MUESTRA; se toman muestras durante --tiempo segundos
+(mínimo MIN_MUESTRAS, que fija las muestras de los tamaños grandes) y
+se reportan la mediana y el mínimo. La comparación usa el mínimo: el
+ruido de la máquina solo alarga las muestras, así que el mínimo varía
+mucho menos que la mediana entre ejecuciones.
+
+Modos:
+    python -m benchmarks.suite                  Medir e imprimir
+    python -m benchmarks.suite --guardar        Escribir la línea base
+    python -m benchmarks.suite --comparar       Comparar con la línea base
+
+La línea base (benchmarks/baseline.json) es un JSON con número de
+versión del formato y datos del entorno. --comparar termina con código
+1 si el mínimo de algún caso supera el de la línea base por encima de
+la tolerancia (EC_BENCH_TOLERANCIA o --tolerancia, 0.25 por defecto),
+y con código 2 si la línea base no existe o es de otra versión. Las
+líneas base dependen de la máquina, por eso no se versionan: se
+generan con --guardar en la misma máquina que hace la comparación
+(por ejemplo, con el commit base antes de medir un cambio).
+=====================================================================
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from itertools import repeat
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARCHIVO_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+VERSION_FORMATO = 1
+TAMANOS_POR_DEFECTO = (1, 1000, 1000000)
+TOLERANCIA = float(os.environ.get('EC_BENCH_TOLERANCIA', '0.25'))
+TIEMPO_POR_CASO = 0.5
+DURACION_MUESTRA = 0.002
+MIN_MUESTRAS = 10
+MAX_PETICIONES = 1000
+INTERVALO = 0.5
+
+
+class Caso:
+    """
+    Caso de benchmark.
+
+    Parámetros:
+        nombre (str): Identificador ('lib.newton.calcular_temperatura')
+        preparar (callable): preparar(n) -> operación sin argumentos que
+                             procesa n unidades
+        unidad (str): Qué cuenta el tamaño ('llamadas', 'puntos', 'peticiones')
+        maximo (int): Tamaño máximo admitido (None = sin límite)
+    """
+
+    def __init__(self, nombre, preparar, unidad='puntos', maximo=None):
+        self.nombre = nombre
+        self.preparar = preparar
+        self.unidad = unidad
+        self.maximo = maximo
+
+
+def _malla(n):
+    """Tiempo total que produce exactamente n puntos con INTERVALO."""
+    return (n - 0.5) * INTERVALO
+
+
+def _contador():
+    """Números 1, 2, 3... para variar los parámetros en cada llamada."""
+    estado = {'n': 0}
+
+    def siguiente():
+        estado['n'] += 1
+        return estado['n']
+
+    return siguiente
+
+
+# ---------------------------------------------------------------------
+# Funciones de cálculo
+# ---------------------------------------------------------------------
+def _llamadas(funcion, *argumentos):
+    """
+    Caso que llama a funcion n veces.
+
+    Cada argumento es un número fijo o una función i -> valor.
+    """
+
+    def preparar(n):
+        columnas = [[argumento(i) for i in range(n)] if callable(argumento) else argumento
+                    for argumento in argumentos]
+
+        def operacion():
+            iterables = [c if isinstance(c, list) else repeat(c, n) for c in columnas]
+            deque(map(funcion, *iterables), maxlen=0)
+
+        return operacion
+
+    return preparar
+
+
+def casos_calculo():
+    """Casos de las funciones de cálculo de Newton y de desintegración."""
+    from desintegracion_radiactiva.core.calculations import (
+        calcular_constante_k,
+        calcular_k_desde_datos,
+        calcular_N0,
+        calcular_tiempo_t,
+        generar_tabla_desintegracion
+    )
+    from newton_cooling.core.calculations import (
+        calcular_constante_K,
+        calcular_temperatura,
+        calcular_tiempo_para_temperatura,
+        generar_tabla_enfriamiento
+    )
+
+    def tabla(funcion, *parametros):
+        def preparar(n):
+            return lambda: funcion(*parametros, _malla(n), INTERVALO)
+        return preparar
+
+    return [
+        Caso('lib.newton.calcular_temperatura', _llamadas(
+            calcular_temperatura, 20.0, 70.0, -0.05, lambda i: i * 0.01),
+            'llamadas'),
+        Caso('lib.newton.calcular_tiempo_para_temperatura', _llamadas(
+            calcular_tiempo_para_temperatura, 20.0, 70.0, -0.05, lambda i: 21.0 + 68.0 / (1 + i)),
+            'llamadas'),
+        Caso('lib.newton.calcular_constante_K', _llamadas(
+            calcular_constante_K, 90.0, 20.0, lambda i: 21.0 + 68.0 / (1 + i), 5.0),
+            'llamadas'),
+        Caso('lib.radiactiva.calcular_tiempo_t', _llamadas(
+            calcular_tiempo_t, 1000.0, lambda i: 1.0 + 998.0 / (1 + i), 0.01),
+            'llamadas'),
+        Caso('lib.radiactiva.calcular_k_desde_datos', _llamadas(
+            calcular_k_desde_datos, 1000.0, lambda i: 1.0 + 998.0 / (1 + i), 60.0),
+            'llamadas'),
+        Caso('lib.radiactiva.calcular_constante_k', _llamadas(
+            calcular_constante_k, lambda i: 1.0 + i),
+            'llamadas'),
+        Caso('lib.radiactiva.calcular_N0', _llamadas(
+            calcular_N0, 500.0, 0.01, lambda i: i * 0.01),
+            'llamadas'),
+        Caso('lib.newton.generar_tabla_enfriamiento',
+             tabla(generar_tabla_enfriamiento, 20.0, 70.0, -0.05)),
+        Caso('lib.radiactiva.generar_tabla_desintegracion',
+             tabla(generar_tabla_desintegracion, 1000.0, 0.01)),
+    ]
+
+
+# ---------------------------------------------------------------------
+# Endpoints de Flask
+# ---------------------------------------------------------------------
+def _crear_cliente():
+    """Importa la aplicación sin límite de tasa ni perfilador."""
+    os.environ.setdefault('EC_LIMITE_CAPACIDAD', '1e12')
+    os.environ.setdefault('EC_LIMITE_RECARGA', '1e12')
+    os.environ.setdefault('EC_PERFIL_FRACCION', '0')
+    from app import app
+    return app.test_client()
+
+
+def _peticion(cliente, metodo, url, cuerpo=None):
+    """Realiza una petición y comprueba que responda 200."""
+    respuesta = cliente.open(url, method=metodo, json=cuerpo)
+    datos = respuesta.get_data()
+    if respuesta.status_code != 200:
+        raise RuntimeError(f'{metodo} {url} respondió {respuesta.status_code}: {datos[:300]!r}')
+    return datos
+
+
+def _peticiones(cliente, metodo, url, cuerpo=None):
+    """Caso de n peticiones iguales."""
+
+    def preparar(n):
+        _peticion(cliente, metodo, url, cuerpo)
+
+        def operacion():
+            for _ in range(n):
+                _peticion(cliente, metodo, url, cuerpo)
+
+        return operacion
+
+    return preparar
+
+
+def _tabla(cliente, metodo, url, cuerpo):
+    """Caso de una petición de n puntos; cuerpo(n, i) arma los datos."""
+
+    def preparar(n):
+        siguiente = _contador()
+        _peticion(cliente, metodo, url, cuerpo(n, 0))
+        return lambda: _peticion(cliente, metodo, url, cuerpo(n, siguiente()))
+
+    return preparar
+
+
+def casos_web():
+    """Casos de los endpoints de la aplicación web."""
+    cliente = _crear_cliente()
+    from app import MAX_PUNTOS_CALCULO, MAX_PUNTOS_RESPUESTA
+    from web.api_v2 import MAX_PUNTOS_EVALUAR, MAX_PUNTOS_EXPORTAR
+
+    def variar(k, i):
+        return k * (1 + i * 1e-9)
+
+    def reducir(n):
+        return {'max_points': MAX_PUNTOS_RESPUESTA} if n > MAX_PUNTOS_RESPUESTA else {}
+
+    def tabla_newton(n, i):
+        return {'Tm': 20, 'C': 70, 'K': variar(-0.05, i), 'tiempo_total': _malla(n),
+                'intervalo': INTERVALO, **reducir(n)}
+
+    def tabla_radiactiva(n, i):
+        return {'N0': 1000, 'k': variar(0.01, i), 'tiempo_total': _malla(n),
+                'intervalo': INTERVALO, **reducir(n)}
+
+    def tabla_v2(n, i):
+        return {'Tm': 20, 'C': 70, 'K': variar(-0.05, i), 'total': _malla(n),
+                'intervalo': INTERVALO, **reducir(n)}
+
+    def evaluar_v2(n, i):
+        return {'Tm': 20, 'C': 70, 'K': variar(-0.05, i), 't': [j * INTERVALO for j in range(n)]}
+
+    casos = [
+        Caso('web.POST /api/calcular-temperatura', _peticiones(
+            cliente, 'POST', '/api/calcular-temperatura', {'Tm': 20, 'C': 70, 'K': -0.05, 't': 3}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/calcular-tiempo', _peticiones(
+            cliente, 'POST', '/api/calcular-tiempo', {'Tm': 20, 'C': 70, 'K': -0.05, 'T_objetivo': 50}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/calcular-k', _peticiones(
+            cliente, 'POST', '/api/calcular-k', {'T0': 90, 'Tm': 20, 'T_en_t': 60, 't': 5}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/calcular-c', _peticiones(
+            cliente, 'POST', '/api/calcular-c', {'T_inicial': 90, 'Tm': 20}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/generar-tabla', _tabla(
+            cliente, 'POST', '/api/generar-tabla', tabla_newton),
+            'puntos', MAX_PUNTOS_CALCULO),
+        Caso('web.POST /api/radiactiva/calcular-n', _peticiones(
+            cliente, 'POST', '/api/radiactiva/calcular-n', {'N0': 1000, 'k': 0.01, 't': 3}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/radiactiva/calcular-tiempo', _peticiones(
+            cliente, 'POST', '/api/radiactiva/calcular-tiempo', {'N0': 1000, 'N_objetivo': 500, 'k': 0.01}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/radiactiva/calcular-k', _peticiones(
+            cliente, 'POST', '/api/radiactiva/calcular-k', {'N0': 1000, 'N_en_t': 500, 't': 60}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/radiactiva/calcular-n0', _peticiones(
+            cliente, 'POST', '/api/radiactiva/calcular-n0', {'N': 500, 'k': 0.01, 't': 60}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/radiactiva/generar-tabla', _tabla(
+            cliente, 'POST', '/api/radiactiva/generar-tabla', tabla_radiactiva),
+            'puntos', MAX_PUNTOS_CALCULO),
+        Caso('web.GET /api/v2/models', _peticiones(cliente, 'GET', '/api/v2/models'),
+             'peticiones', MAX_PETICIONES),
+        Caso('web.GET /api/v2/models/<nombre>', _peticiones(cliente, 'GET', '/api/v2/models/newton'),
+             'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/v2/models/<nombre>/evaluate', _tabla(
+            cliente, 'POST', '/api/v2/models/newton/evaluate', evaluar_v2),
+            'puntos', MAX_PUNTOS_EVALUAR),
+        Caso('web.POST /api/v2/models/<nombre>/solve', _peticiones(
+            cliente, 'POST', '/api/v2/models/newton/solve', {'Tm': 20, 'C': 70, 'K': -0.05, 'T': 50}),
+            'peticiones', MAX_PETICIONES),
+        Caso('web.POST /api/v2/models/<nombre>/table', _tabla(
+            cliente, 'POST', '/api/v2/models/newton/table', tabla_v2),
+            'puntos', MAX_PUNTOS_CALCULO),
+    ]
+    for formato in ('csv', 'jsonl', 'npy'):
+        casos.append(Caso(f'web.POST /api/v2/models/<nombre>/export?format={formato}', _tabla(
+            cliente, 'POST', f'/api/v2/models/newton/export?format={formato}', tabla_v2),
+            'puntos', MAX_PUNTOS_EXPORTAR))
+    for url in ('/', '/newton', '/radiactiva', '/metrics'):
+        casos.append(Caso(f'web.GET {url}', _peticiones(cliente, 'GET', url),
+                          'peticiones', MAX_PETICIONES))
+    return casos
+
+
+# ---------------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------------
+def _cronometrar(operacion, veces):
+    inicio = time.perf_counter()
+    for _ in range(veces):
+        operacion()
+    return time.perf_counter() - inicio
+
+
+def medir(operacion, tiempo=TIEMPO_POR_CASO):
+    """
+    Mide una operación con muestras de al menos DURACION_MUESTRA.
+
+    Parámetros:
+        operacion (callable): Operación sin argumentos
+        tiempo (float): Segundos de muestreo (se toman al menos MIN_MUESTRAS)
+
+    Retorna:
+        list: Segundos por ejecución de cada muestra
+    """
+    gc.collect()
+    habilitado = gc.isenabled()
+    gc.disable()
+    try:
+        veces, duracion = 1, _cronometrar(operacion, 1)
+        while duracion < DURACION_MUESTRA:
+            veces = max(veces * 2, int(veces * DURACION_MUESTRA / max(duracion, 1e-9)))
+            duracion = _cronometrar(operacion, veces)
+        muestras = [duracion / veces]
+        limite = time.perf_counter() + tiempo
+        while len(muestras) < MIN_MUESTRAS or time.perf_counter() < limite:
+            muestras.append(_cronometrar(operacion, veces) / veces)
+    finally:
+        if habilitado:
+            gc.enable()
+    return muestras
+
+
+def resultado(caso, tamano, muestras):
+    """
+    Resume las muestras de un caso.
+
+    Retorna:
+        dict: Tamaño, unidad, muestras, mediana y mínimo en ms y unidades por segundo
+    """
+    mediana = statistics.median(muestras)
+    return {
+        'caso': caso.nombre,
+        'tamano': tamano,
+        'unidad': caso.unidad,
+        'muestras': len(muestras),
+        'mediana_ms': mediana * 1000,
+        'minimo_ms': min(muestras) * 1000,
+        'por_segundo': tamano / mediana
+    }
+
+
+def ejecutar(casos, tamanos, tiempo=TIEMPO_POR_CASO, salida=sys.stdout):
+    """
+    Ejecuta los casos con cada tamaño e imprime una línea por medición.
+
+    Retorna:
+        dict: 'caso/tamaño' -> resultado
+    """
+    resultados = {}
+    salida.write(f"{'Caso':<58} {'Tamaño':>9} {'Mediana (ms)':>14} {'Unidades/s':>15}\n")
+    salida.write("-" * 99 + "\n")
+    for caso in casos:
+        for tamano in tamanos:
+            if caso.maximo is not None and tamano > caso.maximo:
+                salida.write(f"{caso.nombre:<58} {tamano:>9}   omitido (máximo {caso.maximo})\n")
+                continue
+            medicion = resultado(caso, tamano, medir(caso.preparar(tamano), tiempo))
+            resultados[f"{caso.nombre}/{tamano}"] = medicion
+            salida.write(f"{caso.nombre:<58} {tamano:>9} {medicion['mediana_ms']:>14.3f} "
+                         f"{medicion['por_segundo']:>15,.0f}\n")
+            salida.flush()
+    return resultados
+
+
+# ---------------------------------------------------------------------
+# Línea base
+# ---------------------------------------------------------------------
+def _commit():
+    try:
+        proceso = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                                 capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return proceso.stdout.strip() or None
+
+
+def entorno():
+    """Datos de la máquina y del intérprete que afectan las mediciones."""
+    try:
+        import orjson  # noqa: F401
+        codificador = 'stdlib' if os.environ.get('EC_JSON') == 'stdlib' else 'orjson'
+    except ImportError:
+        codificador = 'stdlib'
+    return {
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'procesador': platform.machine(),
+        'cpus': os.cpu_count(),
+        'json': codificador,
+        'commit': _commit()
+    }
+
+
+def guardar_base(ruta, resultados):
+    """Escribe la línea base en formato VERSION_FORMATO."""
+    datos = {
+        'version': VERSION_FORMATO,
+        'creada': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'entorno': entorno(),
+        'resultados': resultados
+    }
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, indent=2, sort_keys=True, ensure_ascii=False)
+        archivo.write("\n")
+
+
+def cargar_base(ruta):
+    """
+    Lee una línea base.
+
+    Lanza:
+        ValueError: Si el archivo no es una línea base de VERSION_FORMATO
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        datos = json.load(archivo)
+    if not isinstance(datos, dict) or datos.get('version') != VERSION_FORMATO:
+        raise ValueError(f'{ruta} no es una línea base de la versión {VERSION_FORMATO} '
+                         f'(versión {datos.get("version") if isinstance(datos, dict) else "?"})')
+    return datos
+
+
+def comparar(base, resultados, tolerancia=TOLERANCIA):
+    """
+    Compara mediciones con la línea base.
+
+    Un caso es una regresión si su tiempo mínimo supera el de la línea
+    base en más de la tolerancia.
+
+    Parámetros:
+        base (dict): Resultados de la línea base
+        resultados (dict): Resultados actuales
+        tolerancia (float): Fracción admitida (0.25 = 25 %)
+
+    Retorna:
+        list: Tuplas (clave, razón mínimo actual / base, mensaje) de las regresiones
+    """
+    regresiones = []
+    for clave, actual in resultados.items():
+        anterior = base.get(clave)
+        if anterior is None:
+            continue
+        razon = actual['minimo_ms'] / anterior['minimo_ms']
+        if razon > 1 + tolerancia:
+            regresiones.append((clave, razon,
+                                f"mínimo {anterior['minimo_ms']:.3f} → {actual['minimo_ms']:.3f} ms"))
+    return regresiones
+
+
+def _reportar_comparacion(datos_base, resultados, tolerancia):
+    base = datos_base['resultados']
+    print(f"\nComparación con la línea base del {datos_base.get('creada', '?')} "
+          f"(tolerancia {tolerancia:.0%}):")
+    actual = entorno()
+    for clave in ('python', 'plataforma', 'cpus', 'json'):
+        if datos_base.get('entorno', {}).get(clave) != actual[clave]:
+            print(f"⚠️  {clave} distinto: {datos_base['entorno'].get(clave)} → {actual[clave]}")
+
+    for clave in sorted(resultados):
+        if clave in base:
+            razon = resultados[clave]['minimo_ms'] / base[clave]['minimo_ms']
+            print(f"  {clave:<68} {razon:>6.2f}x")
+        else:
+            print(f"  {clave:<68}  nuevo")
+    sin_medir = sorted(set(base) - set(resultados))
+    if sin_medir:
+        print(f"  ({len(sin_medir)} casos de la línea base no se midieron)")
+
+    regresiones = comparar(base, resultados, tolerancia)
+    for clave, razon, mensaje in regresiones:
+        print(f"❌ {clave}: {mensaje} ({razon:.2f}x)")
+    if not regresiones:
+        print("✅ Sin regresiones")
+    return 1 if regresiones else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[3].strip())
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS_POR_DEFECTO,
+                        help='Puntos, llamadas o peticiones por operación')
+    parser.add_argument('--filtro', default='',
+                        help='Medir solo los casos cuyo nombre contiene este texto')
+    parser.add_argument('--tiempo', type=float, default=TIEMPO_POR_CASO,
+                        help='Segundos de muestreo por caso y tamaño')
+    parser.add_argument('--sin-web', action='store_true', help='No medir los endpoints')
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument('--guardar', nargs='?', const=ARCHIVO_BASE, metavar='ARCHIVO',
+                      help='Guardar los resultados como línea base')
+    modo.add_argument('--comparar', nargs='?', const=ARCHIVO_BASE, metavar='ARCHIVO',
+                      help='Comparar con la línea base (código 1 si hay regresiones)')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help='Fracción de empeoramiento admitida al comparar')
+    args = parser.parse_args()
+
+    datos_base = None
+    if args.comparar:
+        try:
+            datos_base = cargar_base(args.comparar)
+        except FileNotFoundError:
+            print(f"❌ No existe la línea base {args.comparar} (créala con --guardar)")
+            return 2
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+    casos = casos_calculo()
+    if not args.sin_web:
+        try:
+            casos += casos_web()
+        except ImportError as e:
+            print(f"⚠️  Se omiten los endpoints: {e}")
+    casos = [caso for caso in casos if args.filtro in caso.nombre]
+    tamanos = sorted(set(t for t in args.tamanos if t >= 1))
+    if not casos or not tamanos:
+        print("❌ Ningún caso que medir")
+        return 2
+
+    resultados = ejecutar(casos, tamanos, args.tiempo)
+    if args.guardar:
+        guardar_base(args.guardar, resultados)
+        print(f"\n✅ Línea base guardada en {args.guardar} ({len(resultados)} mediciones)")
+    if datos_base is not None:
+        return _reportar_comparacion(datos_base, resultados, args.tolerancia)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Módulo consola - Entrada y salida de los menús de consola.
+
+Solo 'consola.terminal' se carga con el paquete: la usan todos los
+menús y el lanzador. El resto de los submódulos (historial con sqlite3,
+exportar, progreso, replay, tabla) se importan al usar sus nombres por
+primera vez, como en el paquete curvas.
+"""
+
+import importlib
+
+from .terminal import (
+    FinDeGuion,
+    TerminalGuionada,
+    TerminalInteractiva,
+    leer,
+    limpiar,
+    pausar,
+    terminal_actual,
+    usar_terminal
+)
+
+_ORIGENES = {
+    'exportar_tabla': 'exportar',
+    'Historial': 'historial',
+    'elegir_parametros_recientes': 'historial',
+    'historial_actual': 'historial',
+    'calcular_con_progreso': 'progreso',
+    'reproducir_sesion': 'replay',
+    'Columna': 'tabla',
+    'VistaTabla': 'tabla',
+    'mostrar_tabla_paginada': 'tabla'
+}
+
+__all__ = [
+    'FinDeGuion',
+    'TerminalGuionada',
+    'TerminalInteractiva',
+    'leer',
+    'limpiar',
+    'pausar',
+    'terminal_actual',
+    'usar_terminal'
+] + list(_ORIGENES)
+
+
+def __getattr__(nombre):
+    modulo = _ORIGENES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nombre)
+    globals()[nombre] = valor
+    return valor
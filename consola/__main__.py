@@ -0,0 +1,9 @@
+"""
+Reproducción de sesiones de consola: python -m consola <subsistema> <guion>
+"""
+
+import sys
+
+from .replay import main
+
+sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+=====================================================================
+    EXPORTAR - Guardar tablas de la consola en archivos
+=====================================================================
+Pide la ruta del archivo y escribe la tabla con curvas.export. El
+formato sale de la extensión: .csv, .jsonl o .npy.
+=====================================================================
+"""
+
+import os
+
+from curvas.export import FORMATOS_EXPORTACION, exportar_archivo
+
+from .terminal import leer
+
+
+def _tamano(num_bytes):
+    for unidad in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unidad}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def exportar_tabla(campos, filas, nombre_sugerido="tabla.csv"):
+    """
+    Solicita un archivo y guarda la tabla en él.
+
+    Parámetros:
+        campos (list): Nombres de las columnas
+        filas (list): Tuplas de números
+        nombre_sugerido (str): Archivo usado si se presiona ENTER
+    """
+    formatos = ", ".join(f".{f}" for f in FORMATOS_EXPORTACION)
+    ruta = leer(f"\n  Archivo de salida ({formatos}) [{nombre_sugerido}]: ").strip()
+    ruta = os.path.expanduser(ruta or nombre_sugerido)
+    try:
+        escritos = exportar_archivo(ruta, campos, filas)
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        return
+    except OSError as e:
+        print(f"\n❌ No se pudo escribir {ruta}: {e.strerror or e}")
+        return
+    print(f"\n✅ {len(filas)} filas guardadas en {ruta} ({_tamano(escritos)})")
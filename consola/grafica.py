@@ -0,0 +1,232 @@
+"""
+=====================================================================
+    GRAFICA - Gráficas de curvas en la terminal
+=====================================================================
+Dibuja una o varias curvas en un solo cuadro con caracteres Braille
+(2x4 puntos por carácter) o de bloques (2x2 por carácter), ajustado
+al tamaño de la terminal.
+
+Cada serie se reduce primero a la resolución horizontal del dibujo
+con LTTB (curvas.downsampling) en una sola pasada; luego se trazan
+segmentos entre los puntos que quedan. Así el costo del dibujo depende
+del tamaño de la terminal y no del largo de la serie.
+
+Con varias series cada una usa un color ANSI (si la salida es una
+terminal y no está NO_COLOR) y aparece en la leyenda.
+=====================================================================
+"""
+
+import math
+import os
+import shutil
+import sys
+
+from curvas.downsampling import indices_lttb
+
+# Bit de cada punto dentro de una celda Braille: [fila][columna]
+PUNTOS_BRAILLE = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+# Cuadrantes: arriba-izquierda=1, arriba-derecha=2, abajo-izquierda=4, abajo-derecha=8
+BLOQUES = " ▘▝▀▖▌▞▛▗▚▐▜▄▙▟█"
+PUNTOS_BLOQUES = ((1, 2), (4, 8))
+MODOS = {
+    'braille': (2, 4),
+    'bloques': (2, 2)
+}
+COLORES = (31, 34, 32, 35, 33, 36)
+ANCHO_ETIQUETA = 10
+
+
+def usar_colores():
+    """True si la salida es una terminal que acepta colores."""
+    return sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+
+
+def tamano_grafica(ancho=None, alto=None):
+    """
+    Tamaño del área de dibujo en caracteres, según la terminal.
+
+    Retorna:
+        tuple: (columnas, filas)
+    """
+    terminal = shutil.get_terminal_size((80, 24))
+    ancho = ancho or max(20, terminal.columns - ANCHO_ETIQUETA - 3)
+    alto = alto or max(6, min(24, terminal.lines - 10))
+    return ancho, alto
+
+
+def resolucion_horizontal(modo='braille', ancho=None):
+    """Puntos horizontales del dibujo (columnas x puntos por celda)."""
+    return tamano_grafica(ancho)[0] * MODOS[modo][0]
+
+
+def muestrear_exponencial(a, b, c, x_max, num_puntos=None):
+    """
+    Muestrea y(x) = a + b * e^(c*x) en [0, x_max] a la resolución del dibujo.
+
+    Parámetros:
+        a, b, c (float): Coeficientes de la curva
+        x_max (float): Último valor de x
+        num_puntos (int): Puntos a calcular (por defecto resolucion_horizontal())
+
+    Retorna:
+        tuple: (xs, ys)
+    """
+    num_puntos = max(2, num_puntos or resolucion_horizontal())
+    paso = x_max / (num_puntos - 1)
+    xs = [i * paso for i in range(num_puntos)]
+    exp = math.exp
+    return xs, [a + b * exp(c * x) for x in xs]
+
+
+class Lienzo:
+    """
+    Cuadrícula de puntos sobre celdas de caracteres.
+
+    Parámetros:
+        ancho (int): Columnas de caracteres
+        alto (int): Filas de caracteres
+        modo (str): 'braille' o 'bloques'
+    """
+
+    def __init__(self, ancho, alto, modo='braille'):
+        self.ancho = ancho
+        self.alto = alto
+        self.modo = modo
+        self.celda_x, self.celda_y = MODOS[modo]
+        self.puntos_x = ancho * self.celda_x
+        self.puntos_y = alto * self.celda_y
+        self.bits = [0] * (ancho * alto)
+        self.series = [None] * (ancho * alto)
+        self._mascaras = PUNTOS_BRAILLE if modo == 'braille' else PUNTOS_BLOQUES
+
+    def punto(self, px, py, serie=0):
+        """Enciende el punto (px, py); py = 0 es la fila de arriba."""
+        if 0 <= px < self.puntos_x and 0 <= py < self.puntos_y:
+            celda_x, dx = divmod(px, self.celda_x)
+            celda_y, dy = divmod(py, self.celda_y)
+            indice = celda_y * self.ancho + celda_x
+            self.bits[indice] |= self._mascaras[dy][dx]
+            self.series[indice] = serie
+
+    def linea(self, x0, y0, x1, y1, serie=0):
+        """Traza un segmento entre dos puntos del lienzo."""
+        pasos = max(abs(x1 - x0), abs(y1 - y0), 1)
+        dx = (x1 - x0) / pasos
+        dy = (y1 - y0) / pasos
+        for i in range(pasos + 1):
+            self.punto(round(x0 + i * dx), round(y0 + i * dy), serie)
+
+    def filas(self, colores=False):
+        """
+        Convierte el lienzo en líneas de texto.
+
+        Parámetros:
+            colores (bool): Colorear cada celda con el color de su serie
+
+        Retorna:
+            list: Una cadena por fila de caracteres
+        """
+        if self.modo == 'braille':
+            caracteres = [chr(0x2800 + b) if b else " " for b in self.bits]
+        else:
+            caracteres = [BLOQUES[b] for b in self.bits]
+        if colores:
+            caracteres = [
+                f"\033[{COLORES[s % len(COLORES)]}m{ch}\033[0m" if s is not None else ch
+                for ch, s in zip(caracteres, self.series)
+            ]
+        return ["".join(caracteres[fila * self.ancho:(fila + 1) * self.ancho])
+                for fila in range(self.alto)]
+
+
+def _etiqueta(valor):
+    return f"{valor:.4g}"
+
+
+def graficar(series, titulo="", etiqueta_x="x", etiqueta_y="y", modo='braille',
+             ancho=None, alto=None, colores=None):
+    """
+    Dibuja varias series en un solo cuadro.
+
+    Parámetros:
+        series (list): Tuplas (etiqueta, xs, ys)
+        titulo (str): Título de la gráfica
+        etiqueta_x (str): Nombre del eje x
+        etiqueta_y (str): Nombre del eje y
+        modo (str): 'braille' o 'bloques'
+        ancho, alto (int): Tamaño del área de dibujo (por defecto, la terminal)
+        colores (bool): Colorear las series (por defecto, usar_colores())
+
+    Retorna:
+        str: El cuadro listo para escribir
+    """
+    ancho, alto = tamano_grafica(ancho, alto)
+    colores = usar_colores() if colores is None else colores
+    lienzo = Lienzo(ancho, alto, modo)
+
+    reducidas = []
+    for etiqueta, xs, ys in series:
+        if len(xs) > lienzo.puntos_x:
+            indices = indices_lttb(xs, ys, max(3, lienzo.puntos_x))
+            xs = [xs[i] for i in indices]
+            ys = [ys[i] for i in indices]
+        reducidas.append((etiqueta, xs, ys))
+
+    todos_x = [x for _, xs, _ in reducidas for x in xs if math.isfinite(x)]
+    todos_y = [y for _, _, ys in reducidas for y in ys if math.isfinite(y)]
+    if not todos_x or not todos_y:
+        return f"{titulo}\n(sin datos para graficar)"
+    x_min, x_max = min(todos_x), max(todos_x)
+    y_min, y_max = min(todos_y), max(todos_y)
+    if x_max == x_min:
+        x_max = x_min + 1
+    if y_max == y_min:
+        y_min, y_max = y_min - 1, y_max + 1
+
+    escala_x = (lienzo.puntos_x - 1) / (x_max - x_min)
+    escala_y = (lienzo.puntos_y - 1) / (y_max - y_min)
+    for numero, (_, xs, ys) in enumerate(reducidas):
+        anterior = None
+        for x, y in zip(xs, ys):
+            if not (math.isfinite(x) and math.isfinite(y)):
+                anterior = None
+                continue
+            actual = (round((x - x_min) * escala_x), round((y_max - y) * escala_y))
+            if anterior is None:
+                lienzo.punto(*actual, numero)
+            else:
+                lienzo.linea(*anterior, *actual, numero)
+            anterior = actual
+
+    filas = lienzo.filas(colores)
+    etiquetas = {0: _etiqueta(y_max), alto // 2: _etiqueta((y_max + y_min) / 2),
+                 alto - 1: _etiqueta(y_min)}
+    lineas = []
+    if titulo:
+        lineas.append(titulo)
+    lineas.append(f"{etiqueta_y:>{ANCHO_ETIQUETA}}")
+    for i, fila in enumerate(filas):
+        lineas.append(f"{etiquetas.get(i, ''):>{ANCHO_ETIQUETA}} ┤{fila}")
+    lineas.append(" " * ANCHO_ETIQUETA + " └" + "─" * ancho)
+    izquierda, derecha = _etiqueta(x_min), _etiqueta(x_max)
+    centro = _etiqueta((x_min + x_max) / 2)
+    hueco = ancho - len(izquierda) - len(derecha)
+    eje = izquierda + centro.center(hueco) + derecha if hueco > len(centro) + 2 \
+        else izquierda + " " * max(1, hueco) + derecha
+    lineas.append(" " * (ANCHO_ETIQUETA + 2) + eje)
+    lineas.append(f"{etiqueta_x:>{ANCHO_ETIQUETA + 2 + ancho}}")
+
+    if len(reducidas) > 1 or reducidas[0][0]:
+        lineas.append("")
+        for numero, (etiqueta, _, _) in enumerate(reducidas):
+            marca = "━━"
+            if colores:
+                marca = f"\033[{COLORES[numero % len(COLORES)]}m{marca}\033[0m"
+            lineas.append(f"   {marca} {numero + 1}. {etiqueta}")
+    return "\n".join(lineas)
+
+
+def mostrar_grafica(series, **opciones):
+    """Dibuja las series (ver graficar) y las escribe de una vez."""
+    sys.stdout.write(graficar(series, **opciones) + "\n")
+    sys.stdout.flush()
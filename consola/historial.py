@@ -0,0 +1,324 @@
+"""
+=====================================================================
+    HISTORIAL - Historial de cálculos entre sesiones de consola
+=====================================================================
+Guarda en un archivo SQLite (EC_HISTORIAL_ARCHIVO, por defecto
+'historial.sqlite3' en el directorio de datos del usuario) dos cosas:
+
+    • Los últimos conjuntos de parámetros usados en cada aplicación,
+      para ofrecerlos en los menús en lugar de volver a escribirlos.
+    • Las tablas ya calculadas, indexadas por sus parámetros en forma
+      canónica (ordenados, números como float). Pedir la misma tabla
+      otra vez la lee del disco en lugar de recalcularla.
+
+Las tablas se guardan como un bloque array('d') con todas las filas
+seguidas, y se expulsan en orden LRU cuando el total supera
+EC_HISTORIAL_MB. Las tablas parciales (Ctrl-C) no se guardan.
+
+El directorio de datos es %LOCALAPPDATA%\ec_proyect en Windows y
+$XDG_DATA_HOME/ec_proyect (~/.local/share/ec_proyect) en el resto, así
+ejecutar la consola desde el repositorio no deja archivos en él.
+Con EC_HISTORIAL_ARCHIVO vacío el historial queda desactivado, y si
+el archivo no se puede abrir, o falla después (base bloqueada por otra
+consola, disco lleno, solo lectura), el historial sigue solo en memoria.
+Las sesiones guionadas (python -m consola) lo desactivan para que las
+reproducciones sean repetibles.
+=====================================================================
+"""
+
+import json
+import os
+import threading
+import time
+from array import array
+
+from .terminal import leer
+
+NOMBRE_APLICACION = 'ec_proyect'
+NOMBRE_ARCHIVO = 'historial.sqlite3'
+
+
+def directorio_datos():
+    """
+    Directorio de datos del usuario para el historial.
+
+    Retorna:
+        str: Ruta del directorio (puede no existir todavía)
+    """
+    if os.name == 'nt' and os.environ.get('LOCALAPPDATA'):
+        base = os.environ['LOCALAPPDATA']
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base, NOMBRE_APLICACION)
+
+
+ARCHIVO_HISTORIAL = os.environ.get('EC_HISTORIAL_ARCHIVO',
+                                   os.path.join(directorio_datos(), NOMBRE_ARCHIVO))
+PRESUPUESTO_BYTES = int(float(os.environ.get('EC_HISTORIAL_MB', 64)) * 1024 * 1024)
+MAX_RECIENTES = 5
+MAX_PARAMETROS_GUARDADOS = 50
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tablas (
+    clave TEXT PRIMARY KEY,
+    columnas INTEGER NOT NULL,
+    datos BLOB NOT NULL,
+    bytes INTEGER NOT NULL,
+    usado REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parametros (
+    aplicacion TEXT NOT NULL,
+    valores TEXT NOT NULL,
+    usado REAL NOT NULL,
+    PRIMARY KEY (aplicacion, valores)
+);
+"""
+
+
+def parametros_canonicos(parametros):
+    """
+    Forma canónica de un conjunto de parámetros (texto JSON).
+
+    Parámetros:
+        parametros (dict): nombre -> valor (números o texto)
+
+    Retorna:
+        str: JSON con claves ordenadas y números como float
+    """
+    return json.dumps({nombre: float(valor) if isinstance(valor, (int, float)) else str(valor)
+                       for nombre, valor in parametros.items()}, sort_keys=True)
+
+
+class Historial:
+    """
+    Historial de parámetros y caché de tablas en SQLite.
+
+    Parámetros:
+        ruta (str): Archivo de la base de datos ('' desactiva el historial)
+        presupuesto_bytes (int): Tamaño máximo de las tablas guardadas
+    """
+
+    def __init__(self, ruta=ARCHIVO_HISTORIAL, presupuesto_bytes=PRESUPUESTO_BYTES):
+        self.ruta = ruta
+        self.presupuesto_bytes = presupuesto_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self._conexion = None
+        self._lock = threading.Lock()
+
+    @property
+    def activo(self):
+        """True si el historial guarda algo."""
+        return bool(self.ruta)
+
+    def _conectar(self):
+        if self._conexion is None:
+            # sqlite3 se importa al abrir el historial, no con el menú
+            import sqlite3
+            try:
+                directorio = os.path.dirname(self.ruta)
+                if directorio:
+                    os.makedirs(directorio, exist_ok=True)
+                self._conexion = sqlite3.connect(self.ruta, timeout=5, check_same_thread=False)
+                self._conexion.executescript(ESQUEMA)
+            except (OSError, sqlite3.Error):
+                self._pasar_a_memoria()
+        return self._conexion
+
+    def _pasar_a_memoria(self):
+        """Cambia la base por una en memoria (el historial es opcional)."""
+        import sqlite3
+        if self._conexion is not None:
+            try:
+                self._conexion.close()
+            except sqlite3.Error:
+                pass
+        self._conexion = sqlite3.connect(':memory:', check_same_thread=False)
+        self._conexion.executescript(ESQUEMA)
+
+    def _usar(self, operacion):
+        """
+        Ejecuta operacion(conexion) con el lock tomado.
+
+        Si la base falla (bloqueada más de 5 s, disco lleno, solo lectura)
+        se repite en una base en memoria en lugar de cortar el menú.
+        """
+        import sqlite3
+        with self._lock:
+            try:
+                return operacion(self._conectar())
+            except sqlite3.Error:
+                self._pasar_a_memoria()
+                return operacion(self._conexion)
+
+    # -----------------------------------------------------------------
+    # Parámetros recientes
+    # -----------------------------------------------------------------
+    def recordar_parametros(self, aplicacion, parametros):
+        """
+        Registra un conjunto de parámetros como el más reciente.
+
+        Parámetros:
+            aplicacion (str): 'newton', 'radiactiva', 'modelos:<nombre>', ...
+            parametros (dict): nombre -> valor
+        """
+        if not self.activo:
+            return
+        valores = parametros_canonicos(parametros)
+
+        def recordar(conexion):
+            with conexion:
+                conexion.execute(
+                    "INSERT OR REPLACE INTO parametros VALUES (?, ?, ?)",
+                    (aplicacion, valores, time.time()))
+                conexion.execute(
+                    "DELETE FROM parametros WHERE aplicacion = ? AND valores NOT IN "
+                    "(SELECT valores FROM parametros WHERE aplicacion = ? "
+                    "ORDER BY usado DESC LIMIT ?)",
+                    (aplicacion, aplicacion, MAX_PARAMETROS_GUARDADOS))
+
+        self._usar(recordar)
+
+    def parametros_recientes(self, aplicacion, limite=MAX_RECIENTES):
+        """
+        Retorna los últimos conjuntos de parámetros, del más reciente al más antiguo.
+
+        Retorna:
+            list: Diccionarios nombre -> valor
+        """
+        if not self.activo:
+            return []
+        filas = self._usar(lambda conexion: conexion.execute(
+            "SELECT valores FROM parametros WHERE aplicacion = ? "
+            "ORDER BY usado DESC LIMIT ?", (aplicacion, limite)).fetchall())
+        return [json.loads(valores) for (valores,) in filas]
+
+    # -----------------------------------------------------------------
+    # Tablas
+    # -----------------------------------------------------------------
+    def buscar_tabla(self, aplicacion, parametros):
+        """
+        Busca una tabla calculada antes con los mismos parámetros.
+
+        Parámetros:
+            aplicacion (str): Aplicación o modelo de la tabla
+            parametros (dict): Parámetros que definen la tabla
+
+        Retorna:
+            list: Tuplas de la tabla, o None si no está guardada
+        """
+        if not self.activo:
+            return None
+        clave = f"{aplicacion}:{parametros_canonicos(parametros)}"
+
+        def buscar(conexion):
+            fila = conexion.execute(
+                "SELECT columnas, datos FROM tablas WHERE clave = ?", (clave,)).fetchone()
+            if fila is not None:
+                with conexion:
+                    conexion.execute("UPDATE tablas SET usado = ? WHERE clave = ?",
+                                     (time.time(), clave))
+            return fila
+
+        fila = self._usar(buscar)
+        if fila is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        columnas, datos = fila
+        valores = array('d')
+        valores.frombytes(datos)
+        return list(zip(*[iter(valores)] * columnas))
+
+    def guardar_tabla(self, aplicacion, parametros, filas):
+        """
+        Guarda una tabla completa y expulsa las menos usadas si hace falta.
+
+        Parámetros:
+            aplicacion (str): Aplicación o modelo de la tabla
+            parametros (dict): Parámetros que definen la tabla
+            filas (list): Tuplas de números, todas del mismo largo
+        """
+        if not self.activo or not filas:
+            return
+        valores = array('d')
+        for fila in filas:
+            valores.extend(fila)
+        datos = valores.tobytes()
+        if len(datos) > self.presupuesto_bytes:
+            return
+
+        clave = f"{aplicacion}:{parametros_canonicos(parametros)}"
+
+        def guardar(conexion):
+            with conexion:
+                conexion.execute("INSERT OR REPLACE INTO tablas VALUES (?, ?, ?, ?, ?)",
+                                 (clave, len(filas[0]), datos, len(datos), time.time()))
+                usados = conexion.execute("SELECT SUM(bytes) FROM tablas").fetchone()[0]
+                if usados > self.presupuesto_bytes:
+                    antiguas = conexion.execute(
+                        "SELECT clave, bytes FROM tablas WHERE clave != ? ORDER BY usado",
+                        (clave,)).fetchall()
+                    for antigua, tamano in antiguas:
+                        conexion.execute("DELETE FROM tablas WHERE clave = ?", (antigua,))
+                        usados -= tamano
+                        if usados <= self.presupuesto_bytes:
+                            break
+
+        self._usar(guardar)
+
+    def limpiar(self):
+        """Borra todo el historial."""
+        if not self.activo:
+            return
+
+        def borrar(conexion):
+            with conexion:
+                conexion.execute("DELETE FROM tablas")
+                conexion.execute("DELETE FROM parametros")
+
+        self._usar(borrar)
+
+
+_historial = None
+
+
+def historial_actual():
+    """Historial compartido (se crea al primer uso, con la configuración del entorno)."""
+    global _historial
+    if _historial is None:
+        _historial = Historial(os.environ.get('EC_HISTORIAL_ARCHIVO', ARCHIVO_HISTORIAL))
+    return _historial
+
+
+def elegir_parametros_recientes(aplicacion, describir=None):
+    """
+    Ofrece los últimos parámetros usados en la aplicación.
+
+    Parámetros:
+        aplicacion (str): Clave de la aplicación en el historial
+        describir (callable): parametros -> texto de cada opción (opcional)
+
+    Retorna:
+        dict: Parámetros elegidos, o None para ingresar datos nuevos
+    """
+    recientes = historial_actual().parametros_recientes(aplicacion)
+    if not recientes:
+        return None
+
+    describir = describir or (lambda p: ", ".join(f"{n}={v:g}" if isinstance(v, float) else f"{n}={v}"
+                                                  for n, v in p.items()))
+    print("\n🕘 PARÁMETROS RECIENTES:\n")
+    for i, parametros in enumerate(recientes, 1):
+        print(f"  {i}. {describir(parametros)}")
+    texto = leer("\n👉 Número de parámetros a usar (ENTER para ingresar nuevos): ").strip()
+    if not texto:
+        return None
+    try:
+        indice = int(texto)
+    except ValueError:
+        indice = 0
+    if not 1 <= indice <= len(recientes):
+        print("  ❌ Opción inválida, se ingresan datos nuevos")
+        return None
+    return recientes[indice - 1]
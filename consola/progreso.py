@@ -0,0 +1,134 @@
+"""
+=====================================================================
+    PROGRESO - Cálculos largos con barra de progreso
+=====================================================================
+El cálculo se ejecuta en un hilo de trabajo que consume un iterador
+de filas por bloques. El hilo principal solo espera y dibuja la barra
+con el porcentaje y el tiempo restante estimado.
+
+Ctrl-C interrumpe al hilo principal (Python entrega KeyboardInterrupt
+solo a ese hilo): se avisa al hilo de trabajo, que se detiene al
+terminar su bloque, y se retornan las filas calculadas hasta entonces.
+
+La barra aparece solo si el cálculo tarda más de RETARDO_BARRA y la
+salida es una terminal, así las tablas pequeñas y las sesiones
+guionadas no cambian.
+=====================================================================
+"""
+
+import sys
+import threading
+import time
+from itertools import islice
+
+FILAS_POR_BLOQUE = 20000
+RETARDO_BARRA = 0.3
+ANCHO_BARRA = 30
+
+
+def formatear_duracion(segundos):
+    """Duración corta para la barra: '8s', '2m 05s'."""
+    segundos = int(round(segundos))
+    if segundos < 60:
+        return f"{segundos}s"
+    minutos, segundos = divmod(segundos, 60)
+    return f"{minutos}m {segundos:02d}s"
+
+
+def linea_progreso(hechas, total, transcurrido, descripcion=""):
+    """
+    Texto de la barra de progreso.
+
+    Parámetros:
+        hechas (int): Filas calculadas
+        total (int): Filas totales
+        transcurrido (float): Segundos desde el inicio
+        descripcion (str): Texto antes de la barra
+
+    Retorna:
+        str: Línea con barra, porcentaje, filas y ETA
+    """
+    fraccion = hechas / total if total else 1.0
+    llenas = int(fraccion * ANCHO_BARRA)
+    barra = "█" * llenas + "░" * (ANCHO_BARRA - llenas)
+    if hechas:
+        restante = formatear_duracion(transcurrido * (total - hechas) / hechas)
+    else:
+        restante = "--"
+    return f"{descripcion} [{barra}] {fraccion * 100:5.1f}% {hechas}/{total} ETA {restante}"
+
+
+class _Trabajo(threading.Thread):
+    """Hilo que consume el iterador de filas por bloques."""
+
+    def __init__(self, filas, total, bloque):
+        super().__init__(daemon=True)
+        self.filas = filas
+        self.total = total
+        self.bloque = bloque
+        self.resultado = []
+        self.error = None
+        self.cancelar = threading.Event()
+
+    def run(self):
+        try:
+            iterador = iter(self.filas)
+            while len(self.resultado) < self.total and not self.cancelar.is_set():
+                cantidad = min(self.bloque, self.total - len(self.resultado))
+                nuevas = list(islice(iterador, cantidad))
+                if not nuevas:
+                    break
+                self.resultado.extend(nuevas)
+        except Exception as e:  # se relanza en el hilo principal
+            self.error = e
+
+
+def calcular_con_progreso(filas, total, descripcion="Calculando",
+                          bloque=FILAS_POR_BLOQUE, salida=None):
+    """
+    Calcula hasta 'total' filas en segundo plano, con barra y Ctrl-C.
+
+    Parámetros:
+        filas (iterable): Iterador de filas (puede ser infinito)
+        total (int): Filas a calcular
+        descripcion (str): Texto antes de la barra
+        bloque (int): Filas por bloque del hilo de trabajo
+        salida (file): Donde dibujar la barra (por defecto sys.stdout)
+
+    Retorna:
+        tuple: (lista de filas, True si se calcularon todas)
+
+    Lanza:
+        Exception: El error del cálculo, si lo hubo
+    """
+    salida = salida or sys.stdout
+    barra = getattr(salida, 'isatty', lambda: False)()
+    trabajo = _Trabajo(filas, total, bloque)
+    inicio = time.perf_counter()
+    trabajo.start()
+    dibujada = False
+    try:
+        while trabajo.is_alive():
+            trabajo.join(0.1)
+            transcurrido = time.perf_counter() - inicio
+            if barra and trabajo.is_alive() and transcurrido >= RETARDO_BARRA:
+                salida.write("\r" + linea_progreso(len(trabajo.resultado), total,
+                                                   transcurrido, descripcion))
+                salida.flush()
+                dibujada = True
+    except KeyboardInterrupt:
+        trabajo.cancelar.set()
+        trabajo.join()
+        if dibujada:
+            salida.write("\n")
+        print(f"\n⚠️  Cálculo cancelado: se conservan {len(trabajo.resultado)} "
+              f"de {total} filas.")
+        return trabajo.resultado, False
+
+    if dibujada:
+        salida.write("\r" + linea_progreso(len(trabajo.resultado), total,
+                                           time.perf_counter() - inicio, descripcion) + "\n")
+        salida.flush()
+    if trabajo.error is not None:
+        raise trabajo.error
+    return trabajo.resultado, len(trabajo.resultado) >= total
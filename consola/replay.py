@@ -0,0 +1,90 @@
+"""
+=====================================================================
+    REPLAY - Reproducción de sesiones de consola
+=====================================================================
+Ejecuta un menú con un guion de entradas y captura todo lo que
+muestra, sin pausas ni limpiezas de pantalla. Sirve para pruebas de
+regresión (comparar la transcripción con una guardada) y de carga.
+
+Un guion tiene una respuesta por línea, tal como se escribió en la
+sesión (una línea vacía es un ENTER para aceptar un valor). Las pausas
+"Presione ENTER para continuar" no se incluyen. EC_GRABAR_SESION=ruta
+graba un guion mientras se usa la aplicación normalmente.
+
+La línea de comandos desactiva el historial de cálculos (salvo que se
+defina EC_HISTORIAL_ARCHIVO), así las reproducciones no dependen de
+las sesiones anteriores.
+
+Uso:
+    python -m consola newton sesion.txt
+    python -m consola radiactiva sesion.txt --repeticiones 1000
+=====================================================================
+"""
+
+import importlib
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from .terminal import FinDeGuion, TerminalGuionada, usar_terminal
+
+
+def reproducir_sesion(funcion, entradas, eco=True):
+    """
+    Ejecuta una función de menú con un guion de entradas.
+
+    Parámetros:
+        funcion (callable): Menú a ejecutar (ejecutar_aplicacion)
+        entradas (iterable): Respuestas del guion
+        eco (bool): Incluir las respuestas en la transcripción
+
+    Retorna:
+        tuple: (transcripción, True si la sesión terminó antes que el guion)
+    """
+    salida = io.StringIO()
+    completa = True
+    with usar_terminal(TerminalGuionada(entradas, eco)), redirect_stdout(salida):
+        try:
+            funcion()
+        except FinDeGuion:
+            completa = False
+    return salida.getvalue(), completa
+
+
+def leer_guion(ruta):
+    """Lee un guion: una respuesta por línea."""
+    with open(ruta, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def main():
+    import argparse
+
+    from main import SUBSISTEMAS
+
+    parser = argparse.ArgumentParser(prog='python -m consola', description='Reproduce una sesión de consola grabada.')
+    parser.add_argument('subsistema', choices=list(SUBSISTEMAS))
+    parser.add_argument('guion', help='Archivo con una respuesta por línea')
+    parser.add_argument('--repeticiones', type=int, default=1,
+                        help='Reproducir la sesión N veces y medir el ritmo')
+    args = parser.parse_args()
+
+    os.environ.setdefault('EC_HISTORIAL_ARCHIVO', '')
+    funcion = importlib.import_module(SUBSISTEMAS[args.subsistema][0]).ejecutar_aplicacion
+    entradas = leer_guion(args.guion)
+    if args.repeticiones <= 1:
+        transcripcion, completa = reproducir_sesion(funcion, entradas)
+        sys.stdout.write(transcripcion)
+        if not completa:
+            print("⚠️  El guion terminó antes que la sesión", file=sys.stderr)
+        return 0 if completa else 1
+
+    inicio = time.perf_counter()
+    for _ in range(args.repeticiones):
+        reproducir_sesion(funcion, entradas)
+    duracion = time.perf_counter() - inicio
+    print(f"{args.repeticiones} sesiones en {duracion:.2f} s "
+          f"({args.repeticiones / duracion:.0f} sesiones/s)")
+    return 0
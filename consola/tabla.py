@@ -0,0 +1,217 @@
+"""
+=====================================================================
+    TABLA - Tablas grandes en la consola
+=====================================================================
+Las filas se formatean por bloques con una plantilla '%' por fila y
+se escriben con un solo write por página, en lugar de un print() y
+varios f-strings por fila. Las columnas con formato por bloque
+(curvas.formato.formatear_columna) reciben la columna completa de la
+página y su texto se inserta en la misma plantilla.
+
+Si la tabla cabe en una página se muestra completa. Si no, se abre un
+visor al estilo de 'less':
+
+    ENTER / n   página siguiente (al final, salir)
+    p           página anterior
+    g / G       inicio / final
+    <número>    ir a esa fila
+    c <n>       ver una fila de cada n (c 1 vuelve a todas)
+    r           resumen (primeras y últimas filas, mínimos y máximos)
+    q           salir
+
+Solo se formatean las filas de la página visible, así una tabla de un
+millón de filas no genera un millón de líneas de texto. Las filas
+pueden ser cualquier secuencia con len() e índices.
+=====================================================================
+"""
+
+import os
+import shutil
+import sys
+
+from curvas.formato import aplicar_plantilla
+
+from .terminal import leer, pausar
+
+FILAS_RESUMEN = 5
+
+
+def filas_por_pagina():
+    """Filas por página: EC_FILAS_PAGINA o el alto de la terminal."""
+    configurado = os.environ.get('EC_FILAS_PAGINA')
+    if configurado:
+        return max(1, int(configurado))
+    return max(10, shutil.get_terminal_size((80, 24)).lines - 9)
+
+
+class Columna:
+    """
+    Columna de una tabla de consola.
+
+    Parámetros:
+        titulo (str): Encabezado
+        formato (str | callable): Especificación '%' con ancho
+                                  ('%15.2f', '%14.2f%%') o función
+                                  valor -> texto
+        ancho (int): Ancho de la columna (para funciones y encabezado)
+        en_bloque (bool): Si formato es una función que recibe la
+                          columna completa y retorna un texto por valor
+    """
+
+    def __init__(self, titulo, formato, ancho=15, en_bloque=False):
+        self.titulo = titulo
+        self.formato = formato
+        self.ancho = ancho
+        self.en_bloque = en_bloque
+
+
+class VistaTabla:
+    """
+    Formateo por bloques de una tabla.
+
+    Parámetros:
+        columnas (list): Columnas de la tabla
+        filas (sequence): Tuplas con un valor por columna
+        separador (str): Texto entre columnas
+    """
+
+    def __init__(self, columnas, filas, separador=" | "):
+        self.columnas = list(columnas)
+        self.filas = filas
+        self.separador = separador
+        self._en_bloque = [i for i, c in enumerate(self.columnas) if c.en_bloque]
+        if all(isinstance(c.formato, str) or c.en_bloque for c in self.columnas):
+            self._plantilla = separador.join(f"%{c.ancho}s" if c.en_bloque else c.formato
+                                             for c in self.columnas)
+        else:
+            self._plantilla = None
+
+    def encabezado(self):
+        """Retorna la línea de encabezados."""
+        return self.separador.join(f"{c.titulo:>{c.ancho}}" for c in self.columnas)
+
+    def formatear(self, filas):
+        """
+        Formatea un bloque de filas.
+
+        Parámetros:
+            filas (iterable): Tuplas a formatear
+
+        Retorna:
+            str: Líneas separadas por saltos de línea
+        """
+        filas = filas if isinstance(filas, (list, tuple)) else list(filas)
+        if self._en_bloque and filas:
+            columnas = list(zip(*filas))
+            for i in self._en_bloque:
+                columnas[i] = self.columnas[i].formato(columnas[i])
+            filas = list(zip(*columnas))
+        if self._plantilla is not None:
+            return aplicar_plantilla(self._plantilla, filas)
+        partes = [(str if c.en_bloque else c.formato if callable(c.formato) else c.formato.__mod__, c.ancho)
+                  for c in self.columnas]
+        separador = self.separador
+        return "\n".join([
+            separador.join(f"{formato(valor):>{ancho}}" for (formato, ancho), valor in zip(partes, fila))
+            for fila in filas
+        ])
+
+    def pagina(self, inicio, cantidad, paso=1):
+        """
+        Formatea las filas inicio, inicio+paso, ... (cantidad filas).
+
+        Retorna:
+            str: Líneas de la página
+        """
+        fin = min(len(self.filas), inicio + cantidad * paso)
+        return self.formatear(self.filas[inicio:fin:paso])
+
+    def resumen(self, num_filas=FILAS_RESUMEN):
+        """
+        Primeras y últimas filas, con mínimo y máximo de cada columna.
+
+        Retorna:
+            str: Texto del resumen
+        """
+        total = len(self.filas)
+        if total <= 2 * num_filas:
+            lineas = [self.formatear(self.filas)]
+        else:
+            omitidas = total - 2 * num_filas
+            lineas = [self.formatear(self.filas[:num_filas]),
+                      f"{'⋮':>{self.columnas[0].ancho}}   ({omitidas} filas omitidas)",
+                      self.formatear(self.filas[-num_filas:])]
+        if total:
+            columnas = list(zip(*self.filas))
+            lineas.append(self.separador.join("-" * c.ancho for c in self.columnas))
+            lineas.append(self.formatear([tuple(min(c) for c in columnas)]) + "   ← mínimo")
+            lineas.append(self.formatear([tuple(max(c) for c in columnas)]) + "   ← máximo")
+            lineas.append(f"Filas: {total}")
+        return "\n".join(lineas)
+
+
+def _escribir(*bloques):
+    sys.stdout.write("\n".join(bloques) + "\n")
+    sys.stdout.flush()
+
+
+def mostrar_tabla_paginada(titulo, columnas, filas, separador_titulo="=",
+                           separador_encabezado="-", ancho=70, por_pagina=None):
+    """
+    Muestra una tabla completa o con el visor paginado.
+
+    Parámetros:
+        titulo (str): Línea de título (con su emoji)
+        columnas (list): Columnas de la tabla
+        filas (sequence): Tuplas con un valor por columna
+        separador_titulo (str): Carácter de las líneas de título
+        separador_encabezado (str): Carácter bajo los encabezados
+        ancho (int): Ancho de las líneas separadoras
+        por_pagina (int): Filas por página (por defecto filas_por_pagina())
+    """
+    vista = VistaTabla(columnas, filas)
+    linea = separador_titulo * ancho
+    cabecera = ["\n" + linea, titulo, linea, vista.encabezado(), separador_encabezado * ancho]
+    por_pagina = por_pagina or filas_por_pagina()
+    total = len(filas)
+
+    if total <= por_pagina:
+        cuerpo = [vista.formatear(filas)] if total else []
+        _escribir(*cabecera, *cuerpo, linea)
+        return
+
+    inicio, paso = 0, 1
+    while True:
+        visibles = -(-(total - inicio) // paso)
+        fin = inicio + (min(por_pagina, visibles) - 1) * paso
+        _escribir(*cabecera, vista.pagina(inicio, por_pagina, paso), linea,
+                  f"Filas {inicio + 1}-{fin + 1} de {total}"
+                  + (f" (una de cada {paso})" if paso > 1 else ""))
+        orden = leer("ENTER siguiente · p anterior · g/G inicio/final · número ir a fila · "
+                     "c N una de cada N · r resumen · q salir: ").strip()
+
+        salto = por_pagina * paso
+        if orden in ("", "n"):
+            if inicio + salto >= total:
+                break
+            inicio += salto
+        elif orden == "p":
+            inicio = max(0, inicio - salto)
+        elif orden == "g":
+            inicio = 0
+        elif orden == "G":
+            inicio = max(0, ((total - 1) // paso - por_pagina + 1) * paso)
+        elif orden == "q":
+            break
+        elif orden == "r":
+            _escribir(*cabecera, vista.resumen(), linea)
+            pausar("ENTER para volver a la tabla: ")
+        elif orden.startswith("c"):
+            try:
+                paso = max(1, int(orden[1:]))
+            except ValueError:
+                continue
+            inicio -= inicio % paso
+        elif orden.isdigit():
+            inicio = min(max(int(orden) - 1, 0), total - 1)
+            inicio -= inicio % paso
@@ -0,0 +1,140 @@
+"""
+=====================================================================
+    TERMINAL - Entrada y salida de los menús
+=====================================================================
+Los menús no llaman a input() ni limpian la pantalla directamente:
+usan leer(), pausar() y limpiar(), que delegan en la terminal actual.
+
+    TerminalInteractiva  - teclado real; limpia con secuencias ANSI
+                           (sin lanzar 'clear' en cada pantalla).
+                           Con EC_GRABAR_SESION guarda cada respuesta
+                           en ese archivo para reproducirla después
+    TerminalGuionada     - respuestas tomadas de una lista; limpiar y
+                           las pausas "Presione ENTER" no hacen nada
+
+La terminal actual se guarda en una variable de contexto y se cambia
+con usar_terminal().
+=====================================================================
+"""
+
+import contextvars
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+
+LIMPIAR_ANSI = "\033[2J\033[H"
+
+
+class FinDeGuion(EOFError):
+    """El guion de entradas se terminó antes que la sesión."""
+
+
+class TerminalInteractiva:
+    """
+    Terminal conectada al teclado.
+
+    Parámetros:
+        grabar (str): Archivo donde anotar las respuestas (opcional)
+    """
+
+    def __init__(self, grabar=None):
+        self.grabar = grabar
+
+    def leer(self, mensaje):
+        """Muestra el mensaje y retorna la línea escrita por el usuario."""
+        respuesta = input(mensaje)
+        if self.grabar:
+            with open(self.grabar, 'a', encoding='utf-8') as f:
+                f.write(respuesta + "\n")
+        return respuesta
+
+    def pausar(self, mensaje):
+        """Espera a que el usuario presione ENTER."""
+        input(mensaje)
+
+    def limpiar(self):
+        """Limpia la pantalla."""
+        if os.name == 'nt':
+            os.system('cls')
+        elif sys.stdout.isatty():
+            sys.stdout.write(LIMPIAR_ANSI)
+            sys.stdout.flush()
+
+
+class TerminalGuionada:
+    """
+    Terminal que responde con un guion de entradas grabado.
+
+    Parámetros:
+        entradas (iterable): Respuestas en orden, una por pregunta
+        eco (bool): Escribir cada respuesta después del mensaje, como
+                    se vería en una sesión real
+    """
+
+    def __init__(self, entradas, eco=True):
+        self.entradas = deque(entradas)
+        self.eco = eco
+        self.leidas = 0
+
+    def leer(self, mensaje):
+        """
+        Retorna la siguiente respuesta del guion.
+
+        Lanza:
+            FinDeGuion: Si ya no quedan respuestas
+        """
+        print(mensaje, end='')
+        if not self.entradas:
+            print()
+            raise FinDeGuion(f'El guion terminó después de {self.leidas} respuestas')
+        respuesta = self.entradas.popleft()
+        self.leidas += 1
+        if self.eco:
+            print(respuesta)
+        return respuesta
+
+    def pausar(self, mensaje):
+        """Las pausas no consumen entradas."""
+
+    def limpiar(self):
+        """No hay pantalla que limpiar."""
+
+
+_terminal = contextvars.ContextVar(
+    'terminal', default=TerminalInteractiva(os.environ.get('EC_GRABAR_SESION')))
+
+
+def terminal_actual():
+    """Retorna la terminal del contexto actual."""
+    return _terminal.get()
+
+
+@contextmanager
+def usar_terminal(terminal):
+    """
+    Usa una terminal dentro de un bloque with.
+
+    Parámetros:
+        terminal: TerminalInteractiva, TerminalGuionada o compatible
+    """
+    token = _terminal.set(terminal)
+    try:
+        yield terminal
+    finally:
+        _terminal.reset(token)
+
+
+def leer(mensaje=''):
+    """Lee una respuesta del usuario (reemplaza a input())."""
+    return _terminal.get().leer(mensaje)
+
+
+def pausar(mensaje="\nPresione ENTER para continuar..."):
+    """Pausa hasta que el usuario presione ENTER."""
+    _terminal.get().pausar(mensaje)
+
+
+def limpiar():
+    """Limpia la pantalla de la consola."""
+    _terminal.get().limpiar()
@@ -0,0 +1,39 @@
+"""
+Módulo curvas - Herramientas compartidas para curvas exponenciales.
+
+Los submódulos se importan al usar sus nombres por primera vez, así
+'curvas.batch' o 'curvas.registry' no cargan el resto del paquete.
+"""
+
+import importlib
+
+_ORIGENES = {
+    'CacheBases': 'basis_cache',
+    'combinar_afin': 'basis_cache',
+    'PlazoExcedido': 'deadline',
+    'con_plazo': 'deadline',
+    'plazo_de_resultado': 'deadline',
+    'verificar_plazo': 'deadline',
+    'indices_lttb': 'downsampling',
+    'reducir_tabla': 'downsampling',
+    'exportar_archivo': 'export',
+    'generar_exportacion': 'export',
+    'aplicar_plantilla': 'formato',
+    'formatear_columna': 'formato',
+    'generar_exponenciales': 'incremental',
+    'generar_filas_enfriamiento': 'incremental',
+    'generar_filas_desintegracion': 'incremental',
+    'codificar_cursor': 'incremental',
+    'decodificar_cursor': 'incremental'
+}
+
+__all__ = list(_ORIGENES)
+
+
+def __getattr__(nombre):
+    modulo = _ORIGENES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nombre)
+    globals()[nombre] = valor
+    return valor
@@ -0,0 +1,139 @@
+"""
+=====================================================================
+    BASIS CACHE - Caché de bases exponenciales
+=====================================================================
+Para un coeficiente c y una malla fija (t0, intervalo, n), las curvas
+    Newton:          T = Tm + C * e^(K*t)
+    Desintegración:  N = N0 * e^(-k*t)
+son afines en sus parámetros lineales (Tm, C, N0). El vector e^(c*t)
+(la "base") solo depende de (c, t0, intervalo, n), así que se guarda y
+al cambiar Tm, C o N0 basta una multiplicación y suma por elemento.
+
+Las bases se guardan como array('d') y se expulsan en orden LRU
+cuando superan el presupuesto de memoria. El cálculo de una base
+respeta el plazo del contexto (curvas.deadline) y, si vence, lanza
+PlazoExcedido con la parte ya calculada (que no se guarda). Lo mismo
+hace combinar_afin con los valores ya combinados.
+=====================================================================
+"""
+
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import islice
+
+from .deadline import PlazoExcedido, verificar_plazo
+from .incremental import REANCLAJE, generar_exponenciales
+
+PRESUPUESTO_BYTES = int(float(os.environ.get('EC_CACHE_BASES_MB', 64)) * 1024 * 1024)
+
+
+class CacheBases:
+    """
+    Caché LRU de vectores e^(c*t) limitada por memoria.
+
+    Parámetros:
+        presupuesto_bytes (int): Memoria máxima ocupada por las bases
+        observador (callable): observador(acierto) en cada consulta (opcional)
+    """
+
+    def __init__(self, presupuesto_bytes=PRESUPUESTO_BYTES, observador=None):
+        self.presupuesto_bytes = presupuesto_bytes
+        self.observador = observador
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._bases = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, c, intervalo, n, t0=0.0):
+        """
+        Retorna la base e^(c*(t0 + i*intervalo)) para i = 0..n-1.
+
+        Parámetros:
+            c (float): Coeficiente del exponente
+            intervalo (float): Separación entre puntos de la malla
+            n (int): Número de puntos
+            t0 (float): Tiempo del primer punto
+
+        Retorna:
+            array: Vector de n valores (no se debe modificar)
+        """
+        clave = (c, t0, intervalo, n)
+        with self._lock:
+            base = self._bases.get(clave)
+            if base is not None:
+                self._bases.move_to_end(clave)
+                self.aciertos += 1
+        if base is not None:
+            self._notificar(True)
+            return base
+
+        base = self._calcular(c, intervalo, n, t0)
+        tamano = base.itemsize * len(base)
+        with self._lock:
+            self.fallos += 1
+            if tamano <= self.presupuesto_bytes and clave not in self._bases:
+                self._bases[clave] = base
+                self.bytes_usados += tamano
+                while self.bytes_usados > self.presupuesto_bytes:
+                    _, expulsada = self._bases.popitem(last=False)
+                    self.bytes_usados -= expulsada.itemsize * len(expulsada)
+        self._notificar(False)
+        return base
+
+    def limpiar(self):
+        """Vacía la caché."""
+        with self._lock:
+            self._bases.clear()
+            self.bytes_usados = 0
+
+    def _calcular(self, c, intervalo, n, t0):
+        """Calcula una base con el motor incremental, por bloques."""
+        valores = (e for _, _, e in generar_exponenciales(c, intervalo))
+        if t0 != 0.0:
+            # Desplazar la malla: e^(c*(t0 + t)) = e^(c*t0) * e^(c*t)
+            factor = next(generar_exponenciales(c, t0, 1))[2]
+            valores = (factor * e for e in valores)
+
+        base = array('d')
+        while len(base) < n:
+            try:
+                verificar_plazo()
+            except PlazoExcedido as e:
+                e.parcial = base
+                raise
+            base.extend(islice(valores, min(REANCLAJE, n - len(base))))
+        return base
+
+    def _notificar(self, acierto):
+        if self.observador is not None:
+            self.observador(acierto)
+
+
+def combinar_afin(a, b, base):
+    """
+    Calcula a + b * base elemento a elemento, por bloques de REANCLAJE.
+
+    Parámetros:
+        a (float): Término independiente (Tm en Newton, 0 en desintegración)
+        b (float): Coeficiente (C en Newton, N0 en desintegración)
+        base (array): Vector e^(c*t)
+
+    Retorna:
+        list: Valores de la curva
+
+    Lanza:
+        PlazoExcedido: Si vence el plazo (parcial: valores ya combinados)
+    """
+    valores = []
+    for inicio in range(0, len(base), REANCLAJE):
+        try:
+            verificar_plazo()
+        except PlazoExcedido as e:
+            e.parcial = valores
+            raise
+        bloque = base[inicio:inicio + REANCLAJE]
+        valores.extend([b * e for e in bloque] if a == 0 else [a + b * e for e in bloque])
+    return valores
@@ -0,0 +1,432 @@
+"""
+=====================================================================
+    BATCH - Procesamiento por lotes de los modelos
+=====================================================================
+Procesa archivos de parámetros sin el menú interactivo:
+
+    python main.py newton table --in params.csv --out results.csv
+    python main.py radiactiva evaluate --in datos.jsonl --out - --jobs 4
+
+Acciones (iguales a las de /api/v2/models):
+
+    evaluate  - cada fila trae los parámetros y x; agrega y(x)
+    solve     - cada fila trae los datos del despeje; agrega el resultado
+    table     - cada fila trae los parámetros, total e intervalo; escribe
+                una fila por punto con la columna 'fila' de origen
+
+La entrada se lee en bloques de TAMANO_BLOQUE líneas (una fila por
+línea) y los resultados se escriben en cuanto cada bloque termina, en
+el mismo orden de entrada. Con --jobs N los bloques se reparten entre N
+procesos, que también leen y serializan el texto; hay como máximo 2*N
+bloques en vuelo para no cargar el archivo entero en memoria.
+
+Una fila inválida no detiene el lote: se escribe con la columna 'error'.
+Esto incluye las líneas JSONL mal formadas o que no son un objeto.
+En CSV las columnas de salida se fijan con el primer bloque; una fila
+posterior con columnas que no están en el encabezado se escribe con
+las columnas conocidas y un 'error' que nombra las que faltan.
+=====================================================================
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+from .registry import registro_modelos
+
+TAMANO_BLOQUE = 10000
+MAX_PUNTOS_TABLA = 200000
+FORMATOS = ('csv', 'jsonl')
+
+_bases = None
+
+
+class FilaInvalida(dict):
+    """
+    Fila de entrada que no se pudo leer (se procesa como fila con error).
+
+    Parámetros:
+        mensaje (str): Motivo del error
+    """
+
+    def __init__(self, mensaje):
+        super().__init__()
+        self.mensaje = mensaje
+
+    def __reduce__(self):
+        return (FilaInvalida, (self.mensaje,))
+
+
+def _evaluar(modelo, fila, _numero):
+    valores = modelo.validar(fila)
+    simbolo = modelo.variable.simbolo
+    try:
+        x = float(fila[simbolo])
+    except KeyError:
+        raise ValueError(f'Falta el parámetro {simbolo}')
+    except (TypeError, ValueError):
+        raise ValueError(f'El parámetro {simbolo} debe ser un número')
+    return [{**fila, modelo.salida.simbolo: modelo.evaluar(valores, x)}]
+
+
+def _resolver(modelo, fila, _numero):
+    _, resultado = modelo.despejar(fila)
+    return [{**fila, **resultado}]
+
+
+def _tabla(modelo, fila, numero):
+    global _bases
+    valores = modelo.validar(fila)
+    try:
+        total = float(fila['total'])
+        intervalo = float(fila['intervalo'])
+    except KeyError as e:
+        raise ValueError(f'Falta el parámetro {e.args[0]}')
+    except (TypeError, ValueError):
+        raise ValueError('total e intervalo deben ser números')
+    if not total > 0 or not intervalo > 0:
+        raise ValueError('total e intervalo deben ser mayores a 0')
+    num_puntos = int(total / intervalo) + 1
+    if num_puntos > MAX_PUNTOS_TABLA:
+        raise ValueError(f'Demasiados puntos de datos ({num_puntos}). '
+                         f'El máximo es {MAX_PUNTOS_TABLA}.')
+
+    if _bases is None:
+        from .basis_cache import CacheBases
+        _bases = CacheBases()
+    _, _, c = modelo.coeficientes(*valores)
+    base = _bases.obtener(c, intervalo, num_puntos)
+    claves = ['fila'] + [clave for clave, _ in modelo.campos_tabla()]
+    return [dict(zip(claves, (numero,) + punto))
+            for punto in modelo.filas_tabla(valores, base, 0, intervalo)]
+
+
+ACCIONES = {
+    'evaluate': _evaluar,
+    'solve': _resolver,
+    'table': _tabla
+}
+
+
+def procesar_bloque(nombre_modelo, accion, inicio, filas):
+    """
+    Procesa un bloque de filas de entrada.
+
+    Parámetros:
+        nombre_modelo (str): Modelo del registro
+        accion (str): Clave de ACCIONES
+        inicio (int): Número de la primera fila del bloque (desde 1)
+        filas (list): Diccionarios leídos de la entrada
+
+    Retorna:
+        tuple: (filas de salida, número de filas con error)
+    """
+    modelo = registro_modelos.obtener(nombre_modelo)
+    funcion = ACCIONES[accion]
+    salida = []
+    errores = 0
+    for numero, fila in enumerate(filas, inicio):
+        try:
+            if isinstance(fila, FilaInvalida):
+                raise ValueError(fila.mensaje)
+            salida.extend(funcion(modelo, fila, numero))
+        except (ValueError, OverflowError, ZeroDivisionError) as e:
+            errores += 1
+            mensaje = str(e) if not isinstance(e, OverflowError) else \
+                'El resultado es demasiado grande para estos parámetros'
+            error = {'fila': numero} if accion == 'table' else {}
+            salida.append({**error, **fila, 'error': mensaje})
+    return salida, errores
+
+
+# =====================================================================
+# LECTURA Y ESCRITURA
+# =====================================================================
+
+def detectar_formato(ruta, formato=None):
+    """Retorna el formato indicado o el que corresponde a la extensión."""
+    if formato:
+        return formato
+    return 'jsonl' if ruta.endswith(('.jsonl', '.json', '.ndjson')) else 'csv'
+
+
+def leer_filas(lineas, formato, encabezado=None):
+    """
+    Convierte líneas de texto en filas de entrada.
+
+    Parámetros:
+        lineas (list): Líneas del archivo (una fila por línea)
+        formato (str): 'csv' o 'jsonl'
+        encabezado (list): Columnas del CSV
+
+    Retorna:
+        list: Diccionarios con los datos de cada fila (FilaInvalida si
+              una línea JSONL no es un objeto JSON válido)
+    """
+    if formato == 'csv':
+        return [{clave: valor for clave, valor in zip(encabezado, valores) if valor}
+                for valores in csv.reader(lineas) if valores]
+    filas = []
+    for linea in lineas:
+        if not linea.strip():
+            continue
+        try:
+            fila = json.loads(linea)
+        except ValueError as e:
+            fila = FilaInvalida(f'JSON inválido: {e}')
+        else:
+            if not isinstance(fila, dict):
+                fila = FilaInvalida('Cada línea debe ser un objeto JSON')
+        filas.append(fila)
+    return filas
+
+
+def restringir_columnas(filas, campos):
+    """
+    Marca con error las filas que tienen columnas fuera del CSV de salida.
+
+    Parámetros:
+        filas (list): Diccionarios de salida
+        campos (list): Columnas del CSV de salida
+
+    Retorna:
+        tuple: (filas, número de filas marcadas)
+    """
+    conocidas = set(campos)
+    marcadas = 0
+    for i, fila in enumerate(filas):
+        extra = [clave for clave in fila if clave not in conocidas]
+        if not extra:
+            continue
+        filas[i] = {clave: valor for clave, valor in fila.items() if clave in conocidas}
+        if fila.get('error'):
+            # Ya es una fila con error (y ya se contó): solo pierde el eco de la entrada
+            filas[i]['error'] = fila['error']
+        else:
+            marcadas += 1
+            filas[i]['error'] = ('Columnas fuera del encabezado CSV (fijado con el primer '
+                                 f'bloque): {", ".join(map(str, extra))}')
+    return filas, marcadas
+
+
+def campos_de_salida(filas):
+    """Columnas de salida en CSV: las del bloque, con 'error' al final."""
+    campos = {}
+    for fila in filas:
+        campos.update(dict.fromkeys(fila))
+    campos.pop('error', None)
+    return list(campos) + ['error']
+
+
+def escribir_filas(filas, formato, campos=None):
+    """
+    Serializa filas de salida.
+
+    Parámetros:
+        filas (list): Diccionarios de salida
+        formato (str): 'csv' o 'jsonl'
+        campos (list): Columnas del CSV
+
+    Retorna:
+        str: Texto listo para escribir
+    """
+    if formato == 'jsonl':
+        dumps = json.dumps
+        return ''.join([dumps(fila, ensure_ascii=False) + '\n' for fila in filas])
+    texto = io.StringIO()
+    csv.writer(texto, lineterminator='\n').writerows(
+        [[fila.get(campo, '') for campo in campos] for fila in filas])
+    return texto.getvalue()
+
+
+def procesar_lineas(nombre_modelo, accion, formatos, encabezado, campos, inicio, lineas):
+    """
+    Lee, procesa y serializa un bloque de líneas (se ejecuta en los procesos).
+
+    Parámetros:
+        nombre_modelo (str): Modelo del registro
+        accion (str): Clave de ACCIONES
+        formatos (tuple): (formato de entrada, formato de salida)
+        encabezado (list): Columnas del CSV de entrada
+        campos (list): Columnas del CSV de salida (None = según el bloque)
+        inicio (int): Número de la primera fila del bloque
+        lineas (list): Líneas de texto del bloque
+
+    Retorna:
+        tuple: (texto de salida, filas leídas, filas con error, columnas usadas)
+    """
+    formato_entrada, formato_salida = formatos
+    filas = leer_filas(lineas, formato_entrada, encabezado)
+    salida, errores = procesar_bloque(nombre_modelo, accion, inicio, filas)
+    if formato_salida == 'csv':
+        if campos is None:
+            campos = campos_de_salida(salida)
+        else:
+            salida, marcadas = restringir_columnas(salida, campos)
+            errores += marcadas
+    return escribir_filas(salida, formato_salida, campos), len(filas), errores, campos
+
+
+def ejecutar_lote(nombre_modelo, accion, entrada, salida, formato_entrada='csv',
+                  formato_salida='csv', procesos=1, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Procesa un archivo de entrada completo.
+
+    El proceso principal solo mueve texto: lee bloques de líneas y
+    escribe los resultados ya serializados. El primer bloque se procesa
+    aquí para fijar las columnas del CSV de salida.
+
+    Parámetros:
+        nombre_modelo (str): Modelo del registro
+        accion (str): Clave de ACCIONES
+        entrada (file): Archivo de entrada abierto
+        salida (file): Archivo de salida abierto
+        formato_entrada (str): 'csv' o 'jsonl'
+        formato_salida (str): 'csv' o 'jsonl'
+        procesos (int): Procesos de trabajo (1 = en este proceso)
+        tamano_bloque (int): Filas por bloque
+
+    Retorna:
+        tuple: (filas leídas, filas con error)
+
+    Lanza:
+        KeyError: Si el modelo no existe
+        ValueError: Si la acción no existe
+    """
+    registro_modelos.obtener(nombre_modelo)
+    if accion not in ACCIONES:
+        raise ValueError(f'Acción desconocida: {accion}. Opciones: {", ".join(ACCIONES)}')
+
+    encabezado = None
+    if formato_entrada == 'csv':
+        encabezado = next(csv.reader([entrada.readline()]), None)
+        if not encabezado:
+            return 0, 0
+    formatos = (formato_entrada, formato_salida)
+    bloques = iter(lambda: list(islice(entrada, tamano_bloque)), [])
+
+    primero = next(bloques, None)
+    if primero is None:
+        return 0, 0
+    texto, leidas, errores, campos = procesar_lineas(
+        nombre_modelo, accion, formatos, encabezado, None, 1, primero)
+    if formato_salida == 'csv':
+        csv.writer(salida, lineterminator='\n').writerow(campos)
+    salida.write(texto)
+
+    def escribir(resultado):
+        nonlocal errores
+        texto, _, fallidas, _ = resultado
+        errores += fallidas
+        salida.write(texto)
+
+    if procesos <= 1:
+        for bloque in bloques:
+            resultado = procesar_lineas(nombre_modelo, accion, formatos, encabezado,
+                                        campos, leidas + 1, bloque)
+            leidas += resultado[1]
+            escribir(resultado)
+        return leidas, errores
+
+    # multiprocessing solo se importa con --jobs: es lo más pesado del arranque
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Los números de fila se asignan al enviar: cuenta las líneas no vacías
+    with ProcessPoolExecutor(max_workers=procesos,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        en_vuelo = deque()
+        for bloque in bloques:
+            en_vuelo.append(pool.submit(procesar_lineas, nombre_modelo, accion, formatos,
+                                        encabezado, campos, leidas + 1, bloque))
+            leidas += sum(1 for linea in bloque if linea.strip())
+            if len(en_vuelo) >= 2 * procesos:
+                escribir(en_vuelo.popleft().result())
+        while en_vuelo:
+            escribir(en_vuelo.popleft().result())
+    return leidas, errores
+
+
+# =====================================================================
+# LÍNEA DE COMANDOS
+# =====================================================================
+
+def crear_parser(programa=None):
+    """Crea el parser de argumentos del modo por lotes."""
+    parser = argparse.ArgumentParser(
+        prog=programa,
+        description='Procesa un archivo de parámetros con un modelo exponencial.')
+    parser.add_argument('modelo', help='Modelo del registro (newton, radiactiva...)')
+    parser.add_argument('accion', choices=list(ACCIONES), help='Acción a ejecutar')
+    parser.add_argument('--in', dest='entrada', default='-',
+                        help="Archivo de entrada ('-' = entrada estándar)")
+    parser.add_argument('--out', dest='salida', default='-',
+                        help="Archivo de salida ('-' = salida estándar)")
+    parser.add_argument('--in-format', dest='formato_entrada', choices=FORMATOS,
+                        help='Formato de entrada (por defecto según la extensión)')
+    parser.add_argument('--out-format', dest='formato_salida', choices=FORMATOS,
+                        help='Formato de salida (por defecto según la extensión)')
+    parser.add_argument('--jobs', type=int, default=1, help='Procesos de trabajo')
+    parser.add_argument('--chunk', type=int, default=TAMANO_BLOQUE, help='Filas por bloque')
+    return parser
+
+
+def _abrir(ruta, modo):
+    if ruta == '-':
+        return sys.stdin if modo == 'r' else sys.stdout
+    return open(ruta, modo, newline='', encoding='utf-8')
+
+
+def ejecutar_cli(argv, programa=None):
+    """
+    Punto de entrada del modo por lotes.
+
+    Parámetros:
+        argv (list): Argumentos de la línea de comandos
+        programa (str): Nombre del programa para la ayuda (opcional)
+
+    Retorna:
+        int: Código de salida (0 = sin errores, 1 = filas con error, 2 = error de uso)
+    """
+    parser = crear_parser(programa)
+    args = parser.parse_args(argv)
+    if args.jobs < 1 or args.chunk < 1:
+        parser.error('--jobs y --chunk deben ser mayores a 0')
+    try:
+        registro_modelos.obtener(args.modelo)
+    except KeyError:
+        nombres = ', '.join(m.nombre for m in registro_modelos.modelos())
+        parser.error(f'Modelo desconocido: {args.modelo}. Opciones: {nombres}')
+
+    formato_entrada = detectar_formato(args.entrada, args.formato_entrada)
+    formato_salida = detectar_formato(args.salida, args.formato_salida)
+    inicio = time.perf_counter()
+    try:
+        entrada = _abrir(args.entrada, 'r')
+    except OSError as e:
+        parser.error(f'No se puede abrir {args.entrada}: {e.strerror}')
+    try:
+        salida = _abrir(args.salida, 'w')
+        try:
+            leidas, errores = ejecutar_lote(args.modelo, args.accion, entrada, salida,
+                                            formato_entrada, formato_salida,
+                                            args.jobs, args.chunk)
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+    duracion = time.perf_counter() - inicio
+    print(f"✅ {leidas} filas procesadas en {duracion:.2f} s ({errores} con error)",
+          file=sys.stderr)
+    return 1 if errores else 0
@@ -0,0 +1,118 @@
+"""
+=====================================================================
+    DEADLINE - Plazos de cálculo y cancelación cooperativa
+=====================================================================
+Un plazo es un instante (reloj monótono) a partir del cual los cálculos
+largos deben abandonar. Se guarda en una variable de contexto, así que
+cada petición o hilo tiene el suyo y el código de cálculo no necesita
+recibirlo como parámetro.
+
+Los bucles largos llaman a verificar_plazo() cada cierto número de
+pasos (no en cada uno). Si el plazo venció se lanza PlazoExcedido, que
+puede llevar el resultado parcial calculado hasta ese momento.
+
+Sin plazo fijado verificar_plazo() no hace nada (uso desde consola).
+
+Un resultado que ya quedó parcial se termina de armar (combinar,
+reducir, serializar) con plazo_de_resultado(False), sin plazo: si no,
+cada paso posterior abandonaría de inmediato y se perderían las filas
+calculadas. Ese trabajo es proporcional a lo calculado dentro del plazo.
+=====================================================================
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager, nullcontext
+
+_plazo = contextvars.ContextVar('plazo_calculo', default=None)
+
+
+class PlazoExcedido(Exception):
+    """
+    El cálculo superó su plazo.
+
+    Parámetros:
+        mensaje (str): Descripción del error
+        parcial: Resultado parcial calculado antes del plazo (opcional)
+    """
+
+    def __init__(self, mensaje='Se agotó el tiempo de cálculo', parcial=None):
+        super().__init__(mensaje)
+        self.parcial = parcial
+
+
+def fijar_plazo(segundos):
+    """
+    Fija el plazo del contexto actual.
+
+    Parámetros:
+        segundos (float): Tiempo disponible desde ahora (None = sin plazo)
+
+    Retorna:
+        Token: Token para restaurar el plazo anterior con restaurar_plazo
+    """
+    limite = None if segundos is None else time.monotonic() + segundos
+    return _plazo.set(limite)
+
+
+def restaurar_plazo(token):
+    """
+    Restaura el plazo anterior a fijar_plazo.
+
+    Parámetros:
+        token (Token): Token retornado por fijar_plazo
+    """
+    _plazo.reset(token)
+
+
+@contextmanager
+def con_plazo(segundos):
+    """
+    Ejecuta un bloque con un plazo de cálculo.
+
+    Parámetros:
+        segundos (float): Tiempo disponible para el bloque
+    """
+    token = fijar_plazo(segundos)
+    try:
+        yield
+    finally:
+        restaurar_plazo(token)
+
+
+def plazo_de_resultado(completo):
+    """
+    Plazo con el que se termina de armar un resultado.
+
+    Parámetros:
+        completo (bool): False si el resultado ya fue cortado por el plazo
+
+    Retorna:
+        context manager: El plazo actual, o ninguno si el resultado es parcial
+    """
+    return nullcontext() if completo else con_plazo(None)
+
+
+def tiempo_restante():
+    """
+    Retorna los segundos que quedan del plazo actual.
+
+    Retorna:
+        float: Segundos restantes (negativo si venció) o None sin plazo
+    """
+    limite = _plazo.get()
+    if limite is None:
+        return None
+    return limite - time.monotonic()
+
+
+def verificar_plazo():
+    """
+    Lanza PlazoExcedido si el plazo actual ya venció.
+
+    Lanza:
+        PlazoExcedido: Si se superó el plazo
+    """
+    limite = _plazo.get()
+    if limite is not None and time.monotonic() > limite:
+        raise PlazoExcedido()
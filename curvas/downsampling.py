@@ -0,0 +1,97 @@
+"""
+=====================================================================
+    DOWNSAMPLING - Reducción de puntos de una curva
+=====================================================================
+Implementa Largest-Triangle-Three-Buckets (LTTB): reduce una serie a
+un número máximo de puntos conservando la forma visual de la curva.
+El recorrido verifica el plazo de cálculo (curvas.deadline) cada
+GRUPOS_POR_VERIFICACION grupos.
+=====================================================================
+"""
+
+from .deadline import verificar_plazo
+
+GRUPOS_POR_VERIFICACION = 64
+
+
+def indices_lttb(xs, ys, max_puntos):
+    """
+    Selecciona los índices de los puntos que conservan la forma de la curva.
+
+    El primer y el último punto siempre se conservan. El resto de la serie
+    se divide en (max_puntos - 2) grupos y de cada grupo se elige el punto
+    que forma el triángulo de mayor área con el punto elegido antes y con
+    el promedio del grupo siguiente. Se recorre la serie una sola vez.
+
+    Parámetros:
+        xs (list): Valores del eje x (ordenados)
+        ys (list): Valores del eje y
+        max_puntos (int): Número máximo de puntos a conservar (>= 3)
+
+    Retorna:
+        list: Índices seleccionados, en orden creciente
+
+    Lanza:
+        PlazoExcedido: Si vence el plazo de cálculo
+    """
+    n = len(xs)
+    if max_puntos >= n:
+        return list(range(n))
+    if max_puntos < 3:
+        raise ValueError("max_puntos debe ser mayor o igual a 3")
+
+    tamano_grupo = (n - 2) / (max_puntos - 2)
+    indices = [0]
+    anterior = 0
+
+    for i in range(max_puntos - 2):
+        if i % GRUPOS_POR_VERIFICACION == 0:
+            verificar_plazo()
+        # Promedio del grupo siguiente (el último grupo es el punto final)
+        inicio_sig = int((i + 1) * tamano_grupo) + 1
+        fin_sig = min(int((i + 2) * tamano_grupo) + 1, n)
+        cantidad = fin_sig - inicio_sig
+        promedio_x = sum(xs[inicio_sig:fin_sig]) / cantidad
+        promedio_y = sum(ys[inicio_sig:fin_sig]) / cantidad
+
+        # Punto del grupo actual con el triángulo de mayor área
+        inicio = int(i * tamano_grupo) + 1
+        fin = int((i + 1) * tamano_grupo) + 1
+        ax = xs[anterior]
+        ay = ys[anterior]
+        dx = ax - promedio_x
+        dy = promedio_y - ay
+
+        mejor = inicio
+        mayor_area = -1.0
+        for j in range(inicio, fin):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > mayor_area:
+                mayor_area = area
+                mejor = j
+
+        indices.append(mejor)
+        anterior = mejor
+
+    indices.append(n - 1)
+    return indices
+
+
+def reducir_tabla(tabla, max_puntos, columna_y=1):
+    """
+    Reduce una tabla de filas (tiempo, valor, ...) a max_puntos filas con LTTB.
+
+    Parámetros:
+        tabla (list): Lista de tuplas cuya primera columna es el tiempo
+        max_puntos (int): Número máximo de filas a conservar
+        columna_y (int): Columna usada como eje y para medir la forma
+
+    Retorna:
+        list: Filas seleccionadas de la tabla original
+    """
+    if max_puntos >= len(tabla):
+        return list(tabla)
+
+    xs = [fila[0] for fila in tabla]
+    ys = [fila[columna_y] for fila in tabla]
+    return [tabla[i] for i in indices_lttb(xs, ys, max_puntos)]
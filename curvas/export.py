@@ -0,0 +1,167 @@
+"""
+=====================================================================
+    EXPORT - Exportación de tablas a CSV, JSON Lines y NPY
+=====================================================================
+Convierte un iterador de filas en bloques de bytes listos para
+escribir en un archivo o enviar como descarga, sin armar el archivo
+completo en memoria:
+
+    csv     Encabezado y una fila por línea (precisión completa)
+    jsonl   Un objeto JSON por fila ({"tiempo": 0.0, ...})
+    npy     Arreglo estructurado de NumPy, un campo float64 por
+            columna (np.load(ruta)['tiempo'])
+
+Cada bloque de FILAS_POR_BLOQUE filas se formatea con una sola
+plantilla '%' (texto) o un solo array('d') (binario). El formato NPY
+necesita el número de filas en la cabecera, así que hay que indicarlo.
+=====================================================================
+"""
+
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+from itertools import chain, islice
+
+FORMATOS_EXPORTACION = ('csv', 'jsonl', 'npy')
+TIPOS_MIME = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'npy': 'application/octet-stream'
+}
+FILAS_POR_BLOQUE = 8192
+TAMANO_BUFFER = 1024 * 1024
+
+
+def formato_de_ruta(ruta, formato=None):
+    """
+    Determina el formato de exportación por la extensión del archivo.
+
+    Parámetros:
+        ruta (str): Archivo de salida
+        formato (str): Formato explícito (opcional)
+
+    Retorna:
+        str: 'csv', 'jsonl' o 'npy'
+
+    Lanza:
+        ValueError: Si el formato no es uno de FORMATOS_EXPORTACION
+    """
+    if formato is None:
+        extension = os.path.splitext(ruta)[1].lower().lstrip('.')
+        formato = 'jsonl' if extension in ('json', 'ndjson') else extension
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f'Formato de exportación no soportado: {formato or "(sin extensión)"}. '
+                         f'Opciones: {", ".join(FORMATOS_EXPORTACION)}')
+    return formato
+
+
+def cabecera_npy(campos, num_filas):
+    """
+    Cabecera de un archivo .npy (versión 1.0) con un campo float64 por columna.
+
+    Parámetros:
+        campos (list): Nombres de las columnas
+        num_filas (int): Filas del arreglo
+
+    Retorna:
+        bytes: Cabecera alineada a 64 bytes
+    """
+    descr = [(str(campo), '<f8') for campo in campos]
+    texto = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (descr, num_filas)
+    relleno = -(10 + len(texto) + 1) % 64
+    texto += " " * relleno + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack('<H', len(texto)) + texto.encode('latin1')
+
+
+def _bloques(filas, tamano):
+    iterador = iter(filas)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+
+def _texto(plantilla, bloque, nulo):
+    valores = tuple(chain.from_iterable(bloque))
+    if nulo is not None and not all(map(math.isfinite, valores)):
+        valores = tuple(v if math.isfinite(v) else nulo for v in valores)
+    return ((plantilla * len(bloque)) % valores).encode('utf-8')
+
+
+def generar_exportacion(campos, filas, formato, num_filas=None, tamano_bloque=FILAS_POR_BLOQUE):
+    """
+    Genera el contenido exportado por bloques.
+
+    Parámetros:
+        campos (list): Nombres de las columnas
+        filas (iterable): Tuplas de números, una por fila
+        formato (str): 'csv', 'jsonl' o 'npy'
+        num_filas (int): Filas que producirá el iterador (obligatorio para npy)
+        tamano_bloque (int): Filas por bloque
+
+    Retorna:
+        generator: Bloques de bytes
+
+    Lanza:
+        ValueError: Si el formato no es válido, o si en npy el iterador no
+                    produce exactamente num_filas filas
+    """
+    formato = formato_de_ruta('', formato)
+    columnas = len(campos)
+
+    if formato == 'npy':
+        if num_filas is None:
+            raise ValueError('El formato npy necesita el número de filas')
+        yield cabecera_npy(campos, num_filas)
+        escritas = 0
+        for bloque in _bloques(filas, tamano_bloque):
+            valores = array('d', chain.from_iterable(bloque))
+            if sys.byteorder == 'big':
+                valores.byteswap()
+            escritas += len(bloque)
+            yield valores.tobytes()
+        if escritas != num_filas:
+            raise ValueError(f'Se exportaron {escritas} de {num_filas} filas')
+        return
+
+    if formato == 'csv':
+        yield (",".join(campos) + "\n").encode('utf-8')
+        plantilla, nulo = ",".join(["%s"] * columnas) + "\n", None
+    else:
+        plantilla = "{" + ", ".join(json.dumps(campo) + ": %s" for campo in campos) + "}\n"
+        nulo = "null"
+    for bloque in _bloques(filas, tamano_bloque):
+        yield _texto(plantilla, bloque, nulo)
+
+
+def exportar_archivo(ruta, campos, filas, formato=None, num_filas=None):
+    """
+    Escribe una tabla en un archivo con escrituras grandes.
+
+    Parámetros:
+        ruta (str): Archivo de salida
+        campos (list): Nombres de las columnas
+        filas (iterable): Tuplas de números
+        formato (str): Formato (por defecto, según la extensión)
+        num_filas (int): Filas de la tabla (por defecto len(filas) si se puede)
+
+    Retorna:
+        int: Bytes escritos
+
+    Lanza:
+        ValueError: Si el formato no es válido
+        OSError: Si no se puede escribir el archivo
+    """
+    formato = formato_de_ruta(ruta, formato)
+    if num_filas is None and hasattr(filas, '__len__'):
+        num_filas = len(filas)
+    escritos = 0
+    with open(ruta, 'wb', buffering=TAMANO_BUFFER) as archivo:
+        for datos in generar_exportacion(campos, filas, formato, num_filas):
+            archivo.write(datos)
+            escritos += len(datos)
+    return escritos
@@ -0,0 +1,122 @@
+"""
+=====================================================================
+    FORMATO - Formateo de números por columnas
+=====================================================================
+Convierte columnas completas de números en texto sin llamar a una
+función de formato por cada valor:
+
+    formatear_columna   Notación normal o científica según la magnitud.
+                        Con notacion='valor' cada número cae en una
+                        cubeta (cero, entero, decimal recortado,
+                        decimal, científica) y el resultado es idéntico
+                        al de formatear_numero; con notacion='columna'
+                        toda la columna usa la misma notación.
+    aplicar_plantilla   Una plantilla '%' por fila, aplicada a todas
+                        las filas con una sola operación '%'.
+
+Las cubetas se deciden con una comprensión sobre los valores; después
+se arma una plantilla con la especificación de cada uno y el texto
+sale de una sola operación '%'. Los ceros sobrantes de los decimales
+recortados se quitan con reemplazos sobre el bloque completo.
+=====================================================================
+"""
+
+from itertools import chain
+
+NOTACIONES = ('valor', 'columna')
+MINIMO_NORMAL = 0.001
+MAXIMO_NORMAL = 1000000
+MAXIMO_ENTERO = 10000
+TOLERANCIA_ENTERO = 0.0001
+
+# Marca de los decimales que pierden sus ceros finales ('2.5000' -> '2.5')
+_RECORTAR = '\x00'
+
+
+def aplicar_plantilla(plantilla, filas, separador="\n"):
+    """
+    Formatea todas las filas con una plantilla '%' en una sola operación.
+
+    Parámetros:
+        plantilla (str): Plantilla de una fila ('%15.2f | %20.2f')
+        filas (list): Tuplas con un valor por especificación de la plantilla
+        separador (str): Texto entre filas
+
+    Retorna:
+        str: Filas formateadas unidas por el separador
+    """
+    if not filas:
+        return ""
+    return separador.join([plantilla] * len(filas)) % tuple(chain.from_iterable(filas))
+
+
+def _cabe_en_notacion_normal(valores):
+    magnitudes = [abs(v) for v in valores if v]
+    return not magnitudes or (MINIMO_NORMAL <= min(magnitudes) and max(magnitudes) < MAXIMO_NORMAL)
+
+
+def formatear_columna(valores, decimales=4, notacion='valor'):
+    """
+    Formatea una columna de números en notación normal o científica.
+
+    Con notacion='valor': 0 se muestra como "0", los números entre 0.001
+    y 999999 en notación normal (enteros sin decimales y, si son mayores
+    que 1, sin ceros finales) y el resto en notación científica.
+
+    Con notacion='columna': si todos los valores distintos de cero están
+    entre 0.001 y 999999 la columna completa usa '%.Nf', si no '%.Ne',
+    así los decimales quedan alineados.
+
+    Parámetros:
+        valores (sequence): Números de la columna
+        decimales (int): Cantidad de decimales
+        notacion (str): 'valor' o 'columna'
+
+    Retorna:
+        list: Un texto por valor
+
+    Lanza:
+        ValueError: Si la notación no es válida
+    """
+    if notacion not in NOTACIONES:
+        raise ValueError(f'Notación no soportada: {notacion}. Opciones: {", ".join(NOTACIONES)}')
+    valores = valores if isinstance(valores, (list, tuple)) else list(valores)
+    if not valores:
+        return []
+
+    normal = f"%.{int(decimales)}f"
+    cientifica = f"%.{int(decimales)}e"
+    if notacion == 'columna':
+        plantilla = normal if _cabe_en_notacion_normal(valores) else cientifica
+        return ("\n".join([plantilla] * len(valores)) % tuple(valores)).split("\n")
+
+    # Cubetas: 0 cero, 1 entero, 2 decimal recortado, 3 decimal, 4 científica
+    cubetas = [
+        0 if v == 0 else
+        (1 if a < MAXIMO_ENTERO and abs(v - round(v)) < TOLERANCIA_ENTERO else 2 if a >= 1 else 3)
+        if MINIMO_NORMAL <= (a := abs(v)) < MAXIMO_NORMAL else 4
+        for v in valores
+    ]
+    especificaciones = ("0", "%.0f", normal + _RECORTAR, normal, cientifica)
+    plantilla = "\n".join([especificaciones[c] for c in cubetas])
+    texto = plantilla % tuple([v for v, c in zip(valores, cubetas) if c])
+    if _RECORTAR in texto:
+        # Cada pasada quita un cero antes de cada marca
+        while '0' + _RECORTAR in texto:
+            texto = texto.replace('0' + _RECORTAR, _RECORTAR)
+        texto = texto.replace('.' + _RECORTAR, '').replace(_RECORTAR, '')
+    return texto.split("\n")
+
+
+def formatear_numero(valor, decimales=4):
+    """
+    Formatea un número con las reglas de formatear_columna(notacion='valor').
+
+    Parámetros:
+        valor (float): Número a formatear
+        decimales (int): Cantidad de decimales
+
+    Retorna:
+        str: Número formateado
+    """
+    return formatear_columna((valor,), decimales)[0]
@@ -0,0 +1,150 @@
+"""
+=====================================================================
+    INCREMENTAL - Motor incremental de tablas exponenciales
+=====================================================================
+Genera filas de curvas de la forma  y(t) = a + b * e^(c*t)  sobre una
+malla regular t_i = i * intervalo, una fila a la vez.
+
+En lugar de evaluar e^(c*t) en cada punto, el valor exponencial se
+avanza multiplicando por el factor constante e^(c*intervalo). Cada
+REANCLAJE pasos se recalcula con math.exp para que el error de
+redondeo acumulado no crezca.
+
+El estado del motor (índice de la malla y valor exponencial actual)
+se puede guardar en un cursor opaco para continuar la tabla después
+calculando solo las filas nuevas.
+
+    Newton:          a = Tm, b = C,  c = K
+    Desintegración:  a = 0,  b = N0, c = -k
+=====================================================================
+"""
+
+import base64
+import json
+import math
+
+REANCLAJE = 1024  # pasos entre recálculos exactos de la exponencial
+
+
+def exponencial_en(c, intervalo, indice):
+    """
+    Calcula e^(c*t) en el punto indice de la malla.
+
+    Parámetros:
+        c (float): Coeficiente del exponente
+        intervalo (float): Separación entre puntos de la malla
+        indice (int): Índice del punto (t = indice * intervalo)
+
+    Retorna:
+        float: Valor de e^(c * indice * intervalo)
+    """
+    return math.exp(c * indice * intervalo)
+
+
+def generar_exponenciales(c, intervalo, inicio=0, exp_inicio=None):
+    """
+    Genera (indice, t, e^(c*t)) desde el índice inicio, sin fin.
+
+    Parámetros:
+        c (float): Coeficiente del exponente
+        intervalo (float): Separación entre puntos de la malla
+        inicio (int): Primer índice a generar
+        exp_inicio (float): e^(c*t) en el índice inicio, si ya se conoce
+
+    Retorna:
+        generator: Tuplas (indice, tiempo, exponencial)
+    """
+    factor = math.exp(c * intervalo)
+    indice = inicio
+    valor = exp_inicio if exp_inicio is not None else exponencial_en(c, intervalo, inicio)
+
+    while True:
+        yield indice, indice * intervalo, valor
+        indice += 1
+        if indice % REANCLAJE == 0:
+            valor = exponencial_en(c, intervalo, indice)
+        else:
+            valor *= factor
+
+
+def generar_filas_enfriamiento(Tm, C, K, intervalo, inicio=0, exp_inicio=None):
+    """
+    Genera filas (tiempo, temperatura) de la Ley de Enfriamiento de Newton.
+
+    Parámetros:
+        Tm (float): Temperatura del medio ambiente (°C)
+        C (float): Constante C
+        K (float): Constante K
+        intervalo (float): Intervalo entre mediciones (minutos)
+        inicio (int): Primer índice de la malla
+        exp_inicio (float): e^(K*t) en el índice inicio (opcional)
+
+    Retorna:
+        generator: Tuplas (tiempo, temperatura)
+    """
+    for _, t, e in generar_exponenciales(K, intervalo, inicio, exp_inicio):
+        yield t, Tm + C * e
+
+
+def generar_filas_desintegracion(N0, k, intervalo, inicio=0, exp_inicio=None):
+    """
+    Genera filas (tiempo, N, porcentaje) de la desintegración radiactiva.
+
+    Parámetros:
+        N0 (float): Cantidad inicial
+        k (float): Constante de desintegración (positiva)
+        intervalo (float): Intervalo entre mediciones
+        inicio (int): Primer índice de la malla
+        exp_inicio (float): e^(-k*t) en el índice inicio (opcional)
+
+    Retorna:
+        generator: Tuplas (tiempo, N, porcentaje)
+    """
+    for _, t, e in generar_exponenciales(-k, intervalo, inicio, exp_inicio):
+        yield t, N0 * e, e * 100
+
+
+def codificar_cursor(modelo, parametros, indice, exponencial):
+    """
+    Codifica el estado del motor en un cursor opaco (texto base64 URL-safe).
+
+    Parámetros:
+        modelo (str): Nombre del modelo ('enfriamiento', 'desintegracion'...)
+        parametros (list): Parámetros que definen la curva y la malla
+        indice (int): Siguiente índice de la malla a generar
+        exponencial (float): e^(c*t) en ese índice
+
+    Retorna:
+        str: Cursor
+    """
+    datos = json.dumps({'m': modelo, 'p': parametros, 'i': indice, 'e': exponencial},
+                       separators=(',', ':'))
+    return base64.urlsafe_b64encode(datos.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor):
+    """
+    Decodifica un cursor creado con codificar_cursor.
+
+    Parámetros:
+        cursor (str): Cursor recibido del cliente
+
+    Retorna:
+        tuple: (modelo, parametros, indice, exponencial)
+
+    Lanza:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        relleno = '=' * (-len(cursor) % 4)
+        datos = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+        modelo = datos['m']
+        parametros = [float(p) for p in datos['p']]
+        indice = datos['i']
+        exponencial = float(datos['e'])
+    except (ValueError, TypeError, KeyError):
+        raise ValueError('Cursor inválido')
+
+    if not isinstance(indice, int) or indice < 0:
+        raise ValueError('Cursor inválido')
+    return modelo, parametros, indice, exponencial
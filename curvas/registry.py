@@ -0,0 +1,407 @@
+"""
+=====================================================================
+    REGISTRY - Registro de modelos exponenciales
+=====================================================================
+Todos los modelos de la familia  y(x) = a + b * e^(c*x)  se describen
+una sola vez con sus parámetros, restricciones, unidades y la función
+que los convierte en los coeficientes (a, b, c). Con eso el registro
+ofrece de forma genérica:
+
+    evaluar   - y(x) para uno o varios valores de x
+    invertir  - x tal que y(x) = y_objetivo
+    tabla     - columnas de la tabla sobre una malla regular
+    resolver  - despejes propios del modelo (K, C, N0...)
+
+Los validadores se compilan al registrar el modelo: leer y validar los
+datos de una petición es un solo recorrido por una tupla de pasos.
+
+Los módulos que definen modelos se importan la primera vez que se
+consulta el registro (MODULOS_MODELOS).
+=====================================================================
+"""
+
+import importlib
+import math
+import threading
+
+from .deadline import PlazoExcedido, verificar_plazo
+
+MODULOS_MODELOS = (
+    'newton_cooling.core.model',
+    'desintegracion_radiactiva.core.model',
+    'modelos_exponenciales.core.model',
+)
+
+# Filas de tabla entre verificaciones del plazo de cálculo
+FILAS_POR_VERIFICACION = 8192
+
+RESTRICCIONES = {
+    'positivo': (lambda v: v > 0, 'debe ser mayor a 0'),
+    'no_negativo': (lambda v: v >= 0, 'debe ser mayor o igual a 0'),
+    'negativo': (lambda v: v < 0, 'debe ser menor a 0'),
+    'distinto_de_cero': (lambda v: v != 0, 'no puede ser 0'),
+}
+
+
+class Parametro:
+    """
+    Parámetro de entrada de un modelo o de un despeje.
+
+    Parámetros:
+        nombre (str): Nombre del campo en las peticiones
+        unidad (str): Unidad física ('' si es adimensional)
+        descripcion (str): Texto para la documentación y los menús
+        restriccion (str): Clave de RESTRICCIONES (opcional)
+    """
+
+    def __init__(self, nombre, unidad, descripcion, restriccion=None):
+        if restriccion is not None and restriccion not in RESTRICCIONES:
+            raise ValueError(f'Restricción desconocida: {restriccion}')
+        self.nombre = nombre
+        self.unidad = unidad
+        self.descripcion = descripcion
+        self.restriccion = restriccion
+
+    def describir(self):
+        """Retorna el parámetro como diccionario."""
+        return {
+            'nombre': self.nombre,
+            'unidad': self.unidad,
+            'descripcion': self.descripcion,
+            'restriccion': self.restriccion
+        }
+
+
+class Magnitud:
+    """
+    Variable independiente o de salida de un modelo.
+
+    Parámetros:
+        simbolo (str): Símbolo en las peticiones ('t', 'T', 'N'...)
+        clave (str): Nombre de la columna en las tablas ('tiempo'...)
+        unidad (str): Unidad física
+        decimales (int): Decimales en las tablas
+    """
+
+    def __init__(self, simbolo, clave, unidad, decimales):
+        self.simbolo = simbolo
+        self.clave = clave
+        self.unidad = unidad
+        self.decimales = decimales
+
+    def describir(self):
+        """Retorna la magnitud como diccionario."""
+        return {
+            'simbolo': self.simbolo,
+            'clave': self.clave,
+            'unidad': self.unidad,
+            'decimales': self.decimales
+        }
+
+
+def compilar_validador(parametros):
+    """
+    Crea la función que lee y valida los parámetros de una petición.
+
+    Parámetros:
+        parametros (tuple): Parámetros a leer, en orden
+
+    Retorna:
+        callable: validar(datos) -> tupla de floats. Lanza ValueError
+                  con un mensaje para el usuario si algún dato no es válido
+    """
+    pasos = tuple((p.nombre, RESTRICCIONES.get(p.restriccion)) for p in parametros)
+
+    def validar(datos):
+        valores = []
+        for nombre, restriccion in pasos:
+            try:
+                valor = float(datos[nombre])
+            except KeyError:
+                raise ValueError(f'Falta el parámetro {nombre}')
+            except (TypeError, ValueError):
+                raise ValueError(f'El parámetro {nombre} debe ser un número')
+            if not math.isfinite(valor):
+                raise ValueError(f'El parámetro {nombre} debe ser un número finito')
+            if restriccion is not None and not restriccion[0](valor):
+                raise ValueError(f'{nombre} {restriccion[1]}')
+            valores.append(valor)
+        return tuple(valores)
+
+    return validar
+
+
+class Solucionador:
+    """
+    Despeje propio de un modelo (por ejemplo K a partir de dos mediciones).
+
+    Parámetros:
+        parametros (tuple): Datos que necesita el despeje
+        funcion (callable): funcion(*valores) -> dict con los resultados.
+                            Lanza ValueError si no hay solución
+        descripcion (str): Texto para la documentación
+    """
+
+    def __init__(self, parametros, funcion, descripcion=''):
+        self.parametros = tuple(parametros)
+        self.funcion = funcion
+        self.descripcion = descripcion
+        self.validar = compilar_validador(self.parametros)
+
+    def resolver(self, datos):
+        """Valida los datos y ejecuta el despeje."""
+        return self.funcion(*self.validar(datos))
+
+
+def _sin_infinitos(resultado):
+    """Reemplaza los valores infinitos de un despeje por 'infinito'."""
+    return {clave: 'infinito' if isinstance(valor, float) and math.isinf(valor) else valor
+            for clave, valor in resultado.items()}
+
+
+class ModeloExponencial:
+    """
+    Modelo de la forma y(x) = a + b * e^(c*x).
+
+    Parámetros:
+        nombre (str): Identificador del modelo en la API
+        titulo (str): Nombre para mostrar
+        parametros (tuple): Parámetros del modelo (Parametro)
+        coeficientes (callable): coeficientes(*valores) -> (a, b, c)
+        variable (Magnitud): Variable independiente
+        salida (Magnitud): Variable dependiente
+        extras (tuple): Columnas adicionales de la tabla como
+                        (clave, decimales, funcion(e)) con e = e^(c*x)
+        solucionadores (dict): incógnita -> Solucionador (opcional)
+        informacion (callable): informacion(*valores) -> dict con datos
+                                derivados para las respuestas (opcional)
+    """
+
+    def __init__(self, nombre, titulo, parametros, coeficientes, variable, salida,
+                 extras=(), solucionadores=None, informacion=None):
+        self.nombre = nombre
+        self.titulo = titulo
+        self.parametros = tuple(parametros)
+        self.coeficientes = coeficientes
+        self.variable = variable
+        self.salida = salida
+        self.extras = tuple(extras)
+        self.solucionadores = dict(solucionadores or {})
+        self.informacion = informacion
+        self.validar = compilar_validador(self.parametros)
+
+    def evaluar(self, valores, x):
+        """
+        Evalúa la curva en uno o varios puntos.
+
+        Parámetros:
+            valores (tuple): Parámetros validados
+            x (float | list): Punto o lista de puntos
+
+        Retorna:
+            float | list: y(x)
+        """
+        a, b, c = self.coeficientes(*valores)
+        if isinstance(x, (list, tuple)):
+            exp = math.exp
+            return [a + b * exp(c * xi) for xi in x]
+        return a + b * math.exp(c * x)
+
+    def invertir(self, valores, y):
+        """
+        Despeja la variable independiente: x = ln((y - a) / b) / c.
+
+        Parámetros:
+            valores (tuple): Parámetros validados
+            y (float): Valor objetivo de la salida
+
+        Retorna:
+            float: x tal que y(x) = y
+
+        Lanza:
+            ValueError: Si el valor no es alcanzable para x >= 0
+        """
+        a, b, c = self.coeficientes(*valores)
+        if b == 0 or c == 0:
+            raise ValueError(f'La curva es constante: no se puede despejar {self.variable.simbolo}')
+        argumento = (y - a) / b
+        if argumento <= 0:
+            raise ValueError(f'{self.salida.simbolo} = {y} no es alcanzable con estos parámetros')
+        x = math.log(argumento) / c
+        if x < 0:
+            raise ValueError(f'{self.salida.simbolo} = {y} solo se alcanza con '
+                             f'{self.variable.simbolo} negativo')
+        return x
+
+    def despejar(self, datos):
+        """
+        Despeja la variable independiente o una incógnita propia del modelo.
+
+        Sin 'incognita' en los datos, o con el símbolo de la variable, se
+        despeja x a partir del valor de la salida. Los resultados infinitos
+        (por ejemplo la media vida con N = N0) se devuelven como 'infinito',
+        igual que en la API v1, para que las respuestas sigan siendo JSON.
+
+        Parámetros:
+            datos (dict): Parámetros, 'incognita' opcional y datos del despeje
+
+        Retorna:
+            tuple: (incognita, dict con los resultados)
+
+        Lanza:
+            ValueError: Si faltan datos o la incógnita no existe
+        """
+        incognita = datos.get('incognita') or self.variable.simbolo
+        if incognita == self.variable.simbolo:
+            valores = self.validar(datos)
+            objetivo = self.salida.simbolo
+            try:
+                y = float(datos[objetivo])
+            except KeyError:
+                raise ValueError(f'Falta el parámetro {objetivo}')
+            except (TypeError, ValueError):
+                raise ValueError(f'El parámetro {objetivo} debe ser un número')
+            return incognita, _sin_infinitos({incognita: self.invertir(valores, y)})
+
+        solucionador = self.solucionadores.get(incognita)
+        if solucionador is None:
+            opciones = ', '.join([self.variable.simbolo] + list(self.solucionadores))
+            raise ValueError(f'Incógnita desconocida: {incognita}. Opciones: {opciones}')
+        return incognita, _sin_infinitos(solucionador.resolver(datos))
+
+    def campos_tabla(self):
+        """
+        Retorna las columnas de la tabla como pares (clave, decimales).
+
+        Retorna:
+            list: Variable, salida y columnas extra
+        """
+        return ([(self.variable.clave, self.variable.decimales),
+                 (self.salida.clave, self.salida.decimales)]
+                + [(clave, decimales) for clave, decimales, _ in self.extras])
+
+    def filas_tabla(self, valores, base, inicio, intervalo):
+        """
+        Construye las filas de la tabla a partir de una base e^(c*x).
+
+        Parámetros:
+            valores (tuple): Parámetros validados
+            base (sequence): e^(c*x) en los puntos inicio, inicio+1, ...
+            inicio (int): Índice de malla del primer punto
+            intervalo (float): Separación entre puntos
+
+        Retorna:
+            list: Tuplas en el orden de campos_tabla()
+
+        Lanza:
+            PlazoExcedido: Si vence el plazo (parcial: filas ya construidas)
+        """
+        a, b, _ = self.coeficientes(*valores)
+        filas = []
+        for desde in range(0, len(base), FILAS_POR_VERIFICACION):
+            try:
+                verificar_plazo()
+            except PlazoExcedido as e:
+                e.parcial = filas
+                raise
+            bloque = base[desde:desde + FILAS_POR_VERIFICACION]
+            columnas = [
+                [(inicio + desde + i) * intervalo for i in range(len(bloque))],
+                [b * e for e in bloque] if a == 0 else [a + b * e for e in bloque]
+            ]
+            for _, _, funcion in self.extras:
+                columnas.append([funcion(e) for e in bloque])
+            filas.extend(zip(*columnas))
+        return filas
+
+    def datos_informativos(self, valores):
+        """Retorna los datos derivados del modelo (vacío si no hay)."""
+        return self.informacion(*valores) if self.informacion else {}
+
+    def describir(self):
+        """Retorna la descripción del modelo para la API."""
+        return {
+            'nombre': self.nombre,
+            'titulo': self.titulo,
+            'parametros': [p.describir() for p in self.parametros],
+            'variable': self.variable.describir(),
+            'salida': self.salida.describir(),
+            'columnas': [clave for clave, _ in self.campos_tabla()],
+            'solucionadores': {
+                incognita: {
+                    'descripcion': s.descripcion,
+                    'parametros': [p.describir() for p in s.parametros]
+                }
+                for incognita, s in self.solucionadores.items()
+            }
+        }
+
+
+class RegistroModelos:
+    """
+    Registro de modelos por nombre, con carga diferida de los módulos.
+
+    Parámetros:
+        modulos (tuple): Módulos que registran modelos al importarse
+    """
+
+    def __init__(self, modulos=()):
+        self._modelos = {}
+        self._modulos = tuple(modulos)
+        self._cargado = False
+        self._lock = threading.RLock()
+
+    def registrar(self, modelo):
+        """
+        Registra un modelo.
+
+        Parámetros:
+            modelo (ModeloExponencial): Modelo a registrar
+
+        Retorna:
+            ModeloExponencial: El mismo modelo
+        """
+        if modelo.nombre in self._modelos:
+            raise ValueError(f'El modelo {modelo.nombre} ya está registrado')
+        self._modelos[modelo.nombre] = modelo
+        return modelo
+
+    def obtener(self, nombre):
+        """
+        Retorna un modelo por nombre.
+
+        Lanza:
+            KeyError: Si el modelo no existe
+        """
+        self._cargar()
+        return self._modelos[nombre]
+
+    def modelos(self):
+        """Retorna la lista de modelos registrados."""
+        self._cargar()
+        return list(self._modelos.values())
+
+    def _cargar(self):
+        if self._cargado:
+            return
+        with self._lock:
+            if not self._cargado:
+                for modulo in self._modulos:
+                    importlib.import_module(modulo)
+                self._cargado = True
+
+
+registro_modelos = RegistroModelos(MODULOS_MODELOS)
+
+
+def registrar_modelo(modelo):
+    """
+    Registra un modelo en el registro global.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo a registrar
+
+    Retorna:
+        ModeloExponencial: El mismo modelo
+    """
+    return registro_modelos.registrar(modelo)
@@ -1,5 +1,7 @@
 # Desintegración Radiactiva
-from desintegracion_radiactiva.ui.menu import ejecutar_aplicacion
+import sys
+
+from main import main
 
 if __name__ == '__main__':
-    ejecutar_aplicacion()
+    sys.exit(main(sys.argv[1:] or ['radiactiva']))
@@ -14,3 +14,15 @@ SUBSEPARATOR_CHAR = "-"
 
 # Constantes físicas
 LN_2 = 0.693147180559945  # ln(2) para cálculos de media de vida
+
+# Vida media de isótopos comunes (años), para las gráficas comparativas
+ISOTOPOS = {
+    "Carbono-14": 5730,
+    "Radio-226": 1600,
+    "Cesio-137": 30.17,
+    "Estroncio-90": 28.8,
+    "Tritio (H-3)": 12.32,
+    "Cobalto-60": 5.27,
+    "Yodo-131": 8.02 / 365.25,
+    "Tecnecio-99m": 6.01 / (24 * 365.25),
+}
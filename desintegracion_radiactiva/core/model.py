@@ -0,0 +1,72 @@
+"""
+=====================================================================
+    MODEL - Registro del modelo de desintegración radiactiva
+=====================================================================
+N(t) = N0 * e^(-k*t)   →   a = 0, b = N0, c = -k
+=====================================================================
+"""
+
+from curvas.registry import (
+    Magnitud,
+    ModeloExponencial,
+    Parametro,
+    Solucionador,
+    registrar_modelo
+)
+from .calculations import (
+    calcular_constante_k,
+    calcular_N0,
+    calcular_media_vida,
+    calcular_k_desde_datos
+)
+
+
+def _resolver_k(N0, N, t):
+    """Despeja k (y la media vida) a partir de una medición N en el tiempo t."""
+    k, t_media = calcular_k_desde_datos(N0, N, t)
+    if k is None:
+        raise ValueError('No es posible calcular k con estos datos. N debe estar entre 0 y N0.')
+    return {'k': k, 't_media': t_media}
+
+
+def _resolver_k_desde_media_vida(t_media):
+    """Calcula k = ln(2) / t_media."""
+    return {'k': calcular_constante_k(t_media), 't_media': t_media}
+
+
+def _resolver_N0(N, k, t):
+    """Calcula la cantidad inicial a partir de N en el tiempo t."""
+    return {'N0': calcular_N0(N, k, t)}
+
+
+MODELO_DESINTEGRACION = registrar_modelo(ModeloExponencial(
+    nombre='radiactiva',
+    titulo='Desintegración Radiactiva',
+    parametros=(
+        Parametro('N0', '', 'Cantidad inicial', 'positivo'),
+        Parametro('k', '1/tiempo', 'Constante de desintegración', 'positivo'),
+    ),
+    coeficientes=lambda N0, k: (0.0, N0, -k),
+    variable=Magnitud('t', 'tiempo', 'tiempo', 4),
+    salida=Magnitud('N', 'N', '', 4),
+    extras=(('porcentaje', 2, lambda e: e * 100),),
+    solucionadores={
+        'k': Solucionador(
+            (Parametro('N0', '', 'Cantidad inicial', 'positivo'),
+             Parametro('N', '', 'Cantidad en el tiempo t', 'positivo'),
+             Parametro('t', 'tiempo', 'Tiempo transcurrido', 'positivo')),
+            _resolver_k,
+            'k y media vida a partir de una medición'),
+        'k_media_vida': Solucionador(
+            (Parametro('t_media', 'tiempo', 'Media vida', 'positivo'),),
+            _resolver_k_desde_media_vida,
+            'k a partir de la media vida'),
+        'N0': Solucionador(
+            (Parametro('N', '', 'Cantidad en el tiempo t', 'no_negativo'),
+             Parametro('k', '1/tiempo', 'Constante de desintegración', 'positivo'),
+             Parametro('t', 'tiempo', 'Tiempo transcurrido', 'no_negativo')),
+            _resolver_N0,
+            'Cantidad inicial a partir de una medición'),
+    },
+    informacion=lambda N0, k: {'t_media': calcular_media_vida(k)}
+))
@@ -6,39 +6,10 @@ Funciones para mostrar información y resultados formateados.
 =====================================================================
 """
 
-from ..core.constants import LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
-
+from consola import Columna, mostrar_tabla_paginada, pausar
+from curvas.formato import formatear_columna, formatear_numero
 
-def formatear_numero(valor, decimales=4):
-    """
-    Formatea un número de manera inteligente.
-    Usa notación normal para números razonables y científica para muy grandes/pequeños.
-    
-    Parámetros:
-        valor (float): Número a formatear
-        decimales (int): Cantidad de decimales
-    
-    Retorna:
-        str: Número formateado
-    """
-    if valor == 0:
-        return "0"
-    
-    abs_valor = abs(valor)
-    
-    # Usar notación normal para números entre 0.001 y 999999
-    if 0.001 <= abs_valor < 1000000:
-        # Para números muy cercanos a enteros, mostrar como entero
-        if abs(valor - round(valor)) < 0.0001 and abs_valor < 10000:
-            return f"{int(round(valor))}"
-        # Para números decimales normales
-        elif abs_valor >= 1:
-            return f"{valor:.{decimales}f}".rstrip('0').rstrip('.')
-        else:
-            return f"{valor:.{decimales}f}"
-    else:
-        # Usar notación científica para números muy grandes o muy pequeños
-        return f"{valor:.{decimales}e}"
+from ..core.constants import LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
 
 
 def mostrar_cabecera(titulo):
@@ -226,16 +197,14 @@ def mostrar_tabla(tabla, N0, k):
         N0 (float): Cantidad inicial
         k (float): Constante de desintegración
     """
-    print("\n" + SEPARATOR_CHAR * LINE_WIDTH)
-    print(f"📊 TABLA DE DESINTEGRACIÓN - N(t) = {formatear_numero(N0)} * e^(-{formatear_numero(k, 6)}*t)")
-    print(SEPARATOR_CHAR * LINE_WIDTH)
-    print(f"{'Tiempo':>15} | {'Cantidad N':>20} | {'Porcentaje':>15}")
-    print(SUBSEPARATOR_CHAR * LINE_WIDTH)
-    
-    for tiempo, N, porcentaje in tabla:
-        print(f"{formatear_numero(tiempo):>15} | {formatear_numero(N):>20} | {porcentaje:>14.2f}%")
-    
-    print(SEPARATOR_CHAR * LINE_WIDTH)
+    columnas = [
+        Columna("Tiempo", formatear_columna, 15, en_bloque=True),
+        Columna("Cantidad N", formatear_columna, 20, en_bloque=True),
+        Columna("Porcentaje", "%14.2f%%", 15)
+    ]
+    mostrar_tabla_paginada(
+        f"📊 TABLA DE DESINTEGRACIÓN - N(t) = {formatear_numero(N0)} * e^(-{formatear_numero(k, 6)}*t)",
+        columnas, tabla, SEPARATOR_CHAR, SUBSEPARATOR_CHAR, LINE_WIDTH)
 
 
 def mostrar_informacion():
@@ -279,4 +248,4 @@ La velocidad de desintegración es proporcional a la cantidad presente.
    • Datación geológica
    • Seguridad y manejo de residuos radiactivos
 """)
-    input("\nPresione ENTER para continuar...")
+    pausar()
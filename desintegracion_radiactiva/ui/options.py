@@ -6,15 +6,22 @@ Contiene las funciones para cada opción del menú con sus submenús.
 =====================================================================
 """
 
+from consola import leer, pausar
+from consola.exportar import exportar_tabla
+from consola.grafica import mostrar_grafica, muestrear_exponencial
+from consola.historial import elegir_parametros_recientes, historial_actual
+from consola.progreso import calcular_con_progreso
+from curvas.incremental import generar_filas_desintegracion
+
 from ..core.calculations import (
     calcular_N_en_tiempo_t,
     calcular_tiempo_t,
     calcular_constante_k,
     calcular_N0,
     calcular_media_vida,
-    calcular_k_desde_datos,
-    generar_tabla_desintegracion
+    calcular_k_desde_datos
 )
+from ..core.constants import ISOTOPOS
 from ..utils.validators import solicitar_numero
 from .display import (
     mostrar_cabecera,
@@ -30,6 +37,64 @@ from .display import (
 )
 
 
+def calcular_tabla(N0, k, tiempo_total, intervalo):
+    """
+    Calcula la tabla de desintegración en segundo plano con barra de progreso.
+    Con Ctrl-C el cálculo se detiene y se conservan las filas ya calculadas.
+    
+    Parámetros:
+        N0 (float): Cantidad inicial
+        k (float): Constante de desintegración
+        tiempo_total (float): Tiempo total a simular
+        intervalo (float): Intervalo entre mediciones
+    
+    Retorna:
+        list: Lista de tuplas (tiempo, N, porcentaje)
+    """
+    parametros = {'N0': N0, 'k': k, 'tiempo_total': tiempo_total, 'intervalo': intervalo}
+    historial = historial_actual()
+    tabla = historial.buscar_tabla('radiactiva', parametros)
+    if tabla is not None:
+        print("\n🕘 Tabla recuperada del historial.")
+        return tabla
+    
+    num_filas = int(tiempo_total / intervalo) + 1
+    tabla, completa = calcular_con_progreso(generar_filas_desintegracion(N0, k, intervalo),
+                                            num_filas, "⚛️  Calculando tabla")
+    if completa:
+        historial.guardar_tabla('radiactiva', parametros, tabla)
+    return tabla
+
+
+def describir_constantes(parametros):
+    """Texto de un conjunto de parámetros recientes (N0 y k)."""
+    return f"N0={formatear_numero(parametros['N0'])}, k={formatear_numero(parametros['k'], 6)}"
+
+
+def solicitar_constantes():
+    """
+    Solicita N0 y k, ofreciendo antes los usados recientemente.
+    
+    Retorna:
+        tuple: (N0, k), o None si se cancela
+    """
+    recientes = elegir_parametros_recientes('radiactiva', describir_constantes)
+    if recientes is not None:
+        N0, k = recientes['N0'], recientes['k']
+    else:
+        print("\n📝 Ingrese los datos:\n")
+        N0 = solicitar_numero("  Cantidad inicial N0: ", valor_minimo=0)
+        if N0 is None:
+            return None
+        
+        k = solicitar_numero("  Constante k (positiva): ", valor_minimo=0.0000001)
+        if k is None:
+            return None
+    
+    historial_actual().recordar_parametros('radiactiva', {'N0': N0, 'k': k})
+    return N0, k
+
+
 def opcion_calcular_N():
     """Maneja la opción 1: Calcular cantidad N en un tiempo t."""
     # Variables para almacenar datos calculados
@@ -58,17 +123,13 @@ def opcion_calcular_N():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-d): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-d): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            N0 = solicitar_numero("  Cantidad inicial N0: ", valor_minimo=0)
-            if N0 is None:
-                continue
-            
-            k = solicitar_numero("  Constante k (positiva): ", valor_minimo=0.0000001)
-            if k is None:
+            constantes = solicitar_constantes()
+            if constantes is None:
                 continue
+            N0, k = constantes
             
             t_media = calcular_media_vida(k)
             
@@ -79,12 +140,12 @@ def opcion_calcular_N():
             ultimo_N = calcular_N_en_tiempo_t(N0, k, ultimo_t)
             
             mostrar_resultado_N(ultimo_t, ultimo_N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -94,12 +155,12 @@ def opcion_calcular_N():
             
             ultimo_N = calcular_N_en_tiempo_t(N0, k, ultimo_t)
             mostrar_resultado_N(ultimo_t, ultimo_N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -111,15 +172,15 @@ def opcion_calcular_N():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
+            tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
             mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c o d.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_tiempo():
@@ -151,17 +212,13 @@ def opcion_calcular_tiempo():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-e): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            N0 = solicitar_numero("  Cantidad inicial N0: ", valor_minimo=0)
-            if N0 is None:
-                continue
-            
-            k = solicitar_numero("  Constante k (positiva): ", valor_minimo=0.0000001)
-            if k is None:
+            constantes = solicitar_constantes()
+            if constantes is None:
                 continue
+            N0, k = constantes
             
             t_media = calcular_media_vida(k)
             
@@ -173,12 +230,12 @@ def opcion_calcular_tiempo():
             
             ultimo_t = calcular_tiempo_t(N0, ultimo_N_objetivo, k)
             mostrar_resultado_tiempo(ultimo_t, ultimo_N_objetivo, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -190,12 +247,12 @@ def opcion_calcular_tiempo():
             
             ultimo_t = calcular_tiempo_t(N0, ultimo_N_objetivo, k)
             mostrar_resultado_tiempo(ultimo_t, ultimo_N_objetivo, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -205,12 +262,12 @@ def opcion_calcular_tiempo():
             
             N = calcular_N_en_tiempo_t(N0, k, t)
             mostrar_resultado_N(t, N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -222,15 +279,15 @@ def opcion_calcular_tiempo():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
+            tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
             mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_k():
@@ -261,7 +318,7 @@ def opcion_calcular_k():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-f): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-f): ").strip().lower()
         
         if sub_opcion == "a":
             print("\n📝 Ingrese la media de vida:\n")
@@ -274,7 +331,7 @@ def opcion_calcular_k():
             print(f"\n💡 Nota: La media de vida es el tiempo en que N = N0/2")
             
             mostrar_resultado_k(k, t_media)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
             print("\n📝 Ingrese los datos experimentales:\n")
@@ -291,14 +348,16 @@ def opcion_calcular_k():
                 continue
             
             k, t_media = calcular_k_desde_datos(N0, N, t)
+            if k:
+                historial_actual().recordar_parametros('radiactiva', {'N0': N0, 'k': k})
             
             mostrar_resultado_k(k, t_media, N0, N, t)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
             if k is None:
                 print("\n❌ Primero debe calcular k (opción a o b)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             if N0 is None:
@@ -313,12 +372,12 @@ def opcion_calcular_k():
             
             N = calcular_N_en_tiempo_t(N0, k, t)
             mostrar_resultado_N(t, N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             if k is None:
                 print("\n❌ Primero debe calcular k (opción a o b)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             if N0 is None:
@@ -335,12 +394,12 @@ def opcion_calcular_k():
             
             t = calcular_tiempo_t(N0, N_objetivo, k)
             mostrar_resultado_tiempo(t, N_objetivo, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
             if k is None:
                 print("\n❌ Primero debe calcular k (opción a o b)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             if N0 is None:
@@ -357,15 +416,15 @@ def opcion_calcular_k():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
+            tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
             mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "f":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c, d, e o f.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_N0():
@@ -396,7 +455,7 @@ def opcion_calcular_N0():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-e): ").strip().lower()
         
         if sub_opcion == "a":
             print("\n📝 Ingrese los datos:\n")
@@ -417,12 +476,12 @@ def opcion_calcular_N0():
             N0 = calcular_N0(N, k, t)
             
             mostrar_resultado_N0(N0, N, t, k)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
             if N0 is None or k is None:
                 print("\n❌ Primero debe calcular N0 (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -432,12 +491,12 @@ def opcion_calcular_N0():
             
             N = calcular_N_en_tiempo_t(N0, k, t)
             mostrar_resultado_N(t, N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
             if N0 is None or k is None:
                 print("\n❌ Primero debe calcular N0 (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -447,12 +506,12 @@ def opcion_calcular_N0():
             
             t = calcular_tiempo_t(N0, N_objetivo, k)
             mostrar_resultado_tiempo(t, N_objetivo, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             if N0 is None or k is None:
                 print("\n❌ Primero debe calcular N0 (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -464,15 +523,15 @@ def opcion_calcular_N0():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
+            tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
             mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_generar_tabla():
@@ -481,13 +540,15 @@ def opcion_generar_tabla():
     N0 = None
     k = None
     t_media = None
+    ultima_tabla = None
     
     opciones_submenu = [
         ("a", "Generar tabla con nuevos datos"),
         ("b", "Generar tabla con diferente intervalo/tiempo"),
         ("c", "Calcular N en un tiempo específico"),
         ("d", "Calcular tiempo para alcanzar una cantidad"),
-        ("e", "Regresar al menú principal")
+        ("e", "Exportar la última tabla (CSV, JSON Lines o NPY)"),
+        ("f", "Regresar al menú principal")
     ]
     
     while True:
@@ -499,17 +560,13 @@ def opcion_generar_tabla():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-f): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            N0 = solicitar_numero("  Cantidad inicial N0: ", valor_minimo=0)
-            if N0 is None:
-                continue
-            
-            k = solicitar_numero("  Constante k (positiva): ", valor_minimo=0.0000001)
-            if k is None:
+            constantes = solicitar_constantes()
+            if constantes is None:
                 continue
+            N0, k = constantes
             
             t_media = calcular_media_vida(k)
             
@@ -521,14 +578,14 @@ def opcion_generar_tabla():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
-            mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            ultima_tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
+            mostrar_tabla(ultima_tabla, N0, k)
+            pausar()
             
         elif sub_opcion == "b":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -540,14 +597,14 @@ def opcion_generar_tabla():
             if intervalo is None:
                 continue
             
-            tabla = generar_tabla_desintegracion(N0, k, tiempo_total, intervalo)
-            mostrar_tabla(tabla, N0, k)
-            input("\nPresione ENTER para continuar...")
+            ultima_tabla = calcular_tabla(N0, k, tiempo_total, intervalo)
+            mostrar_tabla(ultima_tabla, N0, k)
+            pausar()
             
         elif sub_opcion == "c":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -557,12 +614,12 @@ def opcion_generar_tabla():
             
             N = calcular_N_en_tiempo_t(N0, k, t)
             mostrar_resultado_N(t, N, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             if N0 is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: N0={formatear_numero(N0)}, k={formatear_numero(k, 6)}")
@@ -572,10 +629,71 @@ def opcion_generar_tabla():
             
             t = calcular_tiempo_t(N0, N_objetivo, k)
             mostrar_resultado_tiempo(t, N_objetivo, N0)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
+            if ultima_tabla is None:
+                print("\n❌ Primero debe generar una tabla (opción a o b)")
+                pausar("Presione ENTER para continuar...")
+                continue
+            
+            exportar_tabla(["tiempo", "N", "porcentaje"], ultima_tabla, "desintegracion.csv")
+            pausar()
+            
+        elif sub_opcion == "f":
             break
         else:
-            print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            print("\n❌ Opción inválida. Seleccione a, b, c, d, e o f.")
+            pausar("Presione ENTER para continuar...")
+
+
+def elegir_isotopos():
+    """
+    Muestra los isótopos disponibles y solicita una selección.
+
+    Retorna:
+        list: Nombres de los isótopos elegidos (vacía si la entrada no es válida)
+    """
+    nombres = list(ISOTOPOS)
+    print("\n⚛️  ISÓTOPOS DISPONIBLES:\n")
+    for i, nombre in enumerate(nombres, 1):
+        print(f"  {i}. {nombre:<15} t_media = {formatear_numero(ISOTOPOS[nombre])} años")
+    texto = leer("\n  Números de los isótopos separados por comas (ej. 3, 4, 5): ")
+    try:
+        indices = [int(parte) for parte in texto.replace(";", ",").split(",") if parte.strip()]
+    except ValueError:
+        indices = []
+    if not indices or not all(1 <= i <= len(nombres) for i in indices):
+        print("  ❌ Seleccione al menos un isótopo de la lista (por número)")
+        return []
+    return [nombres[i - 1] for i in indices]
+
+
+def opcion_graficar_curvas():
+    """Maneja la opción 8: Graficar la desintegración de varios isótopos."""
+    mostrar_cabecera("OPCIÓN 7: GRAFICAR CURVAS DE DESINTEGRACIÓN")
+    isotopos = elegir_isotopos()
+    if not isotopos:
+        pausar("Presione ENTER para continuar...")
+        return
+
+    print("\n📝 Ingrese los datos:\n")
+    N0 = solicitar_numero("  Cantidad inicial N0: ", valor_minimo=0)
+    if N0 is None:
+        return
+    sugerido = 5 * max(ISOTOPOS[nombre] for nombre in isotopos)
+    tiempo_total = solicitar_numero(f"  Tiempo total a graficar en años (ej. {formatear_numero(sugerido)}): ",
+                                    valor_minimo=0.000001)
+    if tiempo_total is None:
+        return
+
+    series = []
+    for nombre in isotopos:
+        k = calcular_constante_k(ISOTOPOS[nombre])
+        series.append((f"{nombre} (k = {formatear_numero(k, 6)} 1/año)",
+                       *muestrear_exponencial(0.0, N0, -k, tiempo_total)))
+    print()
+    mostrar_grafica(series, titulo=f"📉 N(t) = {formatear_numero(N0)} * e^(-k*t)",
+                    etiqueta_x="t (años)", etiqueta_y="N")
+    pausar()
+
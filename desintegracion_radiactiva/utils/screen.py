@@ -6,9 +6,9 @@ Funciones para manipular la visualización de la consola.
 =====================================================================
 """
 
-import os
+from consola import limpiar
 
 
 def limpiar_pantalla():
-    """Limpia la pantalla de la consola."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Limpia la pantalla de la consola (sin efecto en sesiones guionadas)."""
+    limpiar()
@@ -6,6 +6,8 @@ Funciones para validar y solicitar datos del usuario.
 =====================================================================
 """
 
+from consola import leer
+
 
 def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
     """
@@ -21,7 +23,7 @@ def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
     """
     while True:
         try:
-            valor = float(input(mensaje))
+            valor = float(leer(mensaje))
             
             if valor_minimo is not None and valor < valor_minimo:
                 print(f"  ❌ El valor debe ser mayor o igual a {valor_minimo}")
@@ -54,7 +56,7 @@ def solicitar_opcion(opciones_validas):
         str: Opción válida seleccionada
     """
     while True:
-        opcion = input("\n👉 Seleccione una opción: ").strip().lower()
+        opcion = leer("\n👉 Seleccione una opción: ").strip().lower()
         
         if opcion in opciones_validas:
             return opcion
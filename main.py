@@ -2,25 +2,130 @@
 =====================================================================
     MAIN - Punto de entrada de la aplicación
 =====================================================================
-    APLICACIÓN: LEY DE ENFRIAMIENTO DE NEWTON
-    
-    Esta aplicación calcula la temperatura de un objeto en función del 
-    tiempo utilizando la Ley de Enfriamiento de Newton.
-    
-    Fórmula: T(t) = Tm + C * e^(K*t)
-    
+    APLICACIÓN: ECUACIONES DIFERENCIALES APLICADAS
+
+    Lanzador único de las aplicaciones de consola, del procesamiento
+    por lotes y del servidor web:
+
+        python main.py                      Menú de selección
+        python main.py newton               Ley de Enfriamiento de Newton
+        python main.py radiactiva           Desintegración Radiactiva
+        python main.py modelos              Otros modelos exponenciales
+        python main.py web [--port 5000]    Servidor web (Flask)
+        python main.py newton table --in params.csv --out results.csv
+
+    Cada subsistema (y Flask) se importa solo cuando se elige, para que
+    un cálculo por lotes arranque rápido. El presupuesto de arranque se
+    comprueba con: python -m benchmarks.startup
+
     Autor: Neider Duvan Guindigua Machoa
     Fecha: 3 de Noviembre de 2025
 =====================================================================
 """
 
-from newton_cooling.ui import ejecutar_aplicacion
+import importlib
+import sys
+
+LINE_WIDTH = 70
+
+# nombre -> (módulo con ejecutar_aplicacion, título)
+SUBSISTEMAS = {
+    'newton': ('newton_cooling.ui', 'Ley de Enfriamiento de Newton'),
+    'radiactiva': ('desintegracion_radiactiva.ui.menu', 'Desintegración Radiactiva'),
+    'modelos': ('modelos_exponenciales.ui', 'Otros modelos (fármacos, circuitos RC, atenuación)'),
+}
+
+
+def ejecutar_subsistema(nombre):
+    """
+    Importa y ejecuta el menú de un subsistema.
+
+    Parámetros:
+        nombre (str): Clave de SUBSISTEMAS
+    """
+    modulo, _ = SUBSISTEMAS[nombre]
+    importlib.import_module(modulo).ejecutar_aplicacion()
+
+
+def iniciar_servidor(argv):
+    """
+    Inicia el servidor web de desarrollo.
+
+    Parámetros:
+        argv (list): Argumentos después de 'web' (--host, --port, --debug)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='main.py web',
+                                     description='Servidor web de desarrollo.')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--debug', action='store_true')
+    args = parser.parse_args(argv)
+
+    from app import app
+    app.run(debug=args.debug, host=args.host, port=args.port)
+
+
+def mostrar_lanzador():
+    """Muestra el menú de selección de aplicaciones."""
+    print("\n" + "=" * LINE_WIDTH)
+    print("    ECUACIONES DIFERENCIALES APLICADAS")
+    print("=" * LINE_WIDTH)
+    print("\n📋 APLICACIONES:\n")
+    for i, (_, titulo) in enumerate(SUBSISTEMAS.values(), 1):
+        print(f"  {i}. {titulo}")
+    print(f"  {len(SUBSISTEMAS) + 1}. Servidor web")
+    print(f"  {len(SUBSISTEMAS) + 2}. Salir")
+    print("\n" + "-" * LINE_WIDTH)
+
+
+def ejecutar_lanzador():
+    """Menú de selección: ejecuta la aplicación elegida y vuelve al menú."""
+    from consola import leer
+
+    nombres = list(SUBSISTEMAS)
+    web, salir = str(len(nombres) + 1), str(len(nombres) + 2)
+    while True:
+        mostrar_lanzador()
+        opcion = leer(f"\n👉 Seleccione una opción (1-{salir}): ").strip()
+
+        if opcion == salir:
+            print("\n👋 ¡Hasta pronto!")
+            break
+        elif opcion == web:
+            iniciar_servidor([])
+            break
+        elif opcion.isdigit() and 1 <= int(opcion) <= len(nombres):
+            ejecutar_subsistema(nombres[int(opcion) - 1])
+        else:
+            print(f"\n❌ Opción inválida. Por favor seleccione una opción del 1 al {salir}.")
+
+
+def main(argv=None):
+    """
+    Punto de entrada principal del programa.
 
+    Parámetros:
+        argv (list): Argumentos (por defecto los de la línea de comandos)
 
-def main():
-    """Punto de entrada principal del programa."""
-    ejecutar_aplicacion()
+    Retorna:
+        int: Código de salida
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        ejecutar_lanzador()
+    elif argv[0] == 'web':
+        iniciar_servidor(argv[1:])
+    elif len(argv) == 1 and argv[0] in SUBSISTEMAS:
+        ejecutar_subsistema(argv[0])
+    elif argv[0] in ('-h', '--help'):
+        print(__doc__)
+    else:
+        from curvas.batch import ejecutar_cli
+        return ejecutar_cli(argv, 'main.py')
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
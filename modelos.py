@@ -0,0 +1,17 @@
+"""
+=====================================================================
+    MODELOS - Punto de entrada de los modelos exponenciales
+=====================================================================
+    APLICACIÓN: FARMACOCINÉTICA, CIRCUITOS RC Y ATENUACIÓN
+
+    Modelos de la familia y = a + b * e^(c*x) sobre el motor común
+    de curvas (evaluación, despeje y tablas).
+=====================================================================
+"""
+
+import sys
+
+from main import main
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or ['modelos']))
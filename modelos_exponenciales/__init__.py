@@ -0,0 +1,9 @@
+"""
+Paquete de modelos exponenciales adicionales:
+    - Farmacocinética de un compartimento:  C(t) = (D / Vd) * e^(-k*t)
+    - Descarga de un circuito RC:           V(t) = V0 * e^(-t/(R*C))
+    - Carga de un circuito RC:              V(t) = Vs * (1 - e^(-t/(R*C)))
+    - Atenuación (Beer–Lambert):            I(x) = I0 * e^(-mu*x)
+"""
+
+__version__ = "1.0.0"
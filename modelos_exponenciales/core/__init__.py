@@ -0,0 +1,3 @@
+"""
+Módulo core - Cálculos, constantes de referencia y registro de modelos.
+"""
@@ -0,0 +1,182 @@
+"""
+=====================================================================
+    CALCULATIONS - Cálculos de los modelos exponenciales
+=====================================================================
+Fórmulas cerradas de los despejes propios de cada modelo. La
+evaluación, la inversión y las tablas son genéricas (curvas.registry).
+=====================================================================
+"""
+
+import math
+
+from .constants import LN_2, LN_10
+
+
+# =====================================================================
+# FARMACOCINÉTICA: C(t) = (D / Vd) * e^(-k*t)
+# =====================================================================
+
+def calcular_k_eliminacion(t_media):
+    """
+    Calcula la constante de eliminación a partir de la media vida.
+
+    Parámetros:
+        t_media (float): Media vida de eliminación (h)
+
+    Retorna:
+        float: Constante k (1/h) o None si t_media no es positiva
+    """
+    if t_media <= 0:
+        return None
+    return LN_2 / t_media
+
+
+def calcular_k_desde_concentracion(dosis, Vd, C, t):
+    """
+    Calcula k a partir de una concentración medida.
+    Despejando k de: C = (D / Vd) * e^(-k*t)
+
+    Parámetros:
+        dosis (float): Dosis administrada (mg)
+        Vd (float): Volumen de distribución (L)
+        C (float): Concentración medida (mg/L)
+        t (float): Tiempo de la medición (h)
+
+    Retorna:
+        float: Constante k (1/h) o None si no es posible
+    """
+    if dosis <= 0 or Vd <= 0 or C <= 0 or t <= 0:
+        return None
+    C0 = dosis / Vd
+    if C >= C0:
+        return None
+    return math.log(C0 / C) / t
+
+
+def calcular_dosis(C0, Vd):
+    """
+    Calcula la dosis necesaria para una concentración inicial.
+
+    Parámetros:
+        C0 (float): Concentración inicial deseada (mg/L)
+        Vd (float): Volumen de distribución (L)
+
+    Retorna:
+        float: Dosis (mg)
+    """
+    return C0 * Vd
+
+
+# =====================================================================
+# CIRCUITO RC: descarga V0 * e^(-t/tau), carga Vs * (1 - e^(-t/tau))
+# =====================================================================
+
+def calcular_tau(R, C):
+    """
+    Calcula la constante de tiempo de un circuito RC.
+
+    Parámetros:
+        R (float): Resistencia (Ω)
+        C (float): Capacitancia (F)
+
+    Retorna:
+        float: tau = R * C (s)
+    """
+    return R * C
+
+
+def calcular_tau_descarga(V0, V, t):
+    """
+    Calcula tau a partir de una medición durante la descarga.
+    Despejando tau de: V = V0 * e^(-t/tau)
+
+    Parámetros:
+        V0 (float): Voltaje inicial (V)
+        V (float): Voltaje medido (V)
+        t (float): Tiempo de la medición (s)
+
+    Retorna:
+        float: tau (s) o None si no es posible
+    """
+    if V0 <= 0 or V <= 0 or V >= V0 or t <= 0:
+        return None
+    return t / math.log(V0 / V)
+
+
+def calcular_tau_carga(Vs, V, t):
+    """
+    Calcula tau a partir de una medición durante la carga.
+    Despejando tau de: V = Vs * (1 - e^(-t/tau))
+
+    Parámetros:
+        Vs (float): Voltaje de la fuente (V)
+        V (float): Voltaje medido (V)
+        t (float): Tiempo de la medición (s)
+
+    Retorna:
+        float: tau (s) o None si no es posible
+    """
+    if Vs <= 0 or V <= 0 or V >= Vs or t <= 0:
+        return None
+    return t / math.log(Vs / (Vs - V))
+
+
+# =====================================================================
+# ATENUACIÓN (BEER–LAMBERT): I(x) = I0 * e^(-mu*x)
+# =====================================================================
+
+def calcular_mu(I0, I, x):
+    """
+    Calcula el coeficiente de atenuación lineal a partir de una medición.
+
+    Parámetros:
+        I0 (float): Intensidad incidente
+        I (float): Intensidad transmitida
+        x (float): Espesor atravesado (cm)
+
+    Retorna:
+        float: mu (1/cm) o None si no es posible
+    """
+    if I0 <= 0 or I <= 0 or I >= I0 or x <= 0:
+        return None
+    return math.log(I0 / I) / x
+
+
+def calcular_mu_lineal(mu_masico, densidad):
+    """
+    Convierte el coeficiente másico en coeficiente lineal.
+
+    Parámetros:
+        mu_masico (float): Coeficiente másico mu/rho (cm²/g)
+        densidad (float): Densidad del material (g/cm³)
+
+    Retorna:
+        float: mu (1/cm)
+    """
+    return mu_masico * densidad
+
+
+def calcular_capa_hemirreductora(mu):
+    """
+    Calcula el espesor que reduce la intensidad a la mitad.
+
+    Parámetros:
+        mu (float): Coeficiente de atenuación lineal (1/cm)
+
+    Retorna:
+        float: Capa hemirreductora ln(2)/mu (cm)
+    """
+    return LN_2 / mu
+
+
+def calcular_capa_decimorreductora(mu):
+    """
+    Calcula el espesor que reduce la intensidad a la décima parte.
+
+    Parámetros:
+        mu (float): Coeficiente de atenuación lineal (1/cm)
+
+    Retorna:
+        float: Capa decimorreductora ln(10)/mu (cm)
+    """
+    return LN_10 / mu
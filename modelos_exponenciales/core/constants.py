@@ -0,0 +1,65 @@
+"""
+=====================================================================
+    CONSTANTS - Constantes de la aplicación y tablas de referencia
+=====================================================================
+Constantes de la interfaz y valores de referencia precalculados de
+fármacos y materiales, indexados por nombre.
+=====================================================================
+"""
+
+import math
+
+# Configuración de visualización
+APP_TITLE = "MODELOS EXPONENCIALES - CALCULADORA"
+LINE_WIDTH = 70
+SEPARATOR_CHAR = "="
+SUBSEPARATOR_CHAR = "-"
+
+# Constantes matemáticas
+LN_2 = math.log(2)
+LN_10 = math.log(10)
+
+# =====================================================================
+# FÁRMACOS (Referencia, adulto de 70 kg)
+# =====================================================================
+# nombre: (media vida de eliminación en h, volumen de distribución en L)
+# Valores aproximados de la literatura, solo para fines educativos.
+FARMACOS = {
+    'paracetamol': (2.5, 67.0),
+    'ibuprofeno': (2.0, 10.5),
+    'amoxicilina': (1.0, 21.0),
+    'cafeina': (5.0, 42.0),
+    'gentamicina': (2.5, 17.5),
+    'digoxina': (36.0, 490.0),
+}
+
+# Constante de eliminación k = ln(2) / t_media (1/h), precalculada
+K_ELIMINACION = {
+    nombre: LN_2 / t_media for nombre, (t_media, _) in FARMACOS.items()
+}
+
+# =====================================================================
+# MATERIALES DE BLINDAJE (Referencia)
+# =====================================================================
+# nombre: (densidad g/cm³, mu/rho a 662 keV (Cs-137), mu/rho a 1.25 MeV (Co-60))
+# Coeficientes másicos de atenuación en cm²/g (valores aproximados).
+MATERIALES = {
+    'agua': (1.00, 0.0857, 0.0632),
+    'aluminio': (2.699, 0.0746, 0.0550),
+    'hormigon': (2.30, 0.0776, 0.0578),
+    'hierro': (7.874, 0.0730, 0.0550),
+    'plomo': (11.35, 0.1101, 0.0588),
+}
+
+FUENTES = ('Cs-137 (662 keV)', 'Co-60 (1.25 MeV)')
+
+# Coeficiente lineal mu = (mu/rho) * rho (1/cm), precalculado por fuente
+MU_LINEAL = {
+    nombre: (densidad * mu_cs, densidad * mu_co)
+    for nombre, (densidad, mu_cs, mu_co) in MATERIALES.items()
+}
+
+# Capa hemirreductora ln(2) / mu (cm), precalculada por fuente
+CAPA_HEMIRREDUCTORA = {
+    nombre: tuple(LN_2 / mu for mu in mus) for nombre, mus in MU_LINEAL.items()
+}
@@ -0,0 +1,167 @@
+"""
+=====================================================================
+    MODEL - Registro de los modelos exponenciales adicionales
+=====================================================================
+    Farmacocinética:  C(t) = (D/Vd) * e^(-k*t)     a = 0,  b = D/Vd, c = -k
+    Descarga RC:      V(t) = V0 * e^(-t/(R*C))     a = 0,  b = V0,   c = -1/(R*C)
+    Carga RC:         V(t) = Vs * (1 - e^(-t/RC))  a = Vs, b = -Vs,  c = -1/(R*C)
+    Atenuación:       I(x) = I0 * e^(-mu*x)        a = 0,  b = I0,   c = -mu
+=====================================================================
+"""
+
+from curvas.registry import (
+    Magnitud,
+    ModeloExponencial,
+    Parametro,
+    Solucionador,
+    registrar_modelo
+)
+from .calculations import (
+    calcular_k_eliminacion,
+    calcular_k_desde_concentracion,
+    calcular_dosis,
+    calcular_tau,
+    calcular_tau_descarga,
+    calcular_tau_carga,
+    calcular_mu,
+    calcular_mu_lineal,
+    calcular_capa_hemirreductora,
+    calcular_capa_decimorreductora
+)
+from .constants import LN_2
+
+
+def _requerir(valor, mensaje):
+    """Lanza ValueError si un despeje no tiene solución."""
+    if valor is None:
+        raise ValueError(mensaje)
+    return valor
+
+
+# =====================================================================
+# FARMACOCINÉTICA DE UN COMPARTIMENTO
+# =====================================================================
+MODELO_FARMACOCINETICA = registrar_modelo(ModeloExponencial(
+    nombre='farmacocinetica',
+    titulo='Eliminación de un fármaco (un compartimento)',
+    parametros=(
+        Parametro('dosis', 'mg', 'Dosis administrada (bolo intravenoso)', 'positivo'),
+        Parametro('Vd', 'L', 'Volumen de distribución', 'positivo'),
+        Parametro('k', '1/h', 'Constante de eliminación', 'positivo'),
+    ),
+    coeficientes=lambda dosis, Vd, k: (0.0, dosis / Vd, -k),
+    variable=Magnitud('t', 'tiempo', 'h', 2),
+    salida=Magnitud('C', 'concentracion', 'mg/L', 4),
+    extras=(('porcentaje', 2, lambda e: e * 100),),
+    solucionadores={
+        'k': Solucionador(
+            (Parametro('dosis', 'mg', 'Dosis administrada', 'positivo'),
+             Parametro('Vd', 'L', 'Volumen de distribución', 'positivo'),
+             Parametro('C', 'mg/L', 'Concentración medida', 'positivo'),
+             Parametro('t', 'h', 'Tiempo de la medición', 'positivo')),
+            lambda dosis, Vd, C, t: {'k': _requerir(
+                calcular_k_desde_concentracion(dosis, Vd, C, t),
+                'No es posible calcular k: C debe ser menor que la concentración inicial D/Vd.')},
+            'k a partir de una concentración medida'),
+        'k_media_vida': Solucionador(
+            (Parametro('t_media', 'h', 'Media vida de eliminación', 'positivo'),),
+            lambda t_media: {'k': calcular_k_eliminacion(t_media)},
+            'k a partir de la media vida'),
+        'dosis': Solucionador(
+            (Parametro('C0', 'mg/L', 'Concentración inicial deseada', 'positivo'),
+             Parametro('Vd', 'L', 'Volumen de distribución', 'positivo')),
+            lambda C0, Vd: {'dosis': calcular_dosis(C0, Vd)},
+            'Dosis para alcanzar una concentración inicial'),
+    },
+    informacion=lambda dosis, Vd, k: {
+        'C0': dosis / Vd,
+        't_media': LN_2 / k
+    }
+))
+
+
+# =====================================================================
+# CIRCUITO RC
+# =====================================================================
+_PARAMETROS_RC = (
+    Parametro('R', 'Ω', 'Resistencia', 'positivo'),
+    Parametro('C', 'F', 'Capacitancia', 'positivo'),
+)
+
+MODELO_RC_DESCARGA = registrar_modelo(ModeloExponencial(
+    nombre='rc_descarga',
+    titulo='Descarga de un capacitor (circuito RC)',
+    parametros=(Parametro('V0', 'V', 'Voltaje inicial del capacitor', 'positivo'),) + _PARAMETROS_RC,
+    coeficientes=lambda V0, R, C: (0.0, V0, -1.0 / calcular_tau(R, C)),
+    variable=Magnitud('t', 'tiempo', 's', 4),
+    salida=Magnitud('V', 'voltaje', 'V', 4),
+    extras=(('porcentaje', 2, lambda e: e * 100),),
+    solucionadores={
+        'tau': Solucionador(
+            (Parametro('V0', 'V', 'Voltaje inicial', 'positivo'),
+             Parametro('V', 'V', 'Voltaje medido', 'positivo'),
+             Parametro('t', 's', 'Tiempo de la medición', 'positivo')),
+            lambda V0, V, t: {'tau': _requerir(
+                calcular_tau_descarga(V0, V, t),
+                'No es posible calcular tau: V debe estar entre 0 y V0.')},
+            'Constante de tiempo a partir de una medición'),
+    },
+    informacion=lambda V0, R, C: {'tau': calcular_tau(R, C)}
+))
+
+MODELO_RC_CARGA = registrar_modelo(ModeloExponencial(
+    nombre='rc_carga',
+    titulo='Carga de un capacitor (circuito RC)',
+    parametros=(Parametro('Vs', 'V', 'Voltaje de la fuente', 'positivo'),) + _PARAMETROS_RC,
+    coeficientes=lambda Vs, R, C: (Vs, -Vs, -1.0 / calcular_tau(R, C)),
+    variable=Magnitud('t', 'tiempo', 's', 4),
+    salida=Magnitud('V', 'voltaje', 'V', 4),
+    extras=(('porcentaje', 2, lambda e: (1 - e) * 100),),
+    solucionadores={
+        'tau': Solucionador(
+            (Parametro('Vs', 'V', 'Voltaje de la fuente', 'positivo'),
+             Parametro('V', 'V', 'Voltaje medido', 'positivo'),
+             Parametro('t', 's', 'Tiempo de la medición', 'positivo')),
+            lambda Vs, V, t: {'tau': _requerir(
+                calcular_tau_carga(Vs, V, t),
+                'No es posible calcular tau: V debe estar entre 0 y Vs.')},
+            'Constante de tiempo a partir de una medición'),
+    },
+    informacion=lambda Vs, R, C: {'tau': calcular_tau(R, C)}
+))
+
+
+# =====================================================================
+# ATENUACIÓN (BEER–LAMBERT / BLINDAJE)
+# =====================================================================
+MODELO_ATENUACION = registrar_modelo(ModeloExponencial(
+    nombre='atenuacion',
+    titulo='Atenuación de radiación (Beer–Lambert)',
+    parametros=(
+        Parametro('I0', '', 'Intensidad incidente', 'positivo'),
+        Parametro('mu', '1/cm', 'Coeficiente de atenuación lineal', 'positivo'),
+    ),
+    coeficientes=lambda I0, mu: (0.0, I0, -mu),
+    variable=Magnitud('x', 'espesor', 'cm', 3),
+    salida=Magnitud('I', 'intensidad', '', 4),
+    extras=(('porcentaje', 2, lambda e: e * 100),),
+    solucionadores={
+        'mu': Solucionador(
+            (Parametro('I0', '', 'Intensidad incidente', 'positivo'),
+             Parametro('I', '', 'Intensidad transmitida', 'positivo'),
+             Parametro('x', 'cm', 'Espesor atravesado', 'positivo')),
+            lambda I0, I, x: {'mu': _requerir(
+                calcular_mu(I0, I, x),
+                'No es posible calcular mu: I debe estar entre 0 e I0.')},
+            'Coeficiente lineal a partir de una medición'),
+        'mu_masico': Solucionador(
+            (Parametro('mu_masico', 'cm²/g', 'Coeficiente másico mu/rho', 'positivo'),
+             Parametro('densidad', 'g/cm³', 'Densidad del material', 'positivo')),
+            lambda mu_masico, densidad: {'mu': calcular_mu_lineal(mu_masico, densidad)},
+            'Coeficiente lineal a partir del coeficiente másico'),
+    },
+    informacion=lambda I0, mu: {
+        'capa_hemirreductora': calcular_capa_hemirreductora(mu),
+        'capa_decimorreductora': calcular_capa_decimorreductora(mu)
+    }
+))
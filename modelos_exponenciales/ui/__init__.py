@@ -0,0 +1,7 @@
+"""
+Módulo ui - Interfaz de usuario de consola.
+"""
+
+from .menu import ejecutar_aplicacion
+
+__all__ = ['ejecutar_aplicacion']
@@ -0,0 +1,151 @@
+"""
+=====================================================================
+    DISPLAY - Funciones de visualización
+=====================================================================
+Funciones para mostrar modelos, resultados y tablas formateados.
+=====================================================================
+"""
+
+from consola import Columna, mostrar_tabla_paginada
+
+from ..core.constants import LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
+
+
+def formatear_numero(valor, decimales=4):
+    """
+    Formatea un número en notación normal o científica según su magnitud.
+
+    Parámetros:
+        valor (float): Número a formatear
+        decimales (int): Cantidad de decimales
+
+    Retorna:
+        str: Número formateado
+    """
+    if valor == 0:
+        return "0"
+
+    abs_valor = abs(valor)
+    if 0.001 <= abs_valor < 1000000:
+        return f"{valor:.{decimales}f}"
+    return f"{valor:.{decimales}e}"
+
+
+def mostrar_cabecera(titulo):
+    """
+    Muestra una cabecera formateada.
+
+    Parámetros:
+        titulo (str): Título a mostrar
+    """
+    print("\n" + SEPARATOR_CHAR * LINE_WIDTH)
+    print(f"    {titulo}")
+    print(SEPARATOR_CHAR * LINE_WIDTH)
+
+
+def mostrar_submenu(opciones):
+    """
+    Muestra las opciones de un submenú.
+
+    Parámetros:
+        opciones (list): Lista de tuplas (letra, descripción)
+    """
+    print("\n📋 OPCIONES:\n")
+    for letra, descripcion in opciones:
+        print(f"  {letra}. {descripcion}")
+    print("\n" + SUBSEPARATOR_CHAR * LINE_WIDTH)
+
+
+def mostrar_datos_actuales(modelo, valores):
+    """
+    Muestra los parámetros actuales de un modelo y sus datos derivados.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo seleccionado
+        valores (tuple): Parámetros validados (o None)
+    """
+    if valores is None:
+        return
+
+    print("\n📌 DATOS ACTUALES:")
+    partes = []
+    for parametro, valor in zip(modelo.parametros, valores):
+        unidad = f" {parametro.unidad}" if parametro.unidad else ""
+        partes.append(f"{parametro.nombre} = {formatear_numero(valor)}{unidad}")
+    print("   " + " | ".join(partes))
+
+    derivados = modelo.datos_informativos(valores)
+    if derivados:
+        print("   " + " | ".join(f"{nombre} = {formatear_numero(valor)}"
+                               for nombre, valor in derivados.items()))
+
+
+def mostrar_resultado(titulo, resultados):
+    """
+    Muestra un resultado con sus valores.
+
+    Parámetros:
+        titulo (str): Descripción del resultado
+        resultados (dict): nombre -> valor
+    """
+    print("\n" + SUBSEPARATOR_CHAR * LINE_WIDTH)
+    print(f"✅ {titulo}")
+    for nombre, valor in resultados.items():
+        print(f"   {nombre} = {formatear_numero(valor, 6)}")
+    print(SUBSEPARATOR_CHAR * LINE_WIDTH)
+
+
+def mostrar_tabla(modelo, filas):
+    """
+    Muestra la tabla de un modelo con las columnas de campos_tabla().
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo de la tabla
+        filas (list): Tuplas en el orden de modelo.campos_tabla()
+    """
+    campos = modelo.campos_tabla()
+    ancho = max(12, (LINE_WIDTH - 3 * (len(campos) - 1)) // len(campos))
+    columnas = [Columna(clave.capitalize(), f"%{ancho}.{decimales}f", ancho)
+                for clave, decimales in campos]
+    mostrar_tabla_paginada(f"📊 TABLA - {modelo.titulo.upper()}", columnas, filas,
+                           SEPARATOR_CHAR, SUBSEPARATOR_CHAR, LINE_WIDTH)
+
+
+def mostrar_referencias(titulo, encabezados, filas):
+    """
+    Muestra una tabla de valores de referencia numerada.
+
+    Parámetros:
+        titulo (str): Título de la tabla
+        encabezados (list): Nombres de las columnas
+        filas (list): Lista de (nombre, valores...)
+    """
+    mostrar_cabecera(titulo)
+    print(f"{'#':>3}  {encabezados[0]:<14}" + "".join(f"{e:>14}" for e in encabezados[1:]))
+    print(SUBSEPARATOR_CHAR * LINE_WIDTH)
+    for i, (nombre, *valores) in enumerate(filas, 1):
+        print(f"{i:>3}  {nombre:<14}" + "".join(f"{formatear_numero(v):>14}" for v in valores))
+    print(SEPARATOR_CHAR * LINE_WIDTH)
+
+
+def mostrar_informacion(modelo):
+    """
+    Muestra la fórmula, los parámetros y los despejes de un modelo.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo a describir
+    """
+    mostrar_cabecera(f"INFORMACIÓN: {modelo.titulo.upper()}")
+    variable, salida = modelo.variable, modelo.salida
+    print(f"\n📐 FÓRMULA GENERAL:\n   {salida.simbolo}({variable.simbolo}) = a + b * e^(c*{variable.simbolo})")
+    print("\n📊 PARÁMETROS:")
+    for parametro in modelo.parametros:
+        unidad = f" ({parametro.unidad})" if parametro.unidad else ""
+        print(f"   • {parametro.nombre}{unidad}: {parametro.descripcion}")
+    print(f"\n   • {variable.simbolo} ({variable.unidad}): {variable.clave}")
+    print(f"   • {salida.simbolo} ({salida.unidad or 'adimensional'}): {salida.clave}")
+    if modelo.solucionadores:
+        print("\n🔍 DESPEJES DISPONIBLES:")
+        for incognita, solucionador in modelo.solucionadores.items():
+            print(f"   • {incognita}: {solucionador.descripcion}")
+    print("\n" + SEPARATOR_CHAR * LINE_WIDTH)
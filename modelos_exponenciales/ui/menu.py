@@ -0,0 +1,56 @@
+"""
+=====================================================================
+    MENU - Menú principal de la aplicación
+=====================================================================
+Funciones para mostrar y controlar el menú principal.
+=====================================================================
+"""
+
+from consola import leer, pausar
+
+from ..core import model  # registra los modelos del paquete
+from ..core.constants import APP_TITLE, LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
+from ..utils.screen import limpiar_pantalla
+from .options import ejecutar_modelo
+
+MODELOS = (
+    model.MODELO_FARMACOCINETICA,
+    model.MODELO_RC_DESCARGA,
+    model.MODELO_RC_CARGA,
+    model.MODELO_ATENUACION,
+)
+
+
+def mostrar_menu_principal():
+    """Muestra el menú principal de la aplicación."""
+    print("\n" + SEPARATOR_CHAR * LINE_WIDTH)
+    print(f"    {APP_TITLE}")
+    print(SEPARATOR_CHAR * LINE_WIDTH)
+    print("\n📋 MENÚ DE OPCIONES:\n")
+    for i, modelo in enumerate(MODELOS, 1):
+        print(f"  {i}. {modelo.titulo}")
+    print(f"  {len(MODELOS) + 1}. Salir")
+    print("\n" + SUBSEPARATOR_CHAR * LINE_WIDTH)
+
+
+def ejecutar_aplicacion():
+    """
+    Función principal que ejecuta el programa.
+    Controla el flujo del menú y las opciones.
+    """
+    salir = str(len(MODELOS) + 1)
+    while True:
+        limpiar_pantalla()
+        mostrar_menu_principal()
+        
+        opcion = leer(f"\n👉 Seleccione una opción (1-{salir}): ").strip()
+        
+        if opcion == salir:
+            print("\n👋 ¡Gracias por usar la aplicación!")
+            print(SEPARATOR_CHAR * LINE_WIDTH)
+            break
+        elif opcion.isdigit() and 1 <= int(opcion) <= len(MODELOS):
+            ejecutar_modelo(MODELOS[int(opcion) - 1])
+        else:
+            print(f"\n❌ Opción inválida. Por favor seleccione una opción del 1 al {salir}.")
+            pausar("Presione ENTER para continuar...")
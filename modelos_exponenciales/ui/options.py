@@ -0,0 +1,302 @@
+"""
+=====================================================================
+    OPTIONS - Submenú de cada modelo
+=====================================================================
+Un mismo submenú sirve para todos los modelos del registro: los
+parámetros, las unidades y los despejes salen de la definición del
+modelo (curvas.registry). Las tablas usan la caché de bases y el
+historial de cálculos (consola.historial).
+=====================================================================
+"""
+
+from consola import leer, pausar
+from consola.exportar import exportar_tabla
+from consola.historial import elegir_parametros_recientes, historial_actual
+from consola.progreso import FILAS_POR_BLOQUE, calcular_con_progreso
+from curvas.basis_cache import CacheBases
+
+from ..core.constants import (
+    FARMACOS,
+    K_ELIMINACION,
+    MATERIALES,
+    MU_LINEAL,
+    FUENTES
+)
+from ..utils.validators import solicitar_numero, solicitar_parametro
+from .display import (
+    mostrar_cabecera,
+    mostrar_datos_actuales,
+    mostrar_informacion,
+    mostrar_referencias,
+    mostrar_resultado,
+    mostrar_submenu,
+    mostrar_tabla
+)
+
+MAX_FILAS_TABLA = 1000000
+
+bases = CacheBases()
+
+
+# =====================================================================
+# VALORES DE REFERENCIA
+# =====================================================================
+
+def referencias_farmacos():
+    """
+    Tabla de fármacos de referencia.
+
+    Retorna:
+        tuple: (titulo, encabezados, filas, valores por fila)
+    """
+    filas, valores = [], []
+    for nombre, (t_media, Vd) in FARMACOS.items():
+        filas.append((nombre, t_media, Vd, K_ELIMINACION[nombre]))
+        valores.append({'Vd': Vd, 'k': K_ELIMINACION[nombre]})
+    return ("FÁRMACOS DE REFERENCIA (adulto de 70 kg)",
+            ["Fármaco", "t_media (h)", "Vd (L)", "k (1/h)"], filas, valores)
+
+
+def referencias_materiales():
+    """
+    Tabla de materiales de blindaje de referencia.
+
+    Retorna:
+        tuple: (titulo, encabezados, filas, valores por fila)
+    """
+    filas, valores = [], []
+    for nombre, (densidad, _, _) in MATERIALES.items():
+        mu_cs, mu_co = MU_LINEAL[nombre]
+        filas.append((nombre, densidad, mu_cs, mu_co))
+        valores.append({'mu': (mu_cs, mu_co)})
+    return ("MATERIALES DE BLINDAJE - mu lineal (1/cm)",
+            ["Material", "rho (g/cm³)", "Cs-137", "Co-60"], filas, valores)
+
+
+REFERENCIAS = {
+    'farmacocinetica': referencias_farmacos,
+    'atenuacion': referencias_materiales,
+}
+
+
+def elegir_referencia(modelo):
+    """
+    Permite cargar parámetros desde la tabla de referencia del modelo.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo seleccionado
+
+    Retorna:
+        dict: Parámetros de la referencia elegida (vacío si no se eligió)
+    """
+    crear = REFERENCIAS.get(modelo.nombre)
+    if crear is None:
+        return {}
+
+    titulo, encabezados, filas, valores = crear()
+    mostrar_referencias(titulo, encabezados, filas)
+    texto = leer("\n👉 Número de referencia a cargar (ENTER para omitir): ").strip()
+    if not texto:
+        return {}
+    try:
+        elegido = dict(valores[int(texto) - 1])
+    except (ValueError, IndexError):
+        print("  ❌ Referencia inválida, se omite")
+        return {}
+
+    if modelo.nombre == 'atenuacion':
+        print("\n  Fuente de radiación:")
+        for i, fuente in enumerate(FUENTES, 1):
+            print(f"    {i}. {fuente}")
+        indice = 1 if leer("  Seleccione (1-2) [1]: ").strip() == "2" else 0
+        elegido['mu'] = elegido['mu'][indice]
+    return elegido
+
+
+# =====================================================================
+# ACCIONES DEL SUBMENÚ
+# =====================================================================
+
+def pedir_parametros(modelo, valores_actuales=None):
+    """
+    Solicita todos los parámetros de un modelo.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo seleccionado
+        valores_actuales (tuple): Valores anteriores para usar con ENTER
+
+    Retorna:
+        tuple: Parámetros validados o None si se cancela
+    """
+    def describir(parametros):
+        return ", ".join(f"{p.nombre}={parametros[p.nombre]:g} {p.unidad}".rstrip() for p in modelo.parametros)
+
+    aplicacion = f"modelos:{modelo.nombre}"
+    recientes = elegir_parametros_recientes(aplicacion, describir)
+    if recientes is not None:
+        historial_actual().recordar_parametros(aplicacion, recientes)
+        return modelo.validar(recientes)
+
+    sugeridos = dict(zip([p.nombre for p in modelo.parametros], valores_actuales or ()))
+    sugeridos.update(elegir_referencia(modelo))
+
+    print("\n📝 Ingrese los datos:\n")
+    datos = {}
+    for parametro in modelo.parametros:
+        valor = solicitar_parametro(parametro, sugeridos.get(parametro.nombre))
+        if valor is None:
+            return None
+        datos[parametro.nombre] = valor
+    valores = modelo.validar(datos)
+    historial_actual().recordar_parametros(aplicacion, datos)
+    return valores
+
+
+def evaluar_modelo(modelo, valores):
+    """Evalúa la salida del modelo en un valor de la variable."""
+    variable = modelo.variable
+    x = solicitar_numero(f"  {variable.clave.capitalize()} {variable.simbolo} ({variable.unidad}): ",
+                         valor_minimo=0)
+    if x is None:
+        return
+    y = modelo.evaluar(valores, x)
+    mostrar_resultado(f"{modelo.salida.simbolo}({x:g}) calculado",
+                      {modelo.salida.simbolo: y})
+
+
+def despejar_variable(modelo, valores):
+    """Calcula el valor de la variable para una salida objetivo."""
+    salida = modelo.salida
+    y = solicitar_numero(f"  {salida.clave.capitalize()} objetivo {salida.simbolo}: ")
+    if y is None:
+        return
+    x = modelo.invertir(valores, y)
+    mostrar_resultado(f"{modelo.variable.simbolo} para {salida.simbolo} = {y:g}",
+                      {modelo.variable.simbolo: x})
+
+
+def _filas_por_bloques(modelo, valores, base, intervalo):
+    """Genera las filas de la tabla por bloques (para calcular_con_progreso)."""
+    for inicio in range(0, len(base), FILAS_POR_BLOQUE):
+        yield from modelo.filas_tabla(valores, base[inicio:inicio + FILAS_POR_BLOQUE],
+                                      inicio, intervalo)
+
+
+def generar_tabla(modelo, valores):
+    """
+    Genera y muestra la tabla del modelo.
+
+    Retorna:
+        list: Filas de la tabla (None si se cancela)
+    """
+    variable = modelo.variable
+    total = solicitar_numero(f"  {variable.clave.capitalize()} total ({variable.unidad}): ",
+                             valor_minimo=0)
+    if total is None:
+        return
+    intervalo = solicitar_numero(f"  Intervalo ({variable.unidad}): ", valor_minimo=0.0001)
+    if intervalo is None:
+        return
+
+    num_puntos = int(total / intervalo) + 1
+    if num_puntos > MAX_FILAS_TABLA:
+        print(f"\n❌ Demasiadas filas ({num_puntos}). El máximo es {MAX_FILAS_TABLA}.")
+        return
+
+    parametros = dict(zip([p.nombre for p in modelo.parametros], valores),
+                      total=total, intervalo=intervalo)
+    historial = historial_actual()
+    filas = historial.buscar_tabla(f"modelos:{modelo.nombre}", parametros)
+    if filas is not None:
+        print("\n🕘 Tabla recuperada del historial.")
+    else:
+        _, _, c = modelo.coeficientes(*valores)
+        base = bases.obtener(c, intervalo, num_puntos)
+        filas, completa = calcular_con_progreso(_filas_por_bloques(modelo, valores, base, intervalo),
+                                                num_puntos, "📈 Calculando tabla")
+        if completa:
+            historial.guardar_tabla(f"modelos:{modelo.nombre}", parametros, filas)
+    mostrar_tabla(modelo, filas)
+    return filas
+
+
+def resolver_incognita(modelo):
+    """Ejecuta uno de los despejes propios del modelo."""
+    incognitas = list(modelo.solucionadores)
+    print("\n🔍 Despejes disponibles:")
+    for i, incognita in enumerate(incognitas, 1):
+        print(f"  {i}. {incognita}: {modelo.solucionadores[incognita].descripcion}")
+    try:
+        incognita = incognitas[int(leer("\n👉 Seleccione un despeje: ").strip()) - 1]
+    except (ValueError, IndexError):
+        print("\n❌ Opción inválida.")
+        return
+
+    solucionador = modelo.solucionadores[incognita]
+    print("\n📝 Ingrese los datos:\n")
+    datos = {}
+    for parametro in solucionador.parametros:
+        valor = solicitar_parametro(parametro)
+        if valor is None:
+            return
+        datos[parametro.nombre] = valor
+    mostrar_resultado(solucionador.descripcion, solucionador.resolver(datos))
+
+
+def ejecutar_modelo(modelo):
+    """
+    Submenú de un modelo.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo seleccionado
+    """
+    valores = None
+    opciones = [
+        ("a", "Ingresar parámetros del modelo"),
+        ("b", f"Calcular {modelo.salida.simbolo} para un valor de {modelo.variable.simbolo}"),
+        ("c", f"Calcular {modelo.variable.simbolo} para un valor de {modelo.salida.simbolo}"),
+        ("d", "Generar tabla"),
+        ("e", "Exportar la última tabla (CSV, JSON Lines o NPY)"),
+        ("f", "Despejes del modelo"),
+        ("g", "Ver información del modelo"),
+        ("h", "Regresar al menú principal")
+    ]
+    requieren_parametros = {"b": evaluar_modelo, "c": despejar_variable}
+    ultima_tabla = None
+
+    while True:
+        mostrar_cabecera(modelo.titulo.upper())
+        mostrar_datos_actuales(modelo, valores)
+        mostrar_submenu(opciones)
+
+        sub_opcion = leer("\n👉 Seleccione una opción (a-h): ").strip().lower()
+        try:
+            if sub_opcion == "a":
+                nuevos = pedir_parametros(modelo, valores)
+                if nuevos is not None:
+                    valores = nuevos
+                continue
+            elif sub_opcion in requieren_parametros or sub_opcion == "d":
+                if valores is None:
+                    print("\n❌ Primero debe ingresar los parámetros (opción a)")
+                elif sub_opcion == "d":
+                    ultima_tabla = generar_tabla(modelo, valores) or ultima_tabla
+                else:
+                    requieren_parametros[sub_opcion](modelo, valores)
+            elif sub_opcion == "e":
+                if ultima_tabla is None:
+                    print("\n❌ Primero debe generar una tabla (opción d)")
+                else:
+                    exportar_tabla([nombre for nombre, _ in modelo.campos_tabla()],
+                                   ultima_tabla, f"{modelo.nombre}.csv")
+            elif sub_opcion == "f":
+                resolver_incognita(modelo)
+            elif sub_opcion == "g":
+                mostrar_informacion(modelo)
+            elif sub_opcion == "h":
+                break
+            else:
+                print("\n❌ Opción inválida. Seleccione una letra de la a a la h.")
+        except (ValueError, OverflowError) as e:
+            print(f"\n❌ {e}")
+        pausar()
@@ -0,0 +1,3 @@
+"""
+Módulo utils - Utilidades de entrada y pantalla.
+"""
@@ -0,0 +1,14 @@
+"""
+=====================================================================
+    SCREEN - Utilidades de pantalla
+=====================================================================
+Funciones para manipular la visualización de la consola.
+=====================================================================
+"""
+
+from consola import limpiar
+
+
+def limpiar_pantalla():
+    """Limpia la pantalla de la consola (sin efecto en sesiones guionadas)."""
+    limpiar()
@@ -0,0 +1,80 @@
+"""
+=====================================================================
+    VALIDATORS - Validadores de entrada
+=====================================================================
+Funciones para validar y solicitar datos del usuario.
+=====================================================================
+"""
+
+from consola import leer
+from curvas.registry import RESTRICCIONES
+
+
+def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
+    """
+    Solicita un número al usuario con validación.
+    
+    Parámetros:
+        mensaje (str): Mensaje a mostrar al usuario
+        valor_minimo (float): Valor mínimo permitido (opcional)
+        valor_maximo (float): Valor máximo permitido (opcional)
+    
+    Retorna:
+        float: Número válido ingresado por el usuario o None si se cancela
+    """
+    while True:
+        try:
+            valor = float(leer(mensaje))
+            
+            if valor_minimo is not None and valor < valor_minimo:
+                print(f"  ❌ El valor debe ser mayor o igual a {valor_minimo}")
+                continue
+            
+            if valor_maximo is not None and valor > valor_maximo:
+                print(f"  ❌ El valor debe ser menor o igual a {valor_maximo}")
+                continue
+            
+            return valor
+            
+        except ValueError:
+            print("  ❌ Por favor ingrese un número válido")
+        except KeyboardInterrupt:
+            print("\n\n❌ Operación cancelada por el usuario")
+            return None
+
+
+def solicitar_parametro(parametro, valor_actual=None):
+    """
+    Solicita un parámetro de un modelo respetando su restricción.
+    
+    Parámetros:
+        parametro (Parametro): Parámetro del registro de modelos
+        valor_actual (float): Valor que se usa si se presiona ENTER (opcional)
+    
+    Retorna:
+        float: Valor válido o None si se cancela
+    """
+    unidad = f" ({parametro.unidad})" if parametro.unidad else ""
+    actual = f" [{valor_actual:g}]" if valor_actual is not None else ""
+    mensaje = f"  {parametro.descripcion} {parametro.nombre}{unidad}{actual}: "
+    restriccion = RESTRICCIONES.get(parametro.restriccion)
+    
+    while True:
+        try:
+            texto = leer(mensaje).strip()
+        except KeyboardInterrupt:
+            print("\n\n❌ Operación cancelada por el usuario")
+            return None
+        
+        if not texto and valor_actual is not None:
+            return valor_actual
+        try:
+            valor = float(texto)
+        except ValueError:
+            print("  ❌ Por favor ingrese un número válido")
+            continue
+        
+        if restriccion is not None and not restriccion[0](valor):
+            print(f"  ❌ {parametro.nombre} {restriccion[1]}")
+            continue
+        return valor
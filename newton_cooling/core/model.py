@@ -0,0 +1,57 @@
+"""
+=====================================================================
+    MODEL - Registro del modelo de enfriamiento de Newton
+=====================================================================
+T(t) = Tm + C * e^(K*t)   →   a = Tm, b = C, c = K
+=====================================================================
+"""
+
+from curvas.registry import (
+    Magnitud,
+    ModeloExponencial,
+    Parametro,
+    Solucionador,
+    registrar_modelo
+)
+from .calculations import calcular_constante_K, calcular_constante_C
+
+
+def _resolver_K(T0, Tm, T, t):
+    """Despeja K (y C) a partir de una medición T en el tiempo t."""
+    K, C = calcular_constante_K(T0, Tm, T, t)
+    if K is None:
+        raise ValueError('No es posible calcular K con estos datos. Verifica los valores ingresados.')
+    return {'K': K, 'C': C}
+
+
+def _resolver_C(T0, Tm):
+    """Calcula C = T0 - Tm."""
+    return {'C': calcular_constante_C(T0, Tm)}
+
+
+MODELO_NEWTON = registrar_modelo(ModeloExponencial(
+    nombre='newton',
+    titulo='Ley de Enfriamiento de Newton',
+    parametros=(
+        Parametro('Tm', '°C', 'Temperatura del medio ambiente'),
+        Parametro('C', '°C', 'Constante C (T0 - Tm)'),
+        Parametro('K', '1/min', 'Constante de enfriamiento K'),
+    ),
+    coeficientes=lambda Tm, C, K: (Tm, C, K),
+    variable=Magnitud('t', 'tiempo', 'min', 2),
+    salida=Magnitud('T', 'temperatura', '°C', 2),
+    solucionadores={
+        'K': Solucionador(
+            (Parametro('T0', '°C', 'Temperatura inicial'),
+             Parametro('Tm', '°C', 'Temperatura del medio ambiente'),
+             Parametro('T', '°C', 'Temperatura medida en el tiempo t'),
+             Parametro('t', 'min', 'Tiempo de la medición', 'positivo')),
+            _resolver_K,
+            'K y C a partir de una medición de temperatura'),
+        'C': Solucionador(
+            (Parametro('T0', '°C', 'Temperatura inicial'),
+             Parametro('Tm', '°C', 'Temperatura del medio ambiente')),
+            _resolver_C,
+            'C a partir de la temperatura inicial'),
+    }
+))
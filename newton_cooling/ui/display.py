@@ -6,6 +6,8 @@ Funciones para mostrar información y resultados formateados.
 =====================================================================
 """
 
+from consola import Columna, mostrar_tabla_paginada, pausar
+
 from ..core.constants import LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
 
 
@@ -133,16 +135,12 @@ def mostrar_tabla(tabla, Tm, C, K):
         C (float): Constante C
         K (float): Constante K
     """
-    print("\n" + SEPARATOR_CHAR * LINE_WIDTH)
-    print(f"📊 TABLA - T = {Tm} + {C} * e^({K}*t)")
-    print(SEPARATOR_CHAR * LINE_WIDTH)
-    print(f"{'Tiempo (min)':>15} | {'Temperatura (°C)':>20}")
-    print(SUBSEPARATOR_CHAR * LINE_WIDTH)
-    
-    for tiempo, temperatura in tabla:
-        print(f"{tiempo:>15.2f} | {temperatura:>20.2f}")
-    
-    print(SEPARATOR_CHAR * LINE_WIDTH)
+    columnas = [
+        Columna("Tiempo (min)", "%15.2f", 15),
+        Columna("Temperatura (°C)", "%20.2f", 20)
+    ]
+    mostrar_tabla_paginada(f"📊 TABLA - T = {Tm} + {C} * e^({K}*t)", columnas, tabla,
+                           SEPARATOR_CHAR, SUBSEPARATOR_CHAR, LINE_WIDTH)
 
 
 def mostrar_informacion():
@@ -178,4 +176,4 @@ entre su temperatura y la temperatura del medio ambiente.
    • Ingeniería térmica
    • Meteorología
 """)
-    input("\nPresione ENTER para continuar...")
+    pausar()
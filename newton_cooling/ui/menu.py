@@ -6,6 +6,8 @@ Funciones para mostrar y controlar el menú principal.
 =====================================================================
 """
 
+from consola import leer, pausar
+
 from ..core.constants import APP_TITLE, LINE_WIDTH, SEPARATOR_CHAR, SUBSEPARATOR_CHAR
 from ..utils.screen import limpiar_pantalla
 from .display import mostrar_informacion
@@ -14,7 +16,8 @@ from .options import (
     opcion_calcular_tiempo,
     opcion_calcular_constante_K,
     opcion_calcular_constante_C,
-    opcion_generar_tabla
+    opcion_generar_tabla,
+    opcion_graficar_curvas
 )
 
 
@@ -31,6 +34,7 @@ def mostrar_menu_principal():
     print("  5. Generar tabla de enfriamiento")
     print("  6. Ver información sobre la ley")
     print("  7. Salir")
+    print("  8. Graficar curvas (varios valores de K)")
     print("\n" + SUBSEPARATOR_CHAR * LINE_WIDTH)
 
 
@@ -43,7 +47,7 @@ def ejecutar_aplicacion():
         limpiar_pantalla()
         mostrar_menu_principal()
         
-        opcion = input("\n👉 Seleccione una opción (1-7): ").strip()
+        opcion = leer("\n👉 Seleccione una opción (1-8): ").strip()
         
         if opcion == "1":
             opcion_calcular_temperatura()
@@ -61,6 +65,8 @@ def ejecutar_aplicacion():
             print("\n👋 ¡Gracias por usar la aplicación!")
             print(SEPARATOR_CHAR * LINE_WIDTH)
             break
+        elif opcion == "8":
+            opcion_graficar_curvas()
         else:
-            print("\n❌ Opción inválida. Por favor seleccione una opción del 1 al 7.")
-            input("Presione ENTER para continuar...")
+            print("\n❌ Opción inválida. Por favor seleccione una opción del 1 al 8.")
+            pausar("Presione ENTER para continuar...")
@@ -6,12 +6,18 @@ Contiene las funciones para cada opción del menú con sus submenús.
 =====================================================================
 """
 
+from consola import leer, pausar
+from consola.exportar import exportar_tabla
+from consola.grafica import mostrar_grafica, muestrear_exponencial
+from consola.historial import elegir_parametros_recientes, historial_actual
+from consola.progreso import calcular_con_progreso
+from curvas.incremental import generar_filas_enfriamiento
+
 from ..core.calculations import (
     calcular_temperatura,
     calcular_tiempo_para_temperatura,
     calcular_constante_K,
-    calcular_constante_C,
-    generar_tabla_enfriamiento
+    calcular_constante_C
 )
 from ..utils.validators import solicitar_numero
 from .display import (
@@ -25,6 +31,86 @@ from .display import (
 )
 
 
+def calcular_tabla(Tm, C, K, tiempo_total, intervalo):
+    """
+    Calcula la tabla de enfriamiento en segundo plano con barra de progreso.
+    Con Ctrl-C el cálculo se detiene y se conservan las filas ya calculadas.
+    
+    Parámetros:
+        Tm (float): Temperatura del medio ambiente (°C)
+        C (float): Constante C
+        K (float): Constante K
+        tiempo_total (float): Tiempo total a simular (minutos)
+        intervalo (float): Intervalo de tiempo entre mediciones (minutos)
+    
+    Retorna:
+        list: Lista de tuplas (tiempo, temperatura)
+    """
+    parametros = {'Tm': Tm, 'C': C, 'K': K, 'tiempo_total': tiempo_total, 'intervalo': intervalo}
+    historial = historial_actual()
+    tabla = historial.buscar_tabla('newton', parametros)
+    if tabla is not None:
+        print("\n🕘 Tabla recuperada del historial.")
+        return tabla
+    
+    num_filas = int(tiempo_total / intervalo) + 1
+    tabla, completa = calcular_con_progreso(generar_filas_enfriamiento(Tm, C, K, intervalo),
+                                            num_filas, "🌡️  Calculando tabla")
+    if completa:
+        historial.guardar_tabla('newton', parametros, tabla)
+    return tabla
+
+
+def describir_constantes(parametros):
+    """Texto de un conjunto de parámetros recientes (Tm, C y K)."""
+    return f"Tm={parametros['Tm']:g}°C, C={parametros['C']:g}, K={parametros['K']:g}"
+
+
+def solicitar_constantes(mensaje_K="  Constante K: "):
+    """
+    Solicita Tm, C y K, ofreciendo antes los usados recientemente.
+    
+    Parámetros:
+        mensaje_K (str): Mensaje para solicitar K
+    
+    Retorna:
+        tuple: (Tm, C, K), o None si se cancela
+    """
+    recientes = elegir_parametros_recientes('newton', describir_constantes)
+    if recientes is not None:
+        Tm, C, K = recientes['Tm'], recientes['C'], recientes['K']
+    else:
+        print("\n📝 Ingrese los datos:\n")
+        Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
+        if Tm is None:
+            return None
+        
+        # Preguntar si desea calcular C automáticamente
+        print("\n¿Cómo desea ingresar la constante C?")
+        print("  1. Ingresar C directamente")
+        print("  2. Calcular C automáticamente (C = T_inicial - Tm)")
+        
+        opcion_c = leer("Seleccione (1 o 2): ").strip()
+        
+        if opcion_c == "2":
+            T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
+            if T_inicial is None:
+                return None
+            C = calcular_constante_C(T_inicial, Tm)
+            print(f"\n✅ C calculado: C = {T_inicial} - {Tm} = {C:.2f}")
+        else:
+            C = solicitar_numero("  Constante C: ")
+            if C is None:
+                return None
+        
+        K = solicitar_numero(mensaje_K)
+        if K is None:
+            return None
+    
+    historial_actual().recordar_parametros('newton', {'Tm': Tm, 'C': C, 'K': K})
+    return Tm, C, K
+
+
 def opcion_calcular_temperatura():
     """Maneja la opción 1: Calcular temperatura en un tiempo específico."""
     # Variables para almacenar datos calculados
@@ -45,7 +131,7 @@ def opcion_calcular_temperatura():
         mostrar_cabecera("OPCIÓN 1: CALCULAR TEMPERATURA")
         
         # Mostrar datos actuales si existen
-        if Tm is not None:
+        if K is not None:
             info_adicional = None
             if ultima_temperatura is not None:
                 info_adicional = f"Último cálculo: T({ultimo_tiempo} min) = {ultima_temperatura:.2f}°C"
@@ -53,67 +139,64 @@ def opcion_calcular_temperatura():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-d): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-d): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
-            
-            # Preguntar si desea calcular C automáticamente
-            print("\n¿Cómo desea ingresar la constante C?")
-            print("  1. Ingresar C directamente")
-            print("  2. Calcular C automáticamente (C = T_inicial - Tm)")
-            
-            opcion_c = input("Seleccione (1 o 2): ").strip()
-            
-            if opcion_c == "2":
-                T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
-                C = calcular_constante_C(T_inicial, Tm)
-                print(f"\n✅ C calculado: C = {T_inicial} - {Tm} = {C:.2f}")
-            else:
-                C = solicitar_numero("  Constante C: ")
+            Tm = C = K = ultima_temperatura = None
+            constantes = solicitar_constantes("  Constante K (negativa para enfriamiento): ")
+            if constantes is None:
+                continue
+            Tm, C, K = constantes
             
-            K = solicitar_numero("  Constante K (negativa para enfriamiento): ")
             ultimo_tiempo = solicitar_numero("  Tiempo transcurrido t (minutos): ", valor_minimo=0)
+            if ultimo_tiempo is None:
+                continue
             
             ultima_temperatura = calcular_temperatura(Tm, C, K, ultimo_tiempo)
             
             formula = f"Fórmula usada: T = {Tm} + {C} * e^({K}*{ultimo_tiempo})"
             mostrar_resultado_temperatura(ultimo_tiempo, ultima_temperatura, formula)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             ultimo_tiempo = solicitar_numero("  Tiempo transcurrido t (minutos): ", valor_minimo=0)
+            if ultimo_tiempo is None:
+                continue
             
             ultima_temperatura = calcular_temperatura(Tm, C, K, ultimo_tiempo)
             mostrar_resultado_temperatura(ultimo_tiempo, ultima_temperatura)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             tiempo_total = solicitar_numero("  Tiempo total a simular (minutos): ", valor_minimo=0)
+            if tiempo_total is None:
+                continue
+            
             intervalo = solicitar_numero("  Intervalo entre mediciones (minutos): ", valor_minimo=0.1)
+            if intervalo is None:
+                continue
             
-            tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
+            tabla = calcular_tabla(Tm, C, K, tiempo_total, intervalo)
             mostrar_tabla(tabla, Tm, C, K)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c o d.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_tiempo():
@@ -137,7 +220,7 @@ def opcion_calcular_tiempo():
         mostrar_cabecera("OPCIÓN 2: CALCULAR TIEMPO")
         
         # Mostrar datos actuales si existen
-        if Tm is not None:
+        if K is not None:
             info_adicional = None
             if ultimo_tiempo is not None and ultimo_tiempo != float('inf'):
                 info_adicional = f"Último cálculo: t = {ultimo_tiempo:.2f} min para alcanzar {ultima_temp_objetivo}°C"
@@ -145,78 +228,77 @@ def opcion_calcular_tiempo():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-e): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
-            
-            # Preguntar si desea calcular C automáticamente
-            print("\n¿Cómo desea ingresar la constante C?")
-            print("  1. Ingresar C directamente")
-            print("  2. Calcular C automáticamente (C = T_inicial - Tm)")
-            
-            opcion_c = input("Seleccione (1 o 2): ").strip()
-            
-            if opcion_c == "2":
-                T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
-                C = calcular_constante_C(T_inicial, Tm)
-                print(f"\n✅ C calculado: C = {T_inicial} - {Tm} = {C:.2f}")
-            else:
-                C = solicitar_numero("  Constante C: ")
+            Tm = C = K = ultimo_tiempo = None
+            constantes = solicitar_constantes()
+            if constantes is None:
+                continue
+            Tm, C, K = constantes
             
-            K = solicitar_numero("  Constante K: ")
             ultima_temp_objetivo = solicitar_numero("  Temperatura objetivo (°C): ")
+            if ultima_temp_objetivo is None:
+                continue
             
             ultimo_tiempo = calcular_tiempo_para_temperatura(Tm, C, K, ultima_temp_objetivo)
             mostrar_resultado_tiempo(ultimo_tiempo, ultima_temp_objetivo)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             ultima_temp_objetivo = solicitar_numero("  Temperatura objetivo (°C): ")
+            if ultima_temp_objetivo is None:
+                continue
             
             ultimo_tiempo = calcular_tiempo_para_temperatura(Tm, C, K, ultima_temp_objetivo)
             mostrar_resultado_tiempo(ultimo_tiempo, ultima_temp_objetivo)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             t = solicitar_numero("  Tiempo t (minutos): ", valor_minimo=0)
+            if t is None:
+                continue
             
             temperatura = calcular_temperatura(Tm, C, K, t)
             mostrar_resultado_temperatura(t, temperatura)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             tiempo_total = solicitar_numero("  Tiempo total a simular (minutos): ", valor_minimo=0)
+            if tiempo_total is None:
+                continue
+            
             intervalo = solicitar_numero("  Intervalo entre mediciones (minutos): ", valor_minimo=0.1)
+            if intervalo is None:
+                continue
             
-            tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
+            tabla = calcular_tabla(Tm, C, K, tiempo_total, intervalo)
             mostrar_tabla(tabla, Tm, C, K)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_constante_K():
@@ -250,14 +332,26 @@ def opcion_calcular_constante_K():
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-e): ").strip().lower()
         
         if sub_opcion == "a":
             print("\n📝 Ingrese los datos:\n")
+            K = None
             T0 = solicitar_numero("  Temperatura inicial T(0) (°C): ")
+            if T0 is None:
+                continue
+            
             Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
+            if Tm is None:
+                continue
+            
             T_en_t = solicitar_numero("  Temperatura en tiempo t (°C): ")
+            if T_en_t is None:
+                continue
+            
             t = solicitar_numero("  Tiempo t en que se midió (minutos): ", valor_minimo=0.0001)
+            if t is None:
+                continue
             
             K, C = calcular_constante_K(T0, Tm, T_en_t, t)
             
@@ -265,55 +359,65 @@ def opcion_calcular_constante_K():
             T_verificacion = None
             if K is not None:
                 T_verificacion = calcular_temperatura(Tm, C, K, t)
+                historial_actual().recordar_parametros('newton', {'Tm': Tm, 'C': C, 'K': K})
             
             mostrar_resultado_K(K, C, Tm, t, T_verificacion)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
             if K is None:
                 print("\n❌ Primero debe calcular K (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C:.2f}, K={K:.6f}")
             t = solicitar_numero("  Tiempo t (minutos): ", valor_minimo=0)
+            if t is None:
+                continue
             
             temperatura = calcular_temperatura(Tm, C, K, t)
             mostrar_resultado_temperatura(t, temperatura)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
             if K is None:
                 print("\n❌ Primero debe calcular K (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C:.2f}, K={K:.6f}")
             T_objetivo = solicitar_numero("  Temperatura objetivo (°C): ")
+            if T_objetivo is None:
+                continue
             
             tiempo = calcular_tiempo_para_temperatura(Tm, C, K, T_objetivo)
             mostrar_resultado_tiempo(tiempo, T_objetivo)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
             if K is None:
                 print("\n❌ Primero debe calcular K (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C:.2f}, K={K:.6f}")
             tiempo_total = solicitar_numero("  Tiempo total a simular (minutos): ", valor_minimo=0)
+            if tiempo_total is None:
+                continue
+            
             intervalo = solicitar_numero("  Intervalo entre mediciones (minutos): ", valor_minimo=0.1)
+            if intervalo is None:
+                continue
             
-            tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
+            tabla = calcular_tabla(Tm, C, K, tiempo_total, intervalo)
             mostrar_tabla(tabla, Tm, C, K)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
             break
         else:
             print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            pausar("Presione ENTER para continuar...")
 
 
 def opcion_calcular_constante_C():
@@ -328,7 +432,12 @@ def opcion_calcular_constante_C():
         
         print("\n📝 Ingrese los datos:\n")
         T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
+        if T_inicial is None:
+            break
+        
         Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
+        if Tm is None:
+            break
         
         C = calcular_constante_C(T_inicial, Tm)
         
@@ -358,7 +467,7 @@ def opcion_calcular_constante_C():
             print("  • La temperatura no cambiará con el tiempo")
         
         print("\n¿Desea hacer otro cálculo de C?")
-        respuesta = input("(s/n): ").strip().lower()
+        respuesta = leer("(s/n): ").strip().lower()
         if respuesta != 's':
             break
         print()
@@ -377,88 +486,153 @@ def opcion_generar_tabla():
         ("b", "Generar tabla con diferente intervalo/tiempo"),
         ("c", "Calcular temperatura en un tiempo específico"),
         ("d", "Calcular tiempo para alcanzar una temperatura"),
-        ("e", "Regresar al menú principal")
+        ("e", "Exportar la última tabla (CSV, JSON Lines o NPY)"),
+        ("f", "Regresar al menú principal")
     ]
     
     while True:
         mostrar_cabecera("OPCIÓN 4: TABLA DE ENFRIAMIENTO")
         
         # Mostrar datos actuales si existen
-        if Tm is not None:
+        if K is not None:
             mostrar_datos_actuales(Tm, C, K)
         
         mostrar_submenu(opciones_submenu)
         
-        sub_opcion = input("\n👉 Seleccione una opción (a-e): ").strip().lower()
+        sub_opcion = leer("\n👉 Seleccione una opción (a-f): ").strip().lower()
         
         if sub_opcion == "a":
-            print("\n📝 Ingrese los datos:\n")
-            Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
-            
-            # Preguntar si desea calcular C automáticamente
-            print("\n¿Cómo desea ingresar la constante C?")
-            print("  1. Ingresar C directamente")
-            print("  2. Calcular C automáticamente (C = T_inicial - Tm)")
-            
-            opcion_c = input("Seleccione (1 o 2): ").strip()
-            
-            if opcion_c == "2":
-                T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
-                C = calcular_constante_C(T_inicial, Tm)
-                print(f"\n✅ C calculado: C = {T_inicial} - {Tm} = {C:.2f}")
-            else:
-                C = solicitar_numero("  Constante C: ")
+            Tm = C = K = None
+            constantes = solicitar_constantes()
+            if constantes is None:
+                continue
+            Tm, C, K = constantes
             
-            K = solicitar_numero("  Constante K: ")
             tiempo_total = solicitar_numero("  Tiempo total a simular (minutos): ", valor_minimo=0)
+            if tiempo_total is None:
+                continue
+            
             intervalo = solicitar_numero("  Intervalo entre mediciones (minutos): ", valor_minimo=0.1)
+            if intervalo is None:
+                continue
             
-            ultima_tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
+            ultima_tabla = calcular_tabla(Tm, C, K, tiempo_total, intervalo)
             mostrar_tabla(ultima_tabla, Tm, C, K)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "b":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             tiempo_total = solicitar_numero("  Tiempo total a simular (minutos): ", valor_minimo=0)
+            if tiempo_total is None:
+                continue
+            
             intervalo = solicitar_numero("  Intervalo entre mediciones (minutos): ", valor_minimo=0.1)
+            if intervalo is None:
+                continue
             
-            ultima_tabla = generar_tabla_enfriamiento(Tm, C, K, tiempo_total, intervalo)
+            ultima_tabla = calcular_tabla(Tm, C, K, tiempo_total, intervalo)
             mostrar_tabla(ultima_tabla, Tm, C, K)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "c":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             t = solicitar_numero("  Tiempo t (minutos): ", valor_minimo=0)
+            if t is None:
+                continue
             
             temperatura = calcular_temperatura(Tm, C, K, t)
             mostrar_resultado_temperatura(t, temperatura)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "d":
-            if Tm is None:
+            if K is None:
                 print("\n❌ Primero debe ingresar datos (opción a)")
-                input("Presione ENTER para continuar...")
+                pausar("Presione ENTER para continuar...")
                 continue
             
             print(f"\n📝 Usando: Tm={Tm}°C, C={C}, K={K}")
             T_objetivo = solicitar_numero("  Temperatura objetivo (°C): ")
+            if T_objetivo is None:
+                continue
             
             tiempo = calcular_tiempo_para_temperatura(Tm, C, K, T_objetivo)
             mostrar_resultado_tiempo(tiempo, T_objetivo)
-            input("\nPresione ENTER para continuar...")
+            pausar()
             
         elif sub_opcion == "e":
+            if ultima_tabla is None:
+                print("\n❌ Primero debe generar una tabla (opción a o b)")
+                pausar("Presione ENTER para continuar...")
+                continue
+            
+            exportar_tabla(["tiempo", "temperatura"], ultima_tabla, "enfriamiento.csv")
+            pausar()
+            
+        elif sub_opcion == "f":
             break
         else:
-            print("\n❌ Opción inválida. Seleccione a, b, c, d o e.")
-            input("Presione ENTER para continuar...")
+            print("\n❌ Opción inválida. Seleccione a, b, c, d, e o f.")
+            pausar("Presione ENTER para continuar...")
+
+
+def leer_valores_K():
+    """
+    Solicita una lista de valores de K separados por comas.
+
+    Retorna:
+        list: Valores de K (vacía si la entrada no es válida)
+    """
+    texto = leer("  Valores de K separados por comas (ej. -0.02, -0.05, -0.1): ")
+    try:
+        valores = [float(parte) for parte in texto.replace(";", ",").split(",") if parte.strip()]
+    except ValueError:
+        print("❌ Error: Ingrese solo números separados por comas.")
+        return []
+    if not valores:
+        print("❌ Error: Ingrese al menos un valor de K.")
+    return valores
+
+
+def opcion_graficar_curvas():
+    """Maneja la opción 8: Graficar curvas de enfriamiento para varios K."""
+    mostrar_cabecera("OPCIÓN 7: GRAFICAR CURVAS DE ENFRIAMIENTO")
+    print("\n📝 Ingrese los datos:\n")
+    Tm = solicitar_numero("  Temperatura ambiente Tm (°C): ")
+    if Tm is None:
+        return
+
+    T_inicial = solicitar_numero("  Temperatura inicial T(0) (°C): ")
+    if T_inicial is None:
+        return
+
+    C = calcular_constante_C(T_inicial, Tm)
+    valores_K = leer_valores_K()
+    if not valores_K:
+        pausar("Presione ENTER para continuar...")
+        return
+    tiempo_total = solicitar_numero("  Tiempo total a graficar (minutos): ", valor_minimo=0.001)
+    if tiempo_total is None:
+        return
+
+    try:
+        series = [(f"K = {K:g}", *muestrear_exponencial(Tm, C, K, tiempo_total)) for K in valores_K]
+    except OverflowError:
+        print("\n❌ Error: La temperatura crece demasiado para graficarla. "
+              "Use valores de K menores o un tiempo total más corto.")
+        pausar("Presione ENTER para continuar...")
+        return
+    print()
+    mostrar_grafica(series, titulo=f"📈 T(t) = {Tm:g} + {C:g} * e^(K*t)",
+                    etiqueta_x="t (min)", etiqueta_y="T (°C)")
+    pausar()
+
@@ -6,6 +6,8 @@ Funciones para validar y solicitar datos del usuario.
 =====================================================================
 """
 
+from consola import leer
+
 
 def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
     """
@@ -17,11 +19,11 @@ def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
         valor_maximo (float): Valor máximo permitido (opcional)
     
     Retorna:
-        float: Número ingresado por el usuario
+        float: Número ingresado por el usuario (None si se cancela con Ctrl-C)
     """
     while True:
         try:
-            valor = float(input(mensaje))
+            valor = float(leer(mensaje))
             
             if valor_minimo is not None and valor < valor_minimo:
                 print(f"❌ Error: El valor debe ser mayor o igual a {valor_minimo}")
@@ -34,3 +36,6 @@ def solicitar_numero(mensaje, valor_minimo=None, valor_maximo=None):
             return valor
         except ValueError:
             print("❌ Error: Por favor ingrese un número válido.")
+        except KeyboardInterrupt:
+            print("\n\n❌ Operación cancelada por el usuario")
+            return None
@@ -2,6 +2,9 @@
    NEWTON.JS - JavaScript para la aplicación de Ley de Enfriamiento de Newton
    ===================================================================== */
 
+// Máximo de puntos que el servidor devuelve para la gráfica (se reduce con LTTB)
+const MAX_PUNTOS_GRAFICO = 1000;
+
 // Estado global para mantener datos entre cálculos
 let estadoGlobal = {
     temperatura: { Tm: null, C: null, K: null },
@@ -111,7 +114,8 @@ function initForms() {
             C: parseFloat(document.getElementById('tabla-C').value),
             K: parseFloat(document.getElementById('tabla-K').value),
             tiempo_total: parseFloat(document.getElementById('tabla-tiempo-total').value),
-            intervalo: parseFloat(document.getElementById('tabla-intervalo').value)
+            intervalo: parseFloat(document.getElementById('tabla-intervalo').value),
+            max_points: MAX_PUNTOS_GRAFICO
         };
         
         // Guardar datos en estado global
@@ -348,6 +352,36 @@ async function calcularC(data) {
     }
 }
 
+// Filas para la tabla HTML. La gráfica usa la curva reducida con LTTB
+// (tiempos no uniformes); si el servidor la redujo, la tabla pide la
+// primera página de filas con el intervalo solicitado.
+async function obtenerFilasTabla(url, data, result) {
+    if (!(result.num_puntos_calculados > result.num_puntos)) {
+        return { filas: result.tabla, nota: '' };
+    }
+    const { max_points, ...parametros } = data;
+    try {
+        const response = await fetch(url, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ ...parametros, offset: 0, limit: MAX_PUNTOS_GRAFICO })
+        });
+        const pagina = await response.json();
+        if (pagina.exito) {
+            return {
+                filas: pagina.tabla,
+                nota: `La tabla muestra las primeras ${pagina.num_puntos} de ${pagina.num_puntos_total} filas con el intervalo pedido; la gráfica resume la curva completa en ${result.num_puntos} puntos.`
+            };
+        }
+    } catch (error) {
+        // Sin la página uniforme se muestra la tabla reducida, indicándolo
+    }
+    return {
+        filas: result.tabla,
+        nota: `Tabla reducida: ${result.num_puntos} de ${result.num_puntos_calculados} puntos elegidos para la gráfica, con tiempos no uniformes.`
+    };
+}
+
 // Función: Generar Tabla
 async function generarTabla(data) {
     const resultadoDiv = document.getElementById('resultado-tabla');
@@ -368,6 +402,8 @@ async function generarTabla(data) {
         const result = await response.json();
         
         if (result.exito) {
+            const { filas, nota } = await obtenerFilasTabla('/api/generar-tabla', data, result);
+            
             // Determinar tipo de proceso
             const T0 = result.Tm + result.C;
             let tipoProceso = '';
@@ -405,6 +441,7 @@ async function generarTabla(data) {
                 </div>
                 
                 <!-- Tabla -->
+                ${nota ? `<p class="nota-tabla" style="color: #cbd5e1;">ℹ️ ${nota}</p>` : ''}
                 <div class="table-container">
                     <table>
                         <thead>
@@ -416,7 +453,7 @@ async function generarTabla(data) {
                         <tbody>
             `;
             
-            result.tabla.forEach(fila => {
+            filas.forEach(fila => {
                 tablaHTML += `
                     <tr>
                         <td>${fila.tiempo}</td>
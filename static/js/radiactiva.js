@@ -2,6 +2,9 @@
    RADIACTIVA.JS - JavaScript para Desintegración Radiactiva
    ===================================================================== */
 
+// Máximo de puntos que el servidor devuelve para la gráfica (se reduce con LTTB)
+const MAX_PUNTOS_GRAFICO = 1000;
+
 // Estado global para mantener datos entre cálculos
 let estadoGlobal = {
     n: { N0: null, k: null },
@@ -127,7 +130,8 @@ function initForms() {
             N0: parseFloat(document.getElementById('tabla-N0').value),
             k: parseFloat(document.getElementById('tabla-k').value),
             tiempo_total: parseFloat(document.getElementById('tabla-tiempo-total').value),
-            intervalo: parseFloat(document.getElementById('tabla-intervalo').value)
+            intervalo: parseFloat(document.getElementById('tabla-intervalo').value),
+            max_points: MAX_PUNTOS_GRAFICO
         };
         
         // Guardar datos en estado global
@@ -324,6 +328,36 @@ async function calcularN0(data) {
     }
 }
 
+// Filas para la tabla HTML. La gráfica usa la curva reducida con LTTB
+// (tiempos no uniformes); si el servidor la redujo, la tabla pide la
+// primera página de filas con el intervalo solicitado.
+async function obtenerFilasTabla(url, data, result) {
+    if (!(result.num_puntos_calculados > result.num_puntos)) {
+        return { filas: result.tabla, nota: '' };
+    }
+    const { max_points, ...parametros } = data;
+    try {
+        const response = await fetch(url, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ ...parametros, offset: 0, limit: MAX_PUNTOS_GRAFICO })
+        });
+        const pagina = await response.json();
+        if (pagina.exito) {
+            return {
+                filas: pagina.tabla,
+                nota: `La tabla muestra las primeras ${pagina.num_puntos} de ${pagina.num_puntos_total} filas con el intervalo pedido; la gráfica resume la curva completa en ${result.num_puntos} puntos.`
+            };
+        }
+    } catch (error) {
+        // Sin la página uniforme se muestra la tabla reducida, indicándolo
+    }
+    return {
+        filas: result.tabla,
+        nota: `Tabla reducida: ${result.num_puntos} de ${result.num_puntos_calculados} puntos elegidos para la gráfica, con tiempos no uniformes.`
+    };
+}
+
 async function generarTabla(data) {
     try {
         const response = await fetch('/api/radiactiva/generar-tabla', {
@@ -335,7 +369,8 @@ async function generarTabla(data) {
         const result = await response.json();
         
         if (result.exito) {
-            mostrarTablaResultado(result);
+            const { filas, nota } = await obtenerFilasTabla('/api/radiactiva/generar-tabla', data, result);
+            mostrarTablaResultado(result, filas, nota);
         } else {
             mostrarError('resultado-tabla', result.error);
         }
@@ -596,7 +631,7 @@ function mostrarResultadoN0(result) {
     });
 }
 
-function mostrarTablaResultado(result) {
+function mostrarTablaResultado(result, filas = result.tabla, nota = '') {
     const contenedor = document.getElementById('resultado-tabla');
     contenedor.classList.remove('hidden');
     contenedor.classList.add('resultado-exito');
@@ -611,6 +646,7 @@ function mostrarTablaResultado(result) {
             <p>• Vida media (t½) = ${result.t_media}</p>
             <p>• Puntos de datos: ${result.num_puntos}</p>
         </div>
+        ${nota ? `<p class="nota-tabla">ℹ️ ${nota}</p>` : ''}
         <div class="tabla-wrapper">
             <table class="tabla-datos">
                 <thead>
@@ -623,7 +659,7 @@ function mostrarTablaResultado(result) {
                 <tbody>
     `;
     
-    result.tabla.forEach(row => {
+    filas.forEach(row => {
         tablaHTML += `
             <tr>
                 <td>${row.tiempo}</td>
@@ -0,0 +1,3 @@
+"""
+Módulo web - Infraestructura de la aplicación Flask (métricas, fases, etc.).
+"""
@@ -0,0 +1,345 @@
+"""
+=====================================================================
+    API V2 - API unificada de modelos
+=====================================================================
+Una sola ruta atiende todos los modelos del registro (curvas.registry):
+
+    GET  /api/v2/models                     Lista de modelos
+    GET  /api/v2/models/<nombre>            Descripción de un modelo
+    POST /api/v2/models/<nombre>/evaluate   {parámetros, x | [x...]}
+    POST /api/v2/models/<nombre>/table      {parámetros, total, intervalo,
+                                             max_points | offset, limit}
+    POST /api/v2/models/<nombre>/solve      {incognita, datos del despeje}
+    GET|POST /api/v2/models/<nombre>/export?format=csv|jsonl|npy
+                                            Descarga de la tabla completa
+                                            (parámetros en la URL o en JSON)
+
+La variable x usa el símbolo del modelo ('t' en Newton). Sin
+'incognita', o con el símbolo de la variable, solve despeja x a partir
+del valor de la salida ('T', 'N'...). Agregar un modelo al registro no
+requiere código nuevo en esta capa.
+=====================================================================
+"""
+
+import math
+from array import array
+from itertools import islice
+
+from flask import Response, jsonify, request, stream_with_context
+
+from curvas.basis_cache import CacheBases
+from curvas.deadline import PlazoExcedido, plazo_de_resultado, verificar_plazo
+from curvas.downsampling import reducir_tabla
+from curvas.export import FILAS_POR_BLOQUE, TIPOS_MIME, formato_de_ruta, generar_exportacion
+from curvas.incremental import exponencial_en, generar_exponenciales
+from curvas.registry import registro_modelos
+
+from .json_provider import TablaFija
+from .metrics import registrar_cache, registrar_tamano_tabla
+from .phases import medir_fase
+
+MAX_PUNTOS_RESPUESTA = 1000
+MAX_PUNTOS_CALCULO = 200000
+MAX_PUNTOS_EVALUAR = 10000
+MAX_PUNTOS_EXPORTAR = 2000000
+
+
+def _error(mensaje, codigo=400):
+    return jsonify({'exito': False, 'error': mensaje}), codigo
+
+
+def estimar_puntos_v2(peticion):
+    """
+    Estima los puntos de una petición v2 (solo 'table' calcula tablas).
+
+    Parámetros:
+        peticion (Request): Petición actual
+
+    Retorna:
+        int: Puntos estimados
+    """
+    data = peticion.get_json(silent=True) or {}
+    accion = (peticion.view_args or {}).get('accion')
+    try:
+        if accion == 'evaluate':
+            return max([len(v) for v in data.values() if isinstance(v, list)] or [1])
+        if accion != 'table':
+            return 0
+        puntos = int(float(data['total']) / float(data['intervalo'])) + 1
+        if data.get('limit') is not None:
+            puntos = min(puntos, int(data['limit']))
+    except (KeyError, ValueError, TypeError, ZeroDivisionError, OverflowError, AttributeError):
+        return 0
+    return min(max(puntos, 0), MAX_PUNTOS_CALCULO)
+
+
+def estimar_puntos_exportacion(peticion):
+    """
+    Estima los puntos de una exportación (parámetros en JSON o en la URL).
+
+    Parámetros:
+        peticion (Request): Petición actual
+
+    Retorna:
+        int: Puntos estimados
+    """
+    data = peticion.get_json(silent=True) if peticion.is_json else peticion.args
+    try:
+        puntos = int(float(data['total']) / float(data['intervalo'])) + 1
+    except (KeyError, ValueError, TypeError, ZeroDivisionError, OverflowError, AttributeError):
+        return 0
+    return min(max(puntos, 0), MAX_PUNTOS_EXPORTAR)
+
+
+def es_pesada_v2(peticion):
+    """Retorna True si la petición v2 es una tabla."""
+    return (peticion.view_args or {}).get('accion') == 'table'
+
+
+def _leer_entero(data, nombre, por_defecto, minimo, maximo):
+    valor = data.get(nombre)
+    if valor is None:
+        return por_defecto
+    try:
+        valor = int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f'{nombre} debe ser un número entero')
+    if valor < minimo or valor > maximo:
+        raise ValueError(f'{nombre} debe estar entre {minimo} y {maximo}')
+    return valor
+
+
+def evaluar(modelo, data):
+    """Evalúa la curva en x (número o lista)."""
+    valores = modelo.validar(data)
+    simbolo = modelo.variable.simbolo
+    if simbolo not in data:
+        raise ValueError(f'Falta el parámetro {simbolo}')
+    x = data[simbolo]
+    if isinstance(x, list) and len(x) > MAX_PUNTOS_EVALUAR:
+        raise ValueError(f'Se pueden evaluar como máximo {MAX_PUNTOS_EVALUAR} puntos')
+    try:
+        x = [float(xi) for xi in x] if isinstance(x, list) else float(x)
+    except (TypeError, ValueError):
+        raise ValueError(f'El parámetro {simbolo} debe ser un número o una lista de números')
+
+    with medir_fase('compute'):
+        y = modelo.evaluar(valores, x)
+    return jsonify({
+        'exito': True,
+        'modelo': modelo.nombre,
+        simbolo: x,
+        modelo.salida.simbolo: y,
+        **modelo.datos_informativos(valores)
+    })
+
+
+def resolver(modelo, data):
+    """Despeja la variable independiente o una incógnita propia del modelo."""
+    incognita, resultado = modelo.despejar(data)
+    return jsonify({
+        'exito': True,
+        'modelo': modelo.nombre,
+        'incognita': incognita,
+        **resultado
+    })
+
+
+def _leer_malla(data):
+    """Lee total e intervalo de una petición de tabla."""
+    try:
+        total = float(data['total'])
+        intervalo = float(data['intervalo'])
+    except KeyError as e:
+        raise ValueError(f'Falta el parámetro {e.args[0]}')
+    except (TypeError, ValueError):
+        raise ValueError('total e intervalo deben ser números')
+    if not total > 0 or not intervalo > 0:
+        raise ValueError('total e intervalo deben ser mayores a 0')
+    return total, intervalo
+
+
+def crear_tabla(bases):
+    """Crea la acción 'table' que usa la caché de bases indicada."""
+
+    def tabla(modelo, data):
+        valores = modelo.validar(data)
+        total, intervalo = _leer_malla(data)
+
+        num_puntos_total = int(total / intervalo) + 1
+        paginado = data.get('offset') is not None or data.get('limit') is not None
+        if paginado:
+            if data.get('max_points') is not None:
+                raise ValueError('max_points no se puede combinar con paginación')
+            inicio = _leer_entero(data, 'offset', 0, 0, num_puntos_total)
+            limite = _leer_entero(data, 'limit', MAX_PUNTOS_RESPUESTA, 1, MAX_PUNTOS_RESPUESTA)
+            num_puntos = max(min(limite, num_puntos_total - inicio), 0)
+            max_points = None
+        else:
+            inicio = 0
+            max_points = _leer_entero(data, 'max_points', None, 3, MAX_PUNTOS_RESPUESTA)
+            limite = MAX_PUNTOS_CALCULO if max_points else MAX_PUNTOS_RESPUESTA
+            if num_puntos_total > limite:
+                raise ValueError(f'Demasiados puntos de datos ({num_puntos_total}). '
+                                 f'El máximo es {limite}. Aumenta el intervalo o reduce el total.')
+            num_puntos = num_puntos_total
+
+        _, _, c = modelo.coeficientes(*valores)
+        completo = True
+        with medir_fase('compute'):
+            try:
+                base = bases.obtener(c, intervalo, num_puntos, inicio * intervalo)
+            except PlazoExcedido as e:
+                base, completo = e.parcial if e.parcial is not None else [], False
+            try:
+                with plazo_de_resultado(completo):
+                    filas = modelo.filas_tabla(valores, base, inicio, intervalo)
+            except PlazoExcedido as e:
+                filas, completo = e.parcial, False
+            num_calculados = len(filas)
+            if max_points:
+                with plazo_de_resultado(completo):
+                    filas = reducir_tabla(filas, max_points)
+        registrar_tamano_tabla(num_calculados)
+
+        datos = {
+            'exito': completo,
+            'modelo': modelo.nombre,
+            'tabla': TablaFija(modelo.campos_tabla(), filas),
+            'offset': inicio,
+            'num_puntos': len(filas),
+            'num_puntos_calculados': num_calculados,
+            'num_puntos_total': num_puntos_total,
+            'completo': completo and inicio + num_calculados >= num_puntos_total,
+            **modelo.datos_informativos(valores)
+        }
+        if not datos['completo']:
+            datos['siguiente_offset'] = inicio + num_calculados
+        if not completo:
+            datos['error'] = ('El cálculo superó el tiempo máximo permitido. '
+                              'Usa siguiente_offset para continuar la tabla.')
+            # jsonify serializa en el acto: sin plazo, para no perder las filas
+            with plazo_de_resultado(False):
+                return jsonify(datos), 503
+        return jsonify(datos)
+
+    return tabla
+
+
+def exportar(modelo, data, formato):
+    """
+    Descarga la tabla completa del modelo, calculada y enviada por bloques.
+
+    Parámetros:
+        modelo (ModeloExponencial): Modelo a exportar
+        data (dict): Parámetros del modelo, total e intervalo
+        formato (str): 'csv', 'jsonl' o 'npy'
+
+    Retorna:
+        Response: Respuesta en streaming con el archivo
+    """
+    formato = formato_de_ruta('', formato)
+    valores = modelo.validar(data)
+    total, intervalo = _leer_malla(data)
+    num_puntos = int(total / intervalo) + 1
+    if num_puntos > MAX_PUNTOS_EXPORTAR:
+        raise ValueError(f'Demasiados puntos de datos ({num_puntos}). '
+                         f'El máximo para exportar es {MAX_PUNTOS_EXPORTAR}.')
+    _, _, c = modelo.coeficientes(*valores)
+
+    # Las filas se envían después de los encabezados (estado 200): un
+    # desborde a mitad del archivo lo dejaría truncado. La curva es
+    # monótona, así que basta con revisar el último punto antes de abrir
+    # el flujo (OverflowError -> 400 en la ruta).
+    ultimo = modelo.filas_tabla(valores, (exponencial_en(c, intervalo, num_puntos - 1),),
+                                num_puntos - 1, intervalo)[0]
+    if not all(math.isfinite(v) for v in ultimo):
+        raise OverflowError('El resultado es demasiado grande para estos parámetros')
+
+    def filas():
+        exponenciales = (e for _, _, e in generar_exponenciales(c, intervalo))
+        for inicio in range(0, num_puntos, FILAS_POR_BLOQUE):
+            # Si el plazo vence con la descarga ya empezada, la transferencia
+            # se corta sin el fin del flujo y el cliente la ve incompleta
+            verificar_plazo()
+            base = array('d', islice(exponenciales, min(FILAS_POR_BLOQUE, num_puntos - inicio)))
+            yield from modelo.filas_tabla(valores, base, inicio, intervalo)
+
+    registrar_tamano_tabla(num_puntos)
+    campos = [nombre for nombre, _ in modelo.campos_tabla()]
+    respuesta = Response(stream_with_context(generar_exportacion(campos, filas(), formato, num_puntos)),
+                         mimetype=TIPOS_MIME[formato])
+    respuesta.headers['Content-Disposition'] = f'attachment; filename="{modelo.nombre}.{formato}"'
+    return respuesta
+
+
+def instalar_api_v2(app, bases=None):
+    """
+    Instala las rutas /api/v2/models.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        bases (CacheBases): Caché de bases compartida (opcional)
+    """
+    if bases is None:
+        bases = CacheBases(observador=lambda acierto: registrar_cache('bases', acierto))
+    acciones = {
+        'evaluate': evaluar,
+        'table': crear_tabla(bases),
+        'solve': resolver
+    }
+
+    @app.route('/api/v2/models', methods=['GET'])
+    def api_v2_modelos():
+        """Lista de modelos registrados."""
+        return jsonify({
+            'exito': True,
+            'modelos': [modelo.describir() for modelo in registro_modelos.modelos()]
+        })
+
+    @app.route('/api/v2/models/<nombre>', methods=['GET'])
+    def api_v2_modelo(nombre):
+        """Descripción de un modelo."""
+        try:
+            modelo = registro_modelos.obtener(nombre)
+        except KeyError:
+            return _error(f'Modelo desconocido: {nombre}', 404)
+        return jsonify({'exito': True, **modelo.describir()})
+
+    @app.route('/api/v2/models/<nombre>/export', methods=['GET', 'POST'])
+    def api_v2_exportar(nombre):
+        """Descarga de la tabla de un modelo en CSV, JSON Lines o NPY."""
+        try:
+            modelo = registro_modelos.obtener(nombre)
+        except KeyError:
+            return _error(f'Modelo desconocido: {nombre}', 404)
+        data = request.get_json(silent=True) if request.method == 'POST' else request.args.to_dict()
+        if not isinstance(data, dict):
+            return _error('El cuerpo debe ser un objeto JSON')
+        try:
+            return exportar(modelo, data, request.args.get('format', data.get('format', 'csv')))
+        except ValueError as e:
+            return _error(str(e))
+        except OverflowError:
+            return _error('El resultado es demasiado grande para estos parámetros')
+
+    @app.route('/api/v2/models/<nombre>/<accion>', methods=['POST'])
+    def api_v2_accion(nombre, accion):
+        """Evaluación, tabla o despeje de un modelo."""
+        try:
+            modelo = registro_modelos.obtener(nombre)
+        except KeyError:
+            return _error(f'Modelo desconocido: {nombre}', 404)
+        funcion = acciones.get(accion)
+        if funcion is None:
+            return _error(f'Acción desconocida: {accion}. Opciones: {", ".join(acciones)}', 404)
+
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return _error('El cuerpo debe ser un objeto JSON')
+        try:
+            return funcion(modelo, data)
+        except ValueError as e:
+            return _error(str(e))
+        except OverflowError:
+            return _error('El resultado es demasiado grande para estos parámetros')
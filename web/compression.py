@@ -0,0 +1,246 @@
+"""
+=====================================================================
+    COMPRESSION - Compresión de respuestas y recursos estáticos
+=====================================================================
+Respuestas dinámicas: las respuestas de texto (JSON, HTML, CSS, JS)
+mayores a un umbral se comprimen con brotli (si el módulo está
+instalado y el cliente lo acepta) o con gzip. El tiempo se mide como
+fase 'compress'.
+
+Recursos estáticos: al iniciar se leen los archivos de static/, se
+calcula un hash de su contenido y se guardan precomprimidos en memoria.
+Se sirven en /assets/<ruta con hash> con Cache-Control immutable, así
+el navegador no los vuelve a pedir mientras no cambie su contenido.
+En las plantillas se usa url_recurso('css/styles.css').
+=====================================================================
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+
+from flask import Response, abort, request, url_for
+
+from .phases import medir_fase
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional
+    brotli = None
+
+UMBRAL_BYTES = int(os.environ.get('EC_COMPRESION_MIN_BYTES', '1024'))
+NIVEL_GZIP = int(os.environ.get('EC_COMPRESION_NIVEL', '6'))
+
+TIPOS_COMPRIMIBLES = {
+    'application/json',
+    'application/javascript',
+    'text/javascript',
+    'text/html',
+    'text/css',
+    'text/plain',
+    'image/svg+xml'
+}
+
+CACHE_INMUTABLE = 'public, max-age=31536000, immutable'
+
+
+def comprimir(datos, codificacion, nivel=NIVEL_GZIP):
+    """
+    Comprime bytes con la codificación indicada.
+
+    Parámetros:
+        datos (bytes): Contenido original
+        codificacion (str): 'br' o 'gzip'
+        nivel (int): Nivel de compresión gzip
+
+    Retorna:
+        bytes: Contenido comprimido
+    """
+    if codificacion == 'br':
+        return brotli.compress(datos)
+    return gzip.compress(datos, compresslevel=nivel, mtime=0)
+
+
+def elegir_codificacion(disponibles=None):
+    """
+    Elige la mejor codificación aceptada por el cliente.
+
+    Parámetros:
+        disponibles (iterable): Codificaciones ofrecidas (opcional)
+
+    Retorna:
+        str: 'br', 'gzip' o None si el cliente no acepta ninguna
+    """
+    if disponibles is None:
+        disponibles = ('br', 'gzip') if brotli is not None else ('gzip',)
+    aceptadas = request.accept_encodings
+    mejor, calidad_mejor = None, 0
+    for codificacion in disponibles:
+        calidad = aceptadas[codificacion]
+        if calidad > calidad_mejor:
+            mejor, calidad_mejor = codificacion, calidad
+    return mejor
+
+
+def agregar_vary(response):
+    """
+    Agrega Accept-Encoding a la cabecera Vary de una respuesta.
+
+    Parámetros:
+        response (Response): Respuesta de Flask
+    """
+    vary = response.headers.get('Vary')
+    if not vary:
+        response.headers['Vary'] = 'Accept-Encoding'
+    elif 'accept-encoding' not in vary.lower():
+        response.headers['Vary'] = f"{vary}, Accept-Encoding"
+
+
+class RecursosEstaticos:
+    """
+    Recursos de static/ con URL basada en el hash de su contenido y
+    variantes precomprimidas en memoria.
+
+    Parámetros:
+        directorio (str): Carpeta de archivos estáticos
+    """
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        self.por_nombre = {}   # 'css/styles.css' -> 'css/styles.<hash>.css'
+        self.recursos = {}     # 'css/styles.<hash>.css' -> dict del recurso
+        self.cargar()
+
+    def cargar(self):
+        """Lee, identifica y precomprime todos los archivos estáticos."""
+        por_nombre, recursos = {}, {}
+        for raiz, _, archivos in os.walk(self.directorio):
+            for archivo in archivos:
+                ruta = os.path.join(raiz, archivo)
+                nombre = os.path.relpath(ruta, self.directorio).replace(os.sep, '/')
+                with open(ruta, 'rb') as f:
+                    contenido = f.read()
+
+                huella = hashlib.sha256(contenido).hexdigest()[:12]
+                base, extension = os.path.splitext(nombre)
+                nombre_hash = f"{base}.{huella}{extension}"
+                tipo = mimetypes.guess_type(nombre)[0] or 'application/octet-stream'
+
+                variantes = {None: contenido}
+                if tipo in TIPOS_COMPRIMIBLES and len(contenido) >= UMBRAL_BYTES:
+                    variantes['gzip'] = comprimir(contenido, 'gzip', 9)
+                    if brotli is not None:
+                        variantes['br'] = comprimir(contenido, 'br')
+
+                por_nombre[nombre] = nombre_hash
+                recursos[nombre_hash] = {
+                    'tipo': tipo,
+                    'etag': huella,
+                    'variantes': variantes
+                }
+        self.por_nombre, self.recursos = por_nombre, recursos
+
+    def url(self, nombre):
+        """
+        Retorna la URL con hash de un recurso, o la URL normal de static
+        si el archivo no se conoce.
+
+        Parámetros:
+            nombre (str): Ruta relativa dentro de static/
+
+        Retorna:
+            str: URL del recurso
+        """
+        nombre_hash = self.por_nombre.get(nombre)
+        if nombre_hash is None:
+            return url_for('static', filename=nombre)
+        return url_for('recurso_estatico', nombre_hash=nombre_hash)
+
+    def responder(self, nombre_hash):
+        """
+        Sirve un recurso con hash, comprimido según Accept-Encoding.
+
+        Parámetros:
+            nombre_hash (str): Ruta del recurso con su hash
+
+        Retorna:
+            Response: Respuesta con Cache-Control immutable
+        """
+        recurso = self.recursos.get(nombre_hash)
+        if recurso is None:
+            abort(404)
+
+        if recurso['etag'] in request.if_none_match:
+            response = Response(status=304)
+        else:
+            variantes = recurso['variantes']
+            codificacion = elegir_codificacion([c for c in ('br', 'gzip') if c in variantes])
+            response = Response(variantes[codificacion], mimetype=recurso['tipo'])
+            if codificacion:
+                response.headers['Content-Encoding'] = codificacion
+
+        response.set_etag(recurso['etag'])
+        response.headers['Cache-Control'] = CACHE_INMUTABLE
+        if len(recurso['variantes']) > 1:
+            agregar_vary(response)
+        return response
+
+
+def instalar_compresion(app, umbral=None, nivel=None):
+    """
+    Instala la compresión de respuestas y los recursos estáticos con hash.
+
+    Debe instalarse después de las métricas y Server-Timing para que la
+    fase 'compress' quede incluida en ellas.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        umbral (int): Tamaño mínimo en bytes para comprimir (opcional)
+        nivel (int): Nivel de compresión gzip (opcional)
+
+    Retorna:
+        RecursosEstaticos: Recursos cargados
+    """
+    umbral = UMBRAL_BYTES if umbral is None else umbral
+    nivel = NIVEL_GZIP if nivel is None else nivel
+    recursos = RecursosEstaticos(app.static_folder)
+    app.extensions['ec_recursos'] = recursos
+
+    @app.template_global()
+    def url_recurso(nombre):
+        """URL de un archivo estático (con hash fuera del modo debug)."""
+        if app.debug:
+            # En desarrollo los archivos cambian: se sirven sin caché
+            return url_for('static', filename=nombre)
+        return recursos.url(nombre)
+
+    @app.route('/assets/<path:nombre_hash>')
+    def recurso_estatico(nombre_hash):
+        """Recurso estático identificado por el hash de su contenido."""
+        return recursos.responder(nombre_hash)
+
+    @app.after_request
+    def _comprimir_respuesta(response):
+        if (response.direct_passthrough or response.is_streamed
+                or response.status_code < 200 or response.status_code >= 300
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in TIPOS_COMPRIMIBLES):
+            return response
+
+        agregar_vary(response)
+        if response.content_length is not None and response.content_length < umbral:
+            return response
+        codificacion = elegir_codificacion()
+        if codificacion is None:
+            return response
+
+        with medir_fase('compress'):
+            datos = response.get_data()
+            if len(datos) < umbral:
+                return response
+            response.set_data(comprimir(datos, codificacion, nivel))
+        response.headers['Content-Encoding'] = codificacion
+        return response
+
+    return recursos
@@ -0,0 +1,83 @@
+"""
+=====================================================================
+    DEADLINES - Plazo de cálculo por petición
+=====================================================================
+Cada petición a /api/ recibe un plazo de cálculo (curvas.deadline):
+
+    - la cabecera X-Deadline-Ms del cliente, limitada a EC_PLAZO_MAX_MS
+    - o EC_PLAZO_MS por defecto (10 segundos)
+
+Los bucles largos verifican el plazo y, si vence, abandonan con
+PlazoExcedido. El worker queda libre sin que gunicorn tenga que
+matarlo por timeout. Las tablas responden 503 con las filas ya
+calculadas y un cursor para continuarlas. El resto de endpoints
+responde 503 con un mensaje de error.
+=====================================================================
+"""
+
+import os
+
+from flask import g, jsonify, request
+
+from curvas.deadline import PlazoExcedido, fijar_plazo, restaurar_plazo
+
+PLAZO_MS = float(os.environ.get('EC_PLAZO_MS', '10000'))
+PLAZO_MAX_MS = float(os.environ.get('EC_PLAZO_MAX_MS', '30000'))
+CABECERA_PLAZO = 'X-Deadline-Ms'
+
+
+def leer_plazo_ms(cabecera, por_defecto=PLAZO_MS, maximo=PLAZO_MAX_MS):
+    """
+    Calcula el plazo de una petición.
+
+    Parámetros:
+        cabecera (str): Valor de X-Deadline-Ms (puede ser None)
+        por_defecto (float): Plazo si no hay cabecera válida (ms)
+        maximo (float): Plazo máximo permitido (ms)
+
+    Retorna:
+        float: Plazo en milisegundos
+    """
+    try:
+        plazo = float(cabecera)
+    except (TypeError, ValueError):
+        return por_defecto
+    if not plazo > 0:
+        return por_defecto
+    return min(plazo, maximo)
+
+
+def instalar_plazos(app, por_defecto=None, maximo=None):
+    """
+    Instala el plazo de cálculo por petición en las rutas /api/.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        por_defecto (float): Plazo por defecto en ms (opcional)
+        maximo (float): Plazo máximo en ms (opcional)
+    """
+    por_defecto = PLAZO_MS if por_defecto is None else por_defecto
+    maximo = PLAZO_MAX_MS if maximo is None else maximo
+
+    @app.before_request
+    def _fijar_plazo():
+        if request.path.startswith('/api/'):
+            plazo = leer_plazo_ms(request.headers.get(CABECERA_PLAZO), por_defecto, maximo)
+            g.token_plazo = fijar_plazo(plazo / 1000)
+
+    @app.teardown_request
+    def _restaurar_plazo(_error=None):
+        token = g.pop('token_plazo', None)
+        if token is not None:
+            try:
+                restaurar_plazo(token)
+            except ValueError:
+                # Respuestas en streaming: el contexto ya no es el mismo
+                pass
+
+    @app.errorhandler(PlazoExcedido)
+    def _plazo_excedido(error):
+        return jsonify({
+            'exito': False,
+            'error': 'El cálculo superó el tiempo máximo permitido. Reduce el número de puntos.'
+        }), 503
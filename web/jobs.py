@@ -0,0 +1,691 @@
+"""
+=====================================================================
+    JOBS - Trabajos asíncronos para cálculos largos
+=====================================================================
+Permite enviar cálculos grandes (tablas, barridos de parámetros) a un
+pool local de procesos y consultar después su estado, progreso y
+resultado, o cancelarlos. No necesita broker externo:
+
+    • Una cola de prioridad por worker alimenta un pool acotado de
+      procesos (solo se despacha cuando hay un proceso libre).
+    • El estado de cada trabajo vive en disco (EC_TRABAJOS_DIR), así
+      cualquier worker de gunicorn puede responder por él.
+    • El proceso hijo escribe su progreso en un archivo y revisa un
+      archivo de cancelación entre bloques.
+    • Los resultados se guardan como JSON y expiran tras EC_TRABAJOS_TTL.
+    • Cada trabajo anota el worker que lo encoló (pid y token). Al
+      arrancar, un worker retoma los trabajos en cola de workers que
+      ya no existen y marca con error los que se estaban ejecutando.
+=====================================================================
+"""
+
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import jsonify, request, send_file
+
+from newton_cooling.core.calculations import (
+    calcular_temperatura,
+    calcular_tiempo_para_temperatura
+)
+from desintegracion_radiactiva.core.calculations import (
+    calcular_N_en_tiempo_t,
+    calcular_media_vida
+)
+
+# =====================================================================
+# CONFIGURACIÓN
+# =====================================================================
+DIRECTORIO_TRABAJOS = os.environ.get('EC_TRABAJOS_DIR', 'trabajos')
+PROCESOS_TRABAJOS = int(os.environ.get('EC_TRABAJOS_PROCESOS', min(os.cpu_count() or 1, 4)))
+TTL_TRABAJOS = float(os.environ.get('EC_TRABAJOS_TTL', 3600))
+MAX_COLA_TRABAJOS = int(os.environ.get('EC_TRABAJOS_MAX_COLA', 100))
+
+MAX_PUNTOS_TRABAJO = 2000000
+TAMANO_BLOQUE = 10000
+INTERVALO_PROGRESO = 0.2  # segundos entre escrituras de progreso
+PRIORIDAD_POR_DEFECTO = 5
+
+EN_COLA = 'en_cola'
+EJECUTANDO = 'ejecutando'
+TERMINADO = 'terminado'
+CANCELADO = 'cancelado'
+ERROR = 'error'
+ESTADOS_FINALES = (TERMINADO, CANCELADO, ERROR)
+
+
+class TrabajoCancelado(Exception):
+    """Se lanza dentro del proceso hijo cuando se pidió cancelar el trabajo."""
+
+
+class ColaLlena(Exception):
+    """Se lanza al enviar un trabajo cuando la cola está llena."""
+
+
+# =====================================================================
+# TAREAS (se ejecutan en el proceso hijo)
+# =====================================================================
+def _numero_json(valor):
+    """Convierte infinitos a texto para que el JSON sea válido."""
+    if valor == float('inf'):
+        return 'infinito'
+    return valor
+
+
+def _tabla_enfriamiento(p, reportar):
+    """Tabla T(t) = Tm + C * e^(K*t) sobre una malla regular."""
+    Tm, C, K, intervalo = p['Tm'], p['C'], p['K'], p['intervalo']
+    n = int(p['tiempo_total'] / intervalo) + 1
+    tabla = []
+    for inicio in range(0, n, TAMANO_BLOQUE):
+        fin = min(inicio + TAMANO_BLOQUE, n)
+        tabla.extend([i * intervalo, calcular_temperatura(Tm, C, K, i * intervalo)]
+                     for i in range(inicio, fin))
+        reportar(fin, n)
+    return {'columnas': ['tiempo', 'temperatura'], 'tabla': tabla, 'num_puntos': n}
+
+
+def _tabla_desintegracion(p, reportar):
+    """Tabla N(t) = N0 * e^(-k*t) sobre una malla regular."""
+    N0, k, intervalo = p['N0'], p['k'], p['intervalo']
+    n = int(p['tiempo_total'] / intervalo) + 1
+    tabla = []
+    for inicio in range(0, n, TAMANO_BLOQUE):
+        fin = min(inicio + TAMANO_BLOQUE, n)
+        for i in range(inicio, fin):
+            N = calcular_N_en_tiempo_t(N0, k, i * intervalo)
+            tabla.append([i * intervalo, N, (N / N0) * 100])
+        reportar(fin, n)
+    return {'columnas': ['tiempo', 'N', 'porcentaje'], 'tabla': tabla, 'num_puntos': n}
+
+
+def _valores_barrido(minimo, maximo, pasos):
+    """Retorna `pasos` valores equiespaciados entre minimo y maximo."""
+    paso = (maximo - minimo) / (pasos - 1)
+    return [minimo + i * paso for i in range(pasos)]
+
+
+def _barrido_enfriamiento(p, reportar):
+    """Tiempo para alcanzar T_objetivo en función de K."""
+    Tm, C, T_objetivo = p['Tm'], p['C'], p['T_objetivo']
+    valores = _valores_barrido(p['K_min'], p['K_max'], int(p['pasos']))
+    filas = []
+    for inicio in range(0, len(valores), TAMANO_BLOQUE):
+        bloque = valores[inicio:inicio + TAMANO_BLOQUE]
+        for K in bloque:
+            tiempo = calcular_tiempo_para_temperatura(Tm, C, K, T_objetivo)
+            filas.append([K, _numero_json(tiempo)])
+        reportar(inicio + len(bloque), len(valores))
+    return {'columnas': ['K', 'tiempo'], 'tabla': filas, 'num_puntos': len(filas)}
+
+
+def _barrido_desintegracion(p, reportar):
+    """Cantidad N en un tiempo t fijo en función de k."""
+    N0, t = p['N0'], p['t']
+    valores = _valores_barrido(p['k_min'], p['k_max'], int(p['pasos']))
+    filas = []
+    for inicio in range(0, len(valores), TAMANO_BLOQUE):
+        bloque = valores[inicio:inicio + TAMANO_BLOQUE]
+        for k in bloque:
+            filas.append([k, calcular_N_en_tiempo_t(N0, k, t), calcular_media_vida(k)])
+        reportar(inicio + len(bloque), len(valores))
+    return {'columnas': ['k', 'N', 't_media'], 'tabla': filas, 'num_puntos': len(filas)}
+
+
+# =====================================================================
+# VALIDACIÓN (se ejecuta al enviar, en el proceso web)
+# =====================================================================
+def _validar_malla(p):
+    if p['tiempo_total'] <= 0:
+        raise ValueError('El tiempo total debe ser mayor a 0')
+    if p['intervalo'] <= 0:
+        raise ValueError('El intervalo debe ser mayor a 0')
+    num_puntos = int(p['tiempo_total'] / p['intervalo']) + 1
+    if num_puntos > MAX_PUNTOS_TRABAJO:
+        raise ValueError(f'Demasiados puntos de datos ({num_puntos}). El máximo es {MAX_PUNTOS_TRABAJO}.')
+
+
+def _validar_desintegracion(p):
+    if p['N0'] <= 0:
+        raise ValueError('La cantidad inicial N0 debe ser mayor a 0')
+    if p['k'] <= 0:
+        raise ValueError('La constante k debe ser mayor a 0')
+    _validar_malla(p)
+
+
+def _validar_pasos(p):
+    if not 2 <= p['pasos'] <= MAX_PUNTOS_TRABAJO:
+        raise ValueError(f'pasos debe estar entre 2 y {MAX_PUNTOS_TRABAJO}')
+
+
+def _validar_barrido_enfriamiento(p):
+    _validar_pasos(p)
+    if p['K_min'] >= p['K_max']:
+        raise ValueError('K_min debe ser menor que K_max')
+    if p['K_min'] * p['K_max'] <= 0:
+        # Con K = 0 la temperatura no cambia y el tiempo no está definido
+        raise ValueError('Los valores de K deben ser distintos de 0 y del mismo signo')
+
+
+def _validar_barrido_desintegracion(p):
+    _validar_pasos(p)
+    if p['N0'] <= 0:
+        raise ValueError('La cantidad inicial N0 debe ser mayor a 0')
+    if p['t'] < 0:
+        raise ValueError('El tiempo debe ser mayor o igual a 0')
+    if p['k_min'] <= 0 or p['k_max'] <= 0:
+        raise ValueError('Los valores de k deben ser mayores a 0')
+
+
+# tipo -> (campos numéricos, validación, tarea)
+TAREAS = {
+    'tabla_enfriamiento': (
+        ('Tm', 'C', 'K', 'tiempo_total', 'intervalo'), _validar_malla, _tabla_enfriamiento),
+    'tabla_desintegracion': (
+        ('N0', 'k', 'tiempo_total', 'intervalo'), _validar_desintegracion, _tabla_desintegracion),
+    'barrido_enfriamiento': (
+        ('Tm', 'C', 'T_objetivo', 'K_min', 'K_max', 'pasos'), _validar_barrido_enfriamiento,
+        _barrido_enfriamiento),
+    'barrido_desintegracion': (
+        ('N0', 't', 'k_min', 'k_max', 'pasos'), _validar_barrido_desintegracion, _barrido_desintegracion),
+}
+
+
+def estimar_puntos_trabajo(peticion):
+    """
+    Estima los puntos de un trabajo enviado (para el límite de tasa).
+
+    Parámetros:
+        peticion (Request): Petición actual
+
+    Retorna:
+        int: Filas de la tabla o pasos del barrido
+    """
+    data = peticion.get_json(silent=True)
+    try:
+        parametros = data['parametros']
+        if 'pasos' in TAREAS[data['tipo']][0]:
+            puntos = int(float(parametros['pasos']))
+        else:
+            puntos = int(float(parametros['tiempo_total']) / float(parametros['intervalo'])) + 1
+    except (KeyError, ValueError, TypeError, ZeroDivisionError, OverflowError):
+        return 0
+    return min(max(puntos, 0), MAX_PUNTOS_TRABAJO)
+
+
+# =====================================================================
+# ARCHIVOS DE UN TRABAJO
+# =====================================================================
+def _ruta(directorio, id_trabajo, sufijo):
+    return os.path.join(directorio, f"{id_trabajo}{sufijo}")
+
+
+def _escribir_json(ruta, datos):
+    """Escribe un JSON de forma atómica."""
+    temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo)
+    os.replace(temporal, ruta)
+
+
+def _leer_json(ruta):
+    try:
+        with open(ruta, encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return None
+
+
+class _Progreso:
+    """Reporta el progreso del trabajo y detecta cancelaciones (proceso hijo)."""
+
+    def __init__(self, directorio, id_trabajo):
+        self.ruta_progreso = _ruta(directorio, id_trabajo, '.progreso')
+        self.ruta_cancelar = _ruta(directorio, id_trabajo, '.cancelar')
+        self._ultimo = 0.0
+
+    def __call__(self, hechos, total):
+        ahora = time.monotonic()
+        if ahora - self._ultimo < INTERVALO_PROGRESO and hechos < total:
+            return
+        self._ultimo = ahora
+        if os.path.exists(self.ruta_cancelar):
+            raise TrabajoCancelado()
+        with open(self.ruta_progreso, 'w', encoding='utf-8') as archivo:
+            archivo.write(f"{hechos / total:.4f}")
+
+
+def _ejecutar_trabajo(directorio, id_trabajo, tipo, parametros):
+    """
+    Ejecuta un trabajo en el proceso hijo y guarda su resultado en disco.
+
+    Retorna:
+        tuple: (estado final, mensaje de error o None)
+    """
+    tarea = TAREAS[tipo][2]
+    try:
+        resultado = tarea(parametros, _Progreso(directorio, id_trabajo))
+    except TrabajoCancelado:
+        return CANCELADO, None
+    except Exception as e:
+        return ERROR, str(e)
+
+    resultado.update({'exito': True, 'id': id_trabajo, 'tipo': tipo, 'parametros': parametros})
+    _escribir_json(_ruta(directorio, id_trabajo, '.resultado.json'), resultado)
+    return TERMINADO, None
+
+
+# =====================================================================
+# GESTOR DE TRABAJOS (proceso web)
+# =====================================================================
+class GestorTrabajos:
+    """
+    Cola de prioridad + pool acotado de procesos con estado en disco.
+
+    Parámetros:
+        directorio (str): Directorio donde se guardan estados y resultados
+        procesos (int): Número máximo de trabajos simultáneos
+        ttl (float): Segundos que se conserva un trabajo terminado
+        max_cola (int): Trabajos pendientes máximos por worker
+    """
+
+    def __init__(self, directorio=DIRECTORIO_TRABAJOS, procesos=PROCESOS_TRABAJOS,
+                 ttl=TTL_TRABAJOS, max_cola=MAX_COLA_TRABAJOS):
+        self.directorio = directorio
+        self.procesos = procesos
+        self.ttl = ttl
+        self.max_cola = max_cola
+        self._cola = queue.PriorityQueue()
+        self._secuencia = itertools.count()
+        self._libres = threading.Semaphore(procesos)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._despachador = None
+        # Distingue a este worker de uno anterior que tuvo el mismo pid
+        self._token = uuid.uuid4().hex
+
+    def _iniciar(self):
+        """Crea el pool y el hilo despachador la primera vez que se necesitan."""
+        with self._lock:
+            if self._despachador is not None:
+                return
+            os.makedirs(self.directorio, exist_ok=True)
+            self._registrar_worker()
+            self._pool = self._crear_pool()
+            self._despachador = threading.Thread(
+                target=self._despachar, name='despachador-trabajos', daemon=True)
+            self._despachador.start()
+
+    def _crear_pool(self):
+        """Crea el pool de procesos (spawn: el worker web puede tener hilos)."""
+        return ProcessPoolExecutor(max_workers=self.procesos,
+                                   mp_context=multiprocessing.get_context('spawn'))
+
+    def enviar(self, tipo, parametros, prioridad=PRIORIDAD_POR_DEFECTO):
+        """
+        Valida y encola un trabajo.
+
+        Parámetros:
+            tipo (str): Tipo de trabajo (clave de TAREAS)
+            parametros (dict): Parámetros del cálculo
+            prioridad (int): Menor número = se ejecuta antes
+
+        Retorna:
+            dict: Estado inicial del trabajo
+        """
+        if tipo not in TAREAS:
+            raise ValueError(f"Tipo de trabajo desconocido: {tipo}")
+        campos, validar, _ = TAREAS[tipo]
+        parametros = {campo: float(parametros[campo]) for campo in campos}
+        for campo, valor in parametros.items():
+            if not math.isfinite(valor):
+                raise ValueError(f'{campo} debe ser un número finito')
+        validar(parametros)
+
+        self._iniciar()
+        self.limpiar_expirados()
+        if self._cola.qsize() >= self.max_cola:
+            raise ColaLlena()
+
+        id_trabajo = uuid.uuid4().hex
+        meta = {
+            'id': id_trabajo,
+            'tipo': tipo,
+            'parametros': parametros,
+            'prioridad': prioridad,
+            'estado': EN_COLA,
+            'creado': time.time(),
+            'worker': [os.getpid(), self._token],
+        }
+        _escribir_json(_ruta(self.directorio, id_trabajo, '.json'), meta)
+        self._cola.put((prioridad, next(self._secuencia), id_trabajo))
+        return meta
+
+    def estado(self, id_trabajo):
+        """
+        Retorna el estado de un trabajo (de cualquier worker).
+
+        Retorna:
+            dict: Metadatos con 'progreso', o None si no existe
+        """
+        if not _es_id_valido(id_trabajo):
+            return None
+        meta = _leer_json(_ruta(self.directorio, id_trabajo, '.json'))
+        if meta is None:
+            return None
+
+        if meta['estado'] == TERMINADO:
+            meta['progreso'] = 1.0
+        elif meta['estado'] == EJECUTANDO:
+            try:
+                with open(_ruta(self.directorio, id_trabajo, '.progreso'), encoding='utf-8') as archivo:
+                    meta['progreso'] = float(archivo.read() or 0)
+            except (OSError, ValueError):
+                meta['progreso'] = 0.0
+        else:
+            meta['progreso'] = 0.0
+        return meta
+
+    def ruta_resultado(self, id_trabajo):
+        """Retorna la ruta del archivo de resultado de un trabajo."""
+        return _ruta(self.directorio, id_trabajo, '.resultado.json')
+
+    def cancelar(self, id_trabajo):
+        """
+        Pide cancelar un trabajo en cola o en ejecución.
+
+        Retorna:
+            dict: Estado del trabajo tras la petición, o None si no existe
+        """
+        meta = self.estado(id_trabajo)
+        if meta is None or meta['estado'] in ESTADOS_FINALES:
+            return meta
+
+        with open(_ruta(self.directorio, id_trabajo, '.cancelar'), 'w', encoding='utf-8'):
+            pass
+        if meta['estado'] == EN_COLA:
+            # El despachador lo descartará al sacarlo de la cola
+            meta = self._finalizar(id_trabajo, CANCELADO)
+        return meta
+
+    def _ruta_worker(self, pid):
+        return os.path.join(self.directorio, f"worker-{pid}.worker")
+
+    def _registrar_worker(self):
+        """Anota el token de este worker para que otros reconozcan sus trabajos."""
+        with open(self._ruta_worker(os.getpid()), 'w', encoding='utf-8') as archivo:
+            archivo.write(self._token)
+
+    def _es_huerfano(self, meta):
+        """Indica si el worker que encoló un trabajo ya no existe."""
+        dueno = meta.get('worker')
+        if not dueno:
+            return True
+        pid, token = dueno
+        if pid == os.getpid():
+            return token != self._token
+        try:
+            with open(self._ruta_worker(pid), encoding='utf-8') as archivo:
+                actual = archivo.read()
+        except OSError:
+            return True
+        return actual != token or not _proceso_existe(pid)
+
+    def recuperar_huerfanos(self):
+        """
+        Retoma los trabajos de workers que ya no existen.
+
+        La cola de cada worker vive en memoria, así que si el worker se
+        reinicia sus trabajos quedarían en cola para siempre. Los trabajos
+        en cola se encolan de nuevo en este worker; los que se estaban
+        ejecutando se marcan con error (su proceso hijo murió con el
+        worker). Un archivo .reclamo creado en exclusiva evita que dos
+        workers que arrancan a la vez retomen el mismo trabajo.
+
+        Retorna:
+            int: Número de trabajos encolados de nuevo
+        """
+        if not os.path.isdir(self.directorio):
+            return 0
+        self._registrar_worker()
+
+        retomados = 0
+        for nombre in os.listdir(self.directorio):
+            if nombre.startswith('worker-') and nombre.endswith('.worker'):
+                pid = nombre[len('worker-'):-len('.worker')]
+                if pid.isdigit() and not _proceso_existe(int(pid)):
+                    try:
+                        os.remove(os.path.join(self.directorio, nombre))
+                    except OSError:
+                        pass
+                continue
+            if not nombre.endswith('.json') or nombre.endswith('.resultado.json'):
+                continue
+            meta = _leer_json(os.path.join(self.directorio, nombre))
+            if meta is None or meta['estado'] not in (EN_COLA, EJECUTANDO) or not self._es_huerfano(meta):
+                continue
+
+            ruta_reclamo = _ruta(self.directorio, meta['id'], '.reclamo')
+            try:
+                os.close(os.open(ruta_reclamo, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except OSError:
+                continue
+            try:
+                # Se vuelve a leer: otro worker pudo retomarlo antes del reclamo
+                ruta = _ruta(self.directorio, meta['id'], '.json')
+                meta = _leer_json(ruta)
+                if meta is None or not self._es_huerfano(meta):
+                    continue
+                if meta['estado'] == EJECUTANDO:
+                    self._finalizar(meta['id'], ERROR, 'El worker que ejecutaba el trabajo se detuvo')
+                elif meta['estado'] == EN_COLA:
+                    meta['worker'] = [os.getpid(), self._token]
+                    _escribir_json(ruta, meta)
+                    self._cola.put((meta['prioridad'], next(self._secuencia), meta['id']))
+                    retomados += 1
+            finally:
+                os.remove(ruta_reclamo)
+
+        if retomados:
+            self._iniciar()
+        return retomados
+
+    def limpiar_expirados(self):
+        """Borra los archivos de trabajos cuyo plazo de conservación venció."""
+        if not os.path.isdir(self.directorio):
+            return
+        ahora = time.time()
+        for nombre in os.listdir(self.directorio):
+            if not nombre.endswith('.json') or nombre.endswith('.resultado.json'):
+                continue
+            meta = _leer_json(os.path.join(self.directorio, nombre))
+            if meta is None or meta.get('expira', ahora + 1) > ahora:
+                continue
+            for sufijo in ('.json', '.resultado.json', '.progreso', '.cancelar'):
+                try:
+                    os.remove(_ruta(self.directorio, meta['id'], sufijo))
+                except OSError:
+                    pass
+
+    def _finalizar(self, id_trabajo, estado, error=None):
+        """Marca un trabajo como terminado, cancelado o con error."""
+        ruta = _ruta(self.directorio, id_trabajo, '.json')
+        meta = _leer_json(ruta)
+        if meta is None:
+            return None
+        meta['estado'] = estado
+        meta['finalizado'] = time.time()
+        meta['expira'] = meta['finalizado'] + self.ttl
+        if error:
+            meta['error'] = error
+        _escribir_json(ruta, meta)
+        return meta
+
+    def _reemplazar_pool(self, roto):
+        """Cambia un pool roto (murió un proceso hijo) por uno nuevo, una sola vez."""
+        with self._lock:
+            if self._pool is roto:
+                roto.shutdown(wait=False)
+                self._pool = self._crear_pool()
+
+    def _despachar(self):
+        """Saca trabajos de la cola por prioridad cuando hay un proceso libre."""
+        while True:
+            prioridad, secuencia, id_trabajo = self._cola.get()
+            self._libres.acquire()
+
+            ruta = _ruta(self.directorio, id_trabajo, '.json')
+            meta = _leer_json(ruta)
+            if meta is None or meta['estado'] != EN_COLA:
+                self._libres.release()
+                continue
+
+            meta['estado'] = EJECUTANDO
+            meta['iniciado'] = time.time()
+            _escribir_json(ruta, meta)
+
+            pool = self._pool
+            try:
+                futuro = pool.submit(_ejecutar_trabajo, self.directorio, id_trabajo,
+                                     meta['tipo'], meta['parametros'])
+            except BrokenProcessPool:
+                # El trabajo no llegó a correr: vuelve a la cola con su turno
+                self._reemplazar_pool(pool)
+                self._reencolar(meta, (prioridad, secuencia, id_trabajo))
+                self._libres.release()
+                continue
+            futuro.add_done_callback(
+                lambda f, item=(prioridad, secuencia, id_trabajo), pool=pool:
+                self._al_terminar(item, f, pool))
+
+    def _reencolar(self, meta, item):
+        """Devuelve a la cola un trabajo que no terminó por un pool roto."""
+        meta['estado'] = EN_COLA
+        meta.pop('iniciado', None)
+        _escribir_json(_ruta(self.directorio, meta['id'], '.json'), meta)
+        self._cola.put(item)
+
+    def _al_terminar(self, item, futuro, pool):
+        """Registra el resultado de un proceso hijo y libera su lugar."""
+        id_trabajo = item[2]
+        try:
+            estado, error = futuro.result()
+        except BrokenProcessPool as e:
+            # Murió un proceso hijo: los trabajos siguientes usan un pool nuevo.
+            # El trabajo se reintenta una vez (pudo caer por otro hijo); si
+            # vuelve a romper el pool, es él quien lo rompe y queda con error.
+            self._reemplazar_pool(pool)
+            meta = _leer_json(_ruta(self.directorio, id_trabajo, '.json'))
+            if meta is not None and meta['estado'] == EJECUTANDO and not meta.get('reintentado'):
+                meta['reintentado'] = True
+                self._reencolar(meta, item)
+                self._libres.release()
+                return
+            estado, error = ERROR, str(e)
+        except Exception as e:
+            estado, error = ERROR, str(e)
+        self._libres.release()
+        self._finalizar(id_trabajo, estado, error)
+
+
+def _proceso_existe(pid):
+    """Retorna False si el proceso terminó (fuera de POSIX se asume que existe)."""
+    if os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _es_id_valido(id_trabajo):
+    """Evita rutas arbitrarias: los ids son hexadecimales de 32 caracteres."""
+    return len(id_trabajo) == 32 and all(c in '0123456789abcdef' for c in id_trabajo)
+
+
+# =====================================================================
+# RUTAS
+# =====================================================================
+def instalar_trabajos(app, gestor=None):
+    """
+    Registra las rutas /api/jobs en la aplicación.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        gestor (GestorTrabajos): Gestor a usar (opcional)
+
+    Retorna:
+        GestorTrabajos: Gestor de trabajos instalado
+    """
+    gestor = gestor or GestorTrabajos()
+    gestor.recuperar_huerfanos()
+
+    @app.route('/api/jobs', methods=['POST'])
+    def api_enviar_trabajo():
+        """
+        Envía un trabajo al pool.
+
+        Espera: {tipo, parametros, prioridad (opcional)}
+        Retorna: {id, estado, exito}
+        """
+        try:
+            data = request.get_json()
+            prioridad = int(data.get('prioridad', PRIORIDAD_POR_DEFECTO))
+            meta = gestor.enviar(data['tipo'], data['parametros'], prioridad)
+        except ColaLlena:
+            return jsonify({
+                'exito': False,
+                'error': 'Hay demasiados trabajos en cola. Intenta más tarde.'
+            }), 503
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            return jsonify({
+                'exito': False,
+                'error': f'Datos inválidos: {e}'
+            }), 400
+
+        return jsonify({'exito': True, **meta}), 202
+
+    @app.route('/api/jobs/<id_trabajo>', methods=['GET'])
+    def api_estado_trabajo(id_trabajo):
+        """Retorna el estado y progreso de un trabajo."""
+        meta = gestor.estado(id_trabajo)
+        if meta is None:
+            return jsonify({'exito': False, 'error': 'Trabajo no encontrado'}), 404
+        return jsonify({'exito': True, **meta})
+
+    @app.route('/api/jobs/<id_trabajo>/resultado', methods=['GET'])
+    def api_resultado_trabajo(id_trabajo):
+        """Retorna el resultado de un trabajo terminado."""
+        meta = gestor.estado(id_trabajo)
+        if meta is None:
+            return jsonify({'exito': False, 'error': 'Trabajo no encontrado'}), 404
+        if meta['estado'] != TERMINADO:
+            return jsonify({
+                'exito': False,
+                'error': f"El trabajo no está terminado (estado: {meta['estado']})",
+                'estado': meta['estado']
+            }), 409
+        return send_file(os.path.abspath(gestor.ruta_resultado(id_trabajo)),
+                         mimetype='application/json')
+
+    @app.route('/api/jobs/<id_trabajo>', methods=['DELETE'])
+    def api_cancelar_trabajo(id_trabajo):
+        """Cancela un trabajo en cola o en ejecución."""
+        meta = gestor.cancelar(id_trabajo)
+        if meta is None:
+            return jsonify({'exito': False, 'error': 'Trabajo no encontrado'}), 404
+        return jsonify({'exito': True, **meta})
+
+    return gestor
@@ -0,0 +1,187 @@
+"""
+=====================================================================
+    JSON PROVIDER - Serialización JSON rápida para Flask
+=====================================================================
+Proveedor JSON de Flask con codificador intercambiable:
+
+    orjson  - si está instalado (mucho más rápido que la biblioteca
+              estándar, serializa arreglos de NumPy directamente)
+    stdlib  - módulo json de Python
+
+La variable EC_JSON elige el codificador ('auto', 'orjson' o 'stdlib').
+
+Tablas grandes: TablaFija representa filas numéricas con un número
+fijo de decimales por campo. En lugar de llamar a round() por cada
+valor, todas las filas se formatean en bloque con una plantilla '%.Nf'
+(curvas.formato.aplicar_plantilla, una operación '%' por cada bloque
+de FILAS_POR_BLOQUE filas; entre bloques se verifica el plazo de
+cálculo) y el texto resultante se inserta tal cual en el documento
+JSON.
+Acepta listas, array('d') o columnas de NumPy.
+=====================================================================
+"""
+
+import json
+import os
+import secrets
+from array import array
+
+from flask.json.provider import DefaultJSONProvider
+
+from curvas.deadline import verificar_plazo
+from curvas.formato import aplicar_plantilla
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+
+# Filas formateadas entre verificaciones del plazo de cálculo
+FILAS_POR_BLOQUE = 16384
+
+
+class TablaFija:
+    """
+    Tabla numérica que se serializa como lista de objetos con decimales fijos.
+
+    Parámetros:
+        campos (list): Pares (nombre, decimales) en el orden de las filas
+        filas (iterable): Tuplas de valores, una por fila
+    """
+
+    def __init__(self, campos, filas):
+        self.campos = list(campos)
+        self.filas = filas
+
+    @classmethod
+    def desde_columnas(cls, campos, columnas):
+        """
+        Crea una tabla a partir de columnas (listas, array o NumPy).
+
+        Parámetros:
+            campos (list): Pares (nombre, decimales)
+            columnas (list): Una secuencia de valores por campo
+
+        Retorna:
+            TablaFija: Tabla con las columnas combinadas en filas
+        """
+        return cls(campos, zip(*columnas))
+
+    def codificar(self):
+        """
+        Formatea todas las filas en bloque.
+
+        Retorna:
+            bytes: Texto JSON de la lista de objetos
+
+        Lanza:
+            ValueError: Si algún valor no es finito (inf o nan)
+            PlazoExcedido: Si vence el plazo de cálculo
+        """
+        plantilla = '{' + ','.join(
+            f'{json.dumps(nombre)}:%.{int(decimales)}f' for nombre, decimales in self.campos
+        ) + '}'
+        filas = self.filas if isinstance(self.filas, (list, tuple)) else list(self.filas)
+        bloques = []
+        for inicio in range(0, len(filas), FILAS_POR_BLOQUE):
+            verificar_plazo()
+            bloques.append(aplicar_plantilla(plantilla, filas[inicio:inicio + FILAS_POR_BLOQUE], ','))
+        texto = '[' + ','.join(bloques) + ']'
+        # '%f' produce 'inf' o 'nan' para valores no finitos: no es JSON válido
+        if '":inf' in texto or '":-inf' in texto or '":nan' in texto:
+            raise ValueError('La tabla contiene valores no finitos')
+        return texto.encode('utf-8')
+
+    def como_lista(self):
+        """
+        Convierte la tabla en lista de diccionarios con valores redondeados.
+
+        Retorna:
+            list: Un diccionario por fila
+        """
+        return [
+            {nombre: round(float(valor), decimales)
+             for (nombre, decimales), valor in zip(self.campos, fila)}
+            for fila in self.filas
+        ]
+
+
+class ProveedorJSONRapido(DefaultJSONProvider):
+    """
+    Proveedor JSON de Flask con orjson opcional y soporte de TablaFija,
+    array('d') y arreglos de NumPy.
+    """
+
+    codificador = os.environ.get('EC_JSON', 'auto')
+
+    def __init__(self, app):
+        super().__init__(app)
+        if self.codificador == 'orjson' and orjson is None:
+            raise RuntimeError('EC_JSON=orjson pero orjson no está instalado')
+        self.usar_orjson = orjson is not None and self.codificador != 'stdlib'
+
+    @staticmethod
+    def default(o):
+        """Convierte los tipos propios antes de delegar en Flask."""
+        if isinstance(o, TablaFija):
+            return o.como_lista()
+        if isinstance(o, array) or hasattr(o, 'tolist'):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        """Serializa obj a texto JSON."""
+        if kwargs:
+            # Opciones propias de json.dumps: se usa el camino de Flask
+            return super().dumps(obj, **kwargs)
+        return self.codificar(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        """Crea la respuesta JSON sin pasar por texto intermedio."""
+        obj = self._prepare_response_obj(args, kwargs)
+        sangria = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.codificar(obj, sangria) + b'\n',
+                                        mimetype=self.mimetype)
+
+    def codificar(self, obj, sangria=False):
+        """
+        Serializa obj a bytes JSON.
+
+        Parámetros:
+            obj: Objeto a serializar
+            sangria (bool): Si se indenta la salida
+
+        Retorna:
+            bytes: Documento JSON en UTF-8
+        """
+        marca = secrets.token_hex(8)
+        tablas = []
+
+        def por_defecto(o):
+            if isinstance(o, TablaFija):
+                tablas.append(o)
+                return f"@{marca}:{len(tablas) - 1}@"
+            return self.default(o)
+
+        datos = None
+        if self.usar_orjson:
+            opciones = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+            if self.sort_keys:
+                opciones |= orjson.OPT_SORT_KEYS
+            if sangria:
+                opciones |= orjson.OPT_INDENT_2
+            try:
+                datos = orjson.dumps(obj, default=por_defecto, option=opciones)
+            except TypeError:
+                # Enteros de más de 64 bits u otros tipos que orjson no admite
+                tablas.clear()
+        if datos is None:
+            datos = json.dumps(obj, default=por_defecto, ensure_ascii=self.ensure_ascii,
+                               sort_keys=self.sort_keys, indent=2 if sangria else None,
+                               separators=None if sangria else (',', ':')).encode('utf-8')
+
+        for i, tabla in enumerate(tablas):
+            datos = datos.replace(f'"@{marca}:{i}@"'.encode('ascii'), tabla.codificar(), 1)
+        return datos
@@ -0,0 +1,397 @@
+"""
+=====================================================================
+    METRICS - Métricas estilo Prometheus
+=====================================================================
+Registra peticiones, códigos de estado, latencias por fase, aciertos
+de caché y tamaños de tabla, y las expone en texto en /metrics.
+
+Cada hilo escribe en su propio fragmento (sin bloqueos en el camino
+caliente). Cuando un hilo termina (el servidor de werkzeug crea uno por
+petición), su fragmento se suma a un fragmento compartido de hilos
+terminados y se descarta, así la lista no crece con cada petición.
+
+Con la variable de entorno EC_METRICAS_DIR cada worker de gunicorn
+vuelca periódicamente su instantánea a un archivo de ese directorio, y
+/metrics combina los archivos de todos los workers. Los archivos de
+procesos que ya no existen se borran al combinar.
+=====================================================================
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+
+from flask import Response, request
+
+from .phases import cerrar_fases, instalar_fases
+
+# =====================================================================
+# DEFINICIÓN DE MÉTRICAS
+# =====================================================================
+LIMITES_LATENCIA = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIMITES_PUNTOS = (10, 100, 1000, 10000, 100000, 1000000)
+
+METRICAS = {
+    'ec_http_requests_total': (
+        'counter', 'Peticiones HTTP atendidas por ruta, método y estado'),
+    'ec_http_request_duration_seconds': (
+        'histogram', 'Latencia total de la petición por ruta'),
+    'ec_http_request_phase_seconds': (
+        'histogram', 'Latencia por fase (parse, compute, serialize) y ruta'),
+    'ec_cache_requests_total': (
+        'counter', 'Consultas a cachés por resultado (hit/miss)'),
+    'ec_tabla_puntos': (
+        'histogram', 'Puntos calculados por tabla'),
+    'ec_rechazos_total': (
+        'counter', 'Peticiones rechazadas por límite de tasa o concurrencia'),
+}
+
+RUTA_DESCONOCIDA = 'desconocida'
+PREFIJO_ARCHIVO = 'metricas-'
+
+
+class RegistroMetricas:
+    """
+    Registro de contadores e histogramas con fragmentos por hilo.
+
+    Parámetros:
+        directorio (str): Directorio compartido entre workers (opcional)
+        intervalo_volcado (float): Segundos mínimos entre volcados a disco
+    """
+
+    def __init__(self, directorio=None, intervalo_volcado=1.0):
+        self.directorio = directorio
+        self.intervalo_volcado = intervalo_volcado
+        self._local = threading.local()
+        # Pares (hilo, fragmento) de los hilos que registraron métricas
+        self._fragmentos = []
+        self._terminados = {'contadores': {}, 'histogramas': {}}
+        self._lock_fragmentos = threading.Lock()
+        self._lock_volcado = threading.Lock()
+        self._ultimo_volcado = 0.0
+
+    def _fragmento(self):
+        """Retorna el fragmento del hilo actual, creándolo si no existe."""
+        fragmento = getattr(self._local, 'fragmento', None)
+        if fragmento is None:
+            fragmento = {'contadores': {}, 'histogramas': {}}
+            with self._lock_fragmentos:
+                self._recoger_terminados()
+                self._fragmentos.append((threading.current_thread(), fragmento))
+            self._local.fragmento = fragmento
+        return fragmento
+
+    def _recoger_terminados(self):
+        """
+        Suma los fragmentos de hilos terminados al fragmento compartido.
+
+        Se llama con _lock_fragmentos tomado. Un hilo terminado ya no
+        escribe en su fragmento, así que se puede sumar sin copiarlo.
+        """
+        vivos = []
+        for hilo, fragmento in self._fragmentos:
+            if hilo.is_alive():
+                vivos.append((hilo, fragmento))
+            else:
+                _sumar_fragmento(self._terminados, fragmento)
+        self._fragmentos = vivos
+
+    def incrementar(self, nombre, etiquetas, valor=1):
+        """
+        Incrementa un contador.
+
+        Parámetros:
+            nombre (str): Nombre de la métrica
+            etiquetas (tuple): Pares (etiqueta, valor) ordenados
+            valor (float): Cantidad a sumar
+        """
+        contadores = self._fragmento()['contadores']
+        clave = (nombre, etiquetas)
+        contadores[clave] = contadores.get(clave, 0) + valor
+
+    def observar(self, nombre, etiquetas, valor, limites):
+        """
+        Registra una observación en un histograma.
+
+        Parámetros:
+            nombre (str): Nombre de la métrica
+            etiquetas (tuple): Pares (etiqueta, valor) ordenados
+            valor (float): Valor observado
+            limites (tuple): Límites superiores de los buckets
+        """
+        histogramas = self._fragmento()['histogramas']
+        clave = (nombre, etiquetas)
+        datos = histogramas.get(clave)
+        if datos is None:
+            # [conteo por bucket..., conteo +Inf, suma, total]
+            datos = [0] * (len(limites) + 1) + [0.0, 0]
+            histogramas[clave] = datos
+        datos[bisect.bisect_left(limites, valor)] += 1
+        datos[-2] += valor
+        datos[-1] += 1
+
+    def instantanea(self):
+        """
+        Combina los fragmentos de todos los hilos de este proceso.
+
+        Retorna:
+            dict: {'contadores': {...}, 'histogramas': {...}}
+        """
+        datos = {'contadores': {}, 'histogramas': {}}
+        with self._lock_fragmentos:
+            self._recoger_terminados()
+            fragmentos = [fragmento for _, fragmento in self._fragmentos]
+            _sumar_fragmento(datos, self._terminados)
+
+        for fragmento in fragmentos:
+            _sumar_fragmento(datos, {'contadores': fragmento['contadores'].copy(),
+                                     'histogramas': fragmento['histogramas'].copy()})
+        return datos
+
+    def volcar(self, forzar=False):
+        """
+        Escribe la instantánea del proceso en el directorio compartido.
+
+        Parámetros:
+            forzar (bool): Ignora el intervalo mínimo entre volcados
+        """
+        if not self.directorio:
+            return
+        # Con workers gthread varios hilos terminan peticiones a la vez:
+        # solo uno vuelca en cada intervalo
+        with self._lock_volcado:
+            ahora = time.monotonic()
+            if not forzar and ahora - self._ultimo_volcado < self.intervalo_volcado:
+                return
+            self._ultimo_volcado = ahora
+
+        datos = self.instantanea()
+        serializable = {
+            'contadores': [[n, list(e), v] for (n, e), v in datos['contadores'].items()],
+            'histogramas': [[n, list(e), d] for (n, e), d in datos['histogramas'].items()],
+        }
+        ruta = os.path.join(self.directorio, f"{PREFIJO_ARCHIVO}{os.getpid()}.json")
+        temporal = f"{ruta}.{threading.get_ident()}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(serializable, archivo)
+        os.replace(temporal, ruta)
+
+    def combinada(self):
+        """
+        Combina la instantánea local con las de los demás workers.
+
+        Retorna:
+            dict: {'contadores': {...}, 'histogramas': {...}}
+        """
+        datos = self.instantanea()
+        if not self.directorio or not os.path.isdir(self.directorio):
+            return datos
+
+        propio = f"{PREFIJO_ARCHIVO}{os.getpid()}.json"
+        for nombre_archivo in os.listdir(self.directorio):
+            if not nombre_archivo.startswith(PREFIJO_ARCHIVO) or not nombre_archivo.endswith('.json'):
+                continue
+            if nombre_archivo == propio:
+                continue
+            ruta = os.path.join(self.directorio, nombre_archivo)
+            if not _proceso_existe(nombre_archivo[len(PREFIJO_ARCHIVO):-len('.json')]):
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(ruta, encoding='utf-8') as archivo:
+                    otro = json.load(archivo)
+            except (OSError, ValueError):
+                continue
+            for nombre, etiquetas, valor in otro['contadores']:
+                clave = (nombre, tuple(tuple(par) for par in etiquetas))
+                datos['contadores'][clave] = datos['contadores'].get(clave, 0) + valor
+            for nombre, etiquetas, valores in otro['histogramas']:
+                clave = (nombre, tuple(tuple(par) for par in etiquetas))
+                _sumar_histograma(datos['histogramas'], clave, valores)
+        return datos
+
+    def exposicion(self):
+        """
+        Genera el texto de exposición de Prometheus.
+
+        Retorna:
+            str: Métricas en formato de texto
+        """
+        datos = self.combinada()
+        lineas = []
+        for nombre, (tipo, ayuda) in METRICAS.items():
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            if tipo == 'counter':
+                for (n, etiquetas), valor in sorted(datos['contadores'].items()):
+                    if n == nombre:
+                        lineas.append(f"{nombre}{_etiquetas(etiquetas)} {_numero(valor)}")
+            else:
+                limites = _limites_de(nombre)
+                for (n, etiquetas), valores in sorted(datos['histogramas'].items()):
+                    if n != nombre:
+                        continue
+                    acumulado = 0
+                    for limite, conteo in zip(limites + ('+Inf',), valores):
+                        acumulado += conteo
+                        le = limite if limite == '+Inf' else _numero(limite)
+                        lineas.append(f"{nombre}_bucket{_etiquetas(etiquetas + (('le', le),))} {acumulado}")
+                    lineas.append(f"{nombre}_sum{_etiquetas(etiquetas)} {_numero(valores[-2])}")
+                    lineas.append(f"{nombre}_count{_etiquetas(etiquetas)} {valores[-1]}")
+        return "\n".join(lineas) + "\n"
+
+
+def _sumar_fragmento(destino, fragmento):
+    """Suma los contadores e histogramas de un fragmento a otro."""
+    contadores = destino['contadores']
+    for clave, valor in fragmento['contadores'].items():
+        contadores[clave] = contadores.get(clave, 0) + valor
+    for clave, datos in fragmento['histogramas'].items():
+        _sumar_histograma(destino['histogramas'], clave, datos)
+
+
+def _proceso_existe(pid):
+    """
+    Retorna False si el pid (texto) es de un proceso que ya terminó.
+
+    Fuera de POSIX (donde os.kill no sirve para consultar) se asume que
+    el proceso existe y el archivo se conserva.
+    """
+    if os.name != 'posix' or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _sumar_histograma(histogramas, clave, datos):
+    """Suma los datos de un histograma a un diccionario acumulador."""
+    actual = histogramas.get(clave)
+    if actual is None:
+        histogramas[clave] = list(datos)
+    else:
+        for i, valor in enumerate(datos):
+            actual[i] += valor
+
+
+def _limites_de(nombre):
+    """Retorna los límites de bucket de un histograma."""
+    if nombre == 'ec_tabla_puntos':
+        return LIMITES_PUNTOS
+    return LIMITES_LATENCIA
+
+
+def _etiquetas(etiquetas):
+    """Formatea las etiquetas como {a="x",b="y"}."""
+    if not etiquetas:
+        return ""
+    partes = []
+    for clave, valor in etiquetas:
+        valor = str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        partes.append(f'{clave}="{valor}"')
+    return "{" + ",".join(partes) + "}"
+
+
+def _numero(valor):
+    """Formatea un número sin decimales innecesarios."""
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return repr(valor)
+
+
+# =====================================================================
+# REGISTRO GLOBAL
+# =====================================================================
+registro = RegistroMetricas(directorio=os.environ.get('EC_METRICAS_DIR'))
+
+
+def _ruta_actual():
+    """Retorna la plantilla de ruta de la petición (evita cardinalidad alta)."""
+    if request.url_rule is not None:
+        return request.url_rule.rule
+    return RUTA_DESCONOCIDA
+
+
+def registrar_cache(nombre, acierto):
+    """
+    Registra una consulta a una caché.
+
+    Parámetros:
+        nombre (str): Nombre de la caché
+        acierto (bool): True si fue un acierto (hit)
+    """
+    resultado = 'hit' if acierto else 'miss'
+    registro.incrementar('ec_cache_requests_total',
+                         (('cache', nombre), ('resultado', resultado)))
+
+
+def registrar_tamano_tabla(puntos):
+    """
+    Registra el número de puntos calculados por una tabla.
+
+    Parámetros:
+        puntos (int): Número de filas calculadas
+    """
+    registro.observar('ec_tabla_puntos', (('route', _ruta_actual()),),
+                      puntos, LIMITES_PUNTOS)
+
+
+def registrar_rechazo(motivo):
+    """
+    Registra una petición rechazada por los límites.
+
+    Parámetros:
+        motivo (str): 'tasa' o 'concurrencia'
+    """
+    registro.incrementar('ec_rechazos_total',
+                         (('route', _ruta_actual()), ('motivo', motivo)))
+
+
+def instalar_metricas(app, registro_metricas=None):
+    """
+    Instala los hooks de métricas y la ruta /metrics en la aplicación.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        registro_metricas (RegistroMetricas): Registro a usar (opcional)
+    """
+    reg = registro_metricas or registro
+    instalar_fases(app)
+
+    if reg.directorio:
+        os.makedirs(reg.directorio, exist_ok=True)
+
+    @app.after_request
+    def _registrar_peticion(response):
+        fases, total = cerrar_fases()
+        if fases is None:
+            return response
+
+        ruta = _ruta_actual()
+        reg.incrementar('ec_http_requests_total',
+                        (('route', ruta), ('method', request.method),
+                         ('status', str(response.status_code))))
+        reg.observar('ec_http_request_duration_seconds', (('route', ruta),),
+                     total, LIMITES_LATENCIA)
+        for fase, segundos in fases.items():
+            reg.observar('ec_http_request_phase_seconds',
+                         (('route', ruta), ('phase', fase)),
+                         segundos, LIMITES_LATENCIA)
+        reg.volcar()
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        """Exposición de métricas en formato de texto de Prometheus."""
+        return Response(reg.exposicion(),
+                        content_type='text/plain; version=0.0.4; charset=utf-8')
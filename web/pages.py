@@ -0,0 +1,127 @@
+"""
+=====================================================================
+    PAGES - Caché de páginas pre-renderizadas
+=====================================================================
+Las páginas index, newton y radiactiva no dependen de la petición, así
+que cada plantilla se renderiza una vez por proceso y se guarda como
+bytes junto con su ETag y sus variantes comprimidas. Servir una página
+cuesta lo mismo que servir un archivo estático, y el navegador la
+revalida con If-None-Match (304 sin cuerpo).
+
+En modo debug la página se vuelve a renderizar cuando cambia el
+archivo de la plantilla.
+=====================================================================
+"""
+
+import hashlib
+import threading
+
+from flask import Response, render_template, request
+
+from .compression import (
+    UMBRAL_BYTES,
+    agregar_vary,
+    brotli,
+    comprimir,
+    elegir_codificacion
+)
+
+
+class CachePaginas:
+    """
+    Páginas renderizadas una vez y servidas desde memoria.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._paginas = {}
+        self._lock = threading.Lock()
+
+    def obtener(self, plantilla):
+        """
+        Retorna la página renderizada, renderizándola si hace falta.
+
+        Parámetros:
+            plantilla (str): Nombre de la plantilla
+
+        Retorna:
+            dict: {'etag', 'variantes', 'plantilla'}
+        """
+        pagina = self._paginas.get(plantilla)
+        if self._vigente(pagina):
+            return pagina
+
+        with self._lock:
+            pagina = self._paginas.get(plantilla)
+            if not self._vigente(pagina):
+                pagina = self._renderizar(plantilla)
+                self._paginas[plantilla] = pagina
+        return pagina
+
+    def responder(self, plantilla):
+        """
+        Sirve una página desde la caché según If-None-Match y Accept-Encoding.
+
+        Parámetros:
+            plantilla (str): Nombre de la plantilla
+
+        Retorna:
+            Response: Respuesta HTML
+        """
+        pagina = self.obtener(plantilla)
+
+        if pagina['etag'] in request.if_none_match:
+            response = Response(status=304)
+        else:
+            variantes = pagina['variantes']
+            codificacion = elegir_codificacion([c for c in ('br', 'gzip') if c in variantes])
+            response = Response(variantes[codificacion], mimetype='text/html')
+            if codificacion:
+                response.headers['Content-Encoding'] = codificacion
+
+        response.set_etag(pagina['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        agregar_vary(response)
+        return response
+
+    def limpiar(self):
+        """Descarta todas las páginas renderizadas."""
+        with self._lock:
+            self._paginas.clear()
+
+    def _vigente(self, pagina):
+        # Fuera de debug una página renderizada no caduca
+        if pagina is None:
+            return False
+        return not self.app.debug or pagina['plantilla'].is_up_to_date
+
+    def _renderizar(self, plantilla):
+        contenido = render_template(plantilla).encode('utf-8')
+        variantes = {None: contenido}
+        if len(contenido) >= UMBRAL_BYTES:
+            variantes['gzip'] = comprimir(contenido, 'gzip', 9)
+            if brotli is not None:
+                variantes['br'] = comprimir(contenido, 'br')
+        return {
+            'etag': hashlib.sha256(contenido).hexdigest()[:16],
+            'variantes': variantes,
+            'plantilla': self.app.jinja_env.get_template(plantilla)
+        }
+
+
+def instalar_paginas(app):
+    """
+    Crea la caché de páginas de la aplicación.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+
+    Retorna:
+        CachePaginas: Caché a usar en las vistas
+    """
+    paginas = CachePaginas(app)
+    app.extensions['ec_paginas'] = paginas
+    return paginas
@@ -0,0 +1,109 @@
+"""
+=====================================================================
+    PHASES - Medición de fases de una petición
+=====================================================================
+Cada petición se divide en fases (parse, compute, serialize...). Las
+duraciones se acumulan en flask.g para que las consuman las métricas
+y la cabecera Server-Timing.
+=====================================================================
+"""
+
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+
+from .json_provider import ProveedorJSONRapido
+
+
+@contextmanager
+def medir_fase(nombre):
+    """
+    Mide el tiempo de un bloque y lo suma a la fase indicada.
+
+    Fuera de una petición el bloque se ejecuta sin medir.
+
+    Parámetros:
+        nombre (str): Nombre de la fase (parse, compute, serialize...)
+    """
+    if not has_request_context():
+        yield
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_fase(nombre, time.perf_counter() - inicio)
+
+
+def registrar_fase(nombre, segundos):
+    """
+    Suma una duración a una fase de la petición actual.
+
+    Parámetros:
+        nombre (str): Nombre de la fase
+        segundos (float): Duración a sumar
+    """
+    fases = g.setdefault('fases', {})
+    fases[nombre] = fases.get(nombre, 0.0) + segundos
+
+
+def cerrar_fases():
+    """
+    Cierra la medición de la petición actual y retorna sus fases.
+
+    Si la vista no midió 'compute' explícitamente, se calcula como el
+    tiempo de la vista menos las fases medidas dentro de ella. La primera
+    llamada fija los valores; las siguientes retornan el mismo resultado.
+
+    Retorna:
+        tuple: (fases, total) con fases como dict nombre -> segundos y
+               total en segundos, o (None, None) si no se midió la petición
+    """
+    cerradas = g.get('fases_cerradas')
+    if cerradas is not None:
+        return cerradas
+
+    inicio = g.get('inicio_peticion')
+    if inicio is None:
+        return None, None
+
+    fin = time.perf_counter()
+    fases = dict(g.get('fases', {}))
+    vista = fin - g.get('inicio_vista', inicio)
+    medidas = sum(v for fase, v in fases.items() if fase != 'parse')
+    fases.setdefault('compute', max(vista - medidas, 0.0))
+
+    g.fases_cerradas = (fases, fin - inicio)
+    return g.fases_cerradas
+
+
+class ProveedorJSONMedido(ProveedorJSONRapido):
+    """Proveedor JSON de Flask que mide la serialización como fase 'serialize'."""
+
+    def response(self, *args, **kwargs):
+        with medir_fase('serialize'):
+            return super().response(*args, **kwargs)
+
+
+def instalar_fases(app):
+    """
+    Instala la medición de fases en la aplicación (una sola vez).
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+    """
+    if app.extensions.get('ec_fases'):
+        return
+    app.extensions['ec_fases'] = True
+    app.json = ProveedorJSONMedido(app)
+
+    @app.before_request
+    def _iniciar_fases():
+        g.inicio_peticion = time.perf_counter()
+        if request.is_json:
+            # get_json guarda el resultado, así la vista no vuelve a parsear
+            with medir_fase('parse'):
+                request.get_json(silent=True)
+        g.inicio_vista = time.perf_counter()
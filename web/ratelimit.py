@@ -0,0 +1,218 @@
+"""
+=====================================================================
+    RATE LIMIT - Cubetas de tokens y límite de concurrencia
+=====================================================================
+Cada cliente tiene una cubeta de tokens que se recarga a ritmo
+constante. Cada petición consume tokens según su costo estimado
+(1 token base + 1 por cada PUNTOS_POR_TOKEN puntos de tabla), así una
+tabla de 200 000 puntos cuesta mucho más que un /api/calcular-*. Si no
+hay tokens suficientes se responde 429 con Retry-After. Una petición que
+cuesta más que la capacidad entra con la cubeta llena y la deja en
+negativo: el cliente paga el costo completo esperando la recarga.
+
+Los endpoints pesados comparten además un límite de peticiones
+simultáneas por worker: cuando está lleno se responde 503 en lugar de
+dejar que las tablas grandes ocupen todos los hilos, y los cálculos
+ligeros siguen respondiendo rápido.
+
+Con EC_LIMITE_DIR las cubetas se guardan en archivos de ese directorio
+(uno por cliente, con bloqueo fcntl) y se comparten entre los workers
+de gunicorn. Sin la variable, o en sistemas sin fcntl, cada worker
+lleva sus propias cubetas en memoria.
+
+El cliente es request.remote_addr. Detrás de proxies (el router de
+Heroku, nginx) esa dirección es la del proxy y todos los clientes
+compartirían una cubeta: EC_PROXIES indica cuántos proxies de
+confianza agregan X-Forwarded-For, y instalar_proxies aplica ProxyFix
+para que remote_addr sea la del cliente. Sin la variable no se confía
+en X-Forwarded-For (un cliente podría falsificarla).
+=====================================================================
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+
+from flask import g, jsonify, request
+
+try:
+    import fcntl
+except ImportError:  # Windows: solo cubetas en memoria
+    fcntl = None
+
+CAPACIDAD = float(os.environ.get('EC_LIMITE_CAPACIDAD', '400'))
+RECARGA_POR_SEGUNDO = float(os.environ.get('EC_LIMITE_RECARGA', '20'))
+MAX_PESADAS = int(os.environ.get('EC_LIMITE_PESADAS', '2'))
+ESPERA_PESADAS = float(os.environ.get('EC_LIMITE_ESPERA', '0.5'))
+PUNTOS_POR_TOKEN = 1000
+PROXIES = int(os.environ.get('EC_PROXIES', '0'))
+
+
+class LimitadorTasa:
+    """
+    Cubetas de tokens por cliente.
+
+    Parámetros:
+        capacidad (float): Tokens máximos acumulables (ráfaga)
+        recarga (float): Tokens recuperados por segundo
+        directorio (str): Directorio compartido entre workers (opcional)
+        reloj (callable): Fuente de tiempo en segundos
+    """
+
+    def __init__(self, capacidad=CAPACIDAD, recarga=RECARGA_POR_SEGUNDO,
+                 directorio=None, reloj=time.time):
+        self.capacidad = capacidad
+        self.recarga = recarga
+        self.directorio = directorio if fcntl is not None else None
+        self.reloj = reloj
+        self._cubetas = {}
+        self._lock = threading.Lock()
+        if self.directorio:
+            os.makedirs(self.directorio, exist_ok=True)
+
+    def consumir(self, cliente, costo):
+        """
+        Intenta consumir tokens de la cubeta de un cliente.
+
+        Parámetros:
+            cliente (str): Identificador del cliente
+            costo (float): Tokens a consumir; para entrar basta con la
+                           cubeta llena y el resto queda como deuda
+
+        Retorna:
+            tuple: (permitido, segundos de espera hasta tener tokens)
+        """
+        if self.directorio:
+            return self._consumir_archivo(cliente, costo)
+        with self._lock:
+            estado = self._cubetas.get(cliente)
+            resultado, self._cubetas[cliente] = self._aplicar(estado, costo)
+            return resultado
+
+    def _aplicar(self, estado, costo):
+        """Recarga la cubeta y descuenta el costo si alcanza."""
+        ahora = self.reloj()
+        tokens, ultima = estado if estado is not None else (self.capacidad, ahora)
+        tokens = min(self.capacidad, tokens + (ahora - ultima) * self.recarga)
+        requerido = min(costo, self.capacidad)
+        if tokens >= requerido:
+            return (True, 0.0), (tokens - costo, ahora)
+        return (False, (requerido - tokens) / self.recarga), (tokens, ahora)
+
+    def _consumir_archivo(self, cliente, costo):
+        nombre = hashlib.sha1(cliente.encode('utf-8')).hexdigest()[:20]
+        ruta = os.path.join(self.directorio, f"{nombre}.cubeta")
+        with open(ruta, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    estado = tuple(float(v) for v in f.read().split())
+                    estado = estado if len(estado) == 2 else None
+                except ValueError:
+                    estado = None
+                resultado, (tokens, ahora) = self._aplicar(estado, costo)
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens!r} {ahora!r}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return resultado
+
+
+def costo_de_puntos(puntos):
+    """
+    Convierte un número de puntos en tokens.
+
+    Parámetros:
+        puntos (int): Puntos que calculará la petición
+
+    Retorna:
+        float: Costo en tokens
+    """
+    return 1.0 + max(puntos, 0) / PUNTOS_POR_TOKEN
+
+
+def instalar_proxies(app, proxies=None):
+    """
+    Toma la dirección del cliente de X-Forwarded-For (proxies de confianza).
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        proxies (int): Proxies de confianza delante de la aplicación
+                       (opcional, EC_PROXIES; 0 = no confiar en la cabecera)
+    """
+    proxies = PROXIES if proxies is None else proxies
+    if proxies > 0:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies)
+
+
+def _respuesta_rechazo(codigo, mensaje, espera):
+    response = jsonify({'exito': False, 'error': mensaje})
+    response.status_code = codigo
+    response.headers['Retry-After'] = str(max(1, math.ceil(espera)))
+    return response
+
+
+def instalar_limites(app, estimadores, limitador=None, max_pesadas=None,
+                     espera_pesadas=None, al_rechazar=None):
+    """
+    Instala la limitación de tasa en las rutas /api/ y el límite de
+    concurrencia en los endpoints pesados.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        estimadores (dict): endpoint -> (estimar_puntos(request), pesado),
+                            con pesado bool o pesado(request) -> bool.
+                            Los endpoints que no están cuestan 1 token.
+        limitador (LimitadorTasa): Limitador a usar (opcional)
+        max_pesadas (int): Peticiones pesadas simultáneas por worker (opcional)
+        espera_pesadas (float): Segundos de espera por un cupo (opcional)
+        al_rechazar (callable): al_rechazar(motivo) en cada rechazo (opcional)
+
+    Retorna:
+        LimitadorTasa: Limitador instalado
+    """
+    if limitador is None:
+        limitador = LimitadorTasa(directorio=os.environ.get('EC_LIMITE_DIR'))
+    max_pesadas = MAX_PESADAS if max_pesadas is None else max_pesadas
+    espera_pesadas = ESPERA_PESADAS if espera_pesadas is None else espera_pesadas
+    cupos_pesados = threading.BoundedSemaphore(max_pesadas)
+
+    def rechazar(codigo, motivo, mensaje, espera):
+        if al_rechazar is not None:
+            al_rechazar(motivo)
+        return _respuesta_rechazo(codigo, mensaje, espera)
+
+    @app.before_request
+    def _limitar_peticion():
+        if not request.path.startswith('/api/'):
+            return None
+
+        estimar, pesado = estimadores.get(request.endpoint, (None, False))
+        costo = costo_de_puntos(estimar(request)) if estimar else 1.0
+        cliente = request.remote_addr or 'desconocido'
+        permitido, espera = limitador.consumir(cliente, costo)
+        if not permitido:
+            return rechazar(429, 'tasa',
+                            'Demasiadas peticiones. Intenta de nuevo más tarde.', espera)
+
+        if callable(pesado):
+            pesado = pesado(request)
+        if pesado:
+            if not cupos_pesados.acquire(timeout=espera_pesadas):
+                return rechazar(503, 'concurrencia',
+                                'El servidor está ocupado con otros cálculos. Intenta de nuevo.', 1)
+            g.cupo_pesado = True
+        return None
+
+    @app.teardown_request
+    def _liberar_cupo(_error=None):
+        if g.pop('cupo_pesado', False):
+            cupos_pesados.release()
+
+    return limitador
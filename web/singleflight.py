@@ -0,0 +1,109 @@
+"""
+=====================================================================
+    SINGLEFLIGHT - Coalescencia de cálculos idénticos concurrentes
+=====================================================================
+Cuando llegan a la vez varias peticiones con los mismos parámetros
+canónicos, solo la primera (el líder) ejecuta el cálculo; las demás
+esperan y comparten su resultado ya serializado. Si el líder tarda más
+que el tiempo de espera, cada seguidor calcula por su cuenta, de modo
+que un líder atascado no bloquea a nadie indefinidamente.
+
+El plazo de cálculo es de cada petición y no forma parte de la clave:
+un seguidor no espera más allá de su propio plazo, y si el resultado
+del líder quedó incompleto o el líder abandonó con PlazoExcedido (su
+plazo venció antes) el seguidor lo descarta y calcula con el suyo.
+=====================================================================
+"""
+
+import threading
+
+from curvas.deadline import PlazoExcedido, tiempo_restante
+
+from .metrics import registrar_cache
+
+TIMEOUT_SEGUIDORES = 30.0  # segundos
+
+
+class _Vuelo:
+    """Cálculo en curso compartido entre líder y seguidores."""
+
+    __slots__ = ('terminado', 'resultado', 'error')
+
+    def __init__(self):
+        self.terminado = threading.Event()
+        self.resultado = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Agrupa llamadas concurrentes con la misma clave en un solo cálculo.
+
+    Es seguro entre hilos (workers de gunicorn con hilos).
+
+    Parámetros:
+        nombre (str): Nombre usado en las métricas de caché
+        timeout (float): Segundos máximos que espera un seguidor
+    """
+
+    def __init__(self, nombre, timeout=TIMEOUT_SEGUIDORES):
+        self.nombre = nombre
+        self.timeout = timeout
+        self._en_curso = {}
+        self._lock = threading.Lock()
+
+    def ejecutar(self, clave, funcion, es_completo=None):
+        """
+        Ejecuta funcion() o se une a un cálculo idéntico ya en curso.
+
+        Parámetros:
+            clave (tuple): Parámetros canónicos del cálculo (hashable)
+            funcion (callable): Cálculo sin argumentos
+            es_completo (callable): resultado -> bool; los seguidores
+                                    recalculan si retorna False (opcional)
+
+        Retorna:
+            object: Resultado de funcion() (propio o compartido)
+        """
+        with self._lock:
+            vuelo = self._en_curso.get(clave)
+            lider = vuelo is None
+            if lider:
+                vuelo = _Vuelo()
+                self._en_curso[clave] = vuelo
+
+        if lider:
+            registrar_cache(self.nombre, False)
+            try:
+                vuelo.resultado = funcion()
+            except BaseException as error:
+                vuelo.error = error
+                raise
+            finally:
+                with self._lock:
+                    if self._en_curso.get(clave) is vuelo:
+                        del self._en_curso[clave]
+                vuelo.terminado.set()
+            return vuelo.resultado
+
+        espera = self.timeout
+        restante = tiempo_restante()
+        if restante is not None:
+            espera = min(espera, max(restante, 0))
+        if not vuelo.terminado.wait(espera):
+            # El líder no terminó a tiempo: calcular sin esperarlo
+            registrar_cache(self.nombre, False)
+            return funcion()
+
+        if isinstance(vuelo.error, PlazoExcedido):
+            # Venció el plazo del líder, no necesariamente el propio
+            registrar_cache(self.nombre, False)
+            return funcion()
+        if vuelo.error is not None:
+            raise vuelo.error
+        if es_completo is not None and not es_completo(vuelo.resultado):
+            # Resultado parcial del plazo del líder: calcular con el propio
+            registrar_cache(self.nombre, False)
+            return funcion()
+        registrar_cache(self.nombre, True)
+        return vuelo.resultado
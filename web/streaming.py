@@ -0,0 +1,191 @@
+"""
+=====================================================================
+    STREAMING - Server-Sent Events con cuadros de simulación
+=====================================================================
+Convierte un generador de filas en un flujo SSE a un ritmo de cuadros
+por segundo pedido por el cliente.
+
+Entre cuadros el generador solo duerme con time.sleep, pero el flujo
+ocupa su hilo mientras dura. Por eso el Procfile usa workers gthread
+de gunicorn (sin dependencias extra): cada flujo retiene un hilo y no
+un worker completo. Para que ningún flujo retenga su hilo sin límite,
+duracion_flujo exige al menos MIN_FPS cuadros por segundo y una
+duración total de hasta EC_STREAM_MAX_S segundos, y cada worker admite
+a lo sumo EC_STREAM_MAX flujos simultáneos (el resto recibe 503) para
+dejar hilos libres a las demás peticiones.
+
+Control de flujo: el cuadro a enviar se calcula con el reloj. Si un
+cliente lento no consumió a tiempo los cuadros anteriores, los cuadros
+atrasados se descartan (se salta hasta el cuadro actual) en lugar de
+acumularse en memoria.
+=====================================================================
+"""
+
+import itertools
+import json
+import math
+import os
+import threading
+import time
+
+from flask import Response, stream_with_context
+
+# Cuadros por segundo mínimos y duración máxima de un flujo (segundos)
+MIN_FPS = 1
+MAX_DURACION = float(os.environ.get('EC_STREAM_MAX_S', '300'))
+
+# Flujos simultáneos por worker (gunicorn corre 8 hilos por worker)
+MAX_FLUJOS = int(os.environ.get('EC_STREAM_MAX', '4'))
+_cupos_flujos = threading.BoundedSemaphore(MAX_FLUJOS)
+
+
+def reservar_flujo():
+    """
+    Toma un cupo de flujo sin esperar.
+
+    Retorna:
+        bool: True si había cupo (se libera con liberar_flujo)
+    """
+    return _cupos_flujos.acquire(blocking=False)
+
+
+def liberar_flujo():
+    """Devuelve un cupo tomado con reservar_flujo."""
+    _cupos_flujos.release()
+
+
+def evento_sse(evento, datos, id_evento=None):
+    """
+    Formatea un evento SSE.
+
+    Parámetros:
+        evento (str): Nombre del evento
+        datos (dict): Datos que se envían como JSON
+        id_evento (int): Identificador del evento (opcional)
+
+    Retorna:
+        str: Texto del evento terminado en línea en blanco
+    """
+    lineas = [f"event: {evento}"]
+    if id_evento is not None:
+        lineas.append(f"id: {id_evento}")
+    lineas.append(f"data: {json.dumps(datos, separators=(',', ':'))}")
+    return "\n".join(lineas) + "\n\n"
+
+
+def duracion_flujo(total_puntos, fps, puntos_por_frame):
+    """
+    Calcula y valida la duración de un flujo antes de abrirlo.
+
+    Parámetros:
+        total_puntos (int): Número total de filas de la simulación
+        fps (float): Cuadros por segundo
+        puntos_por_frame (int): Filas que avanza cada cuadro
+
+    Retorna:
+        float: Duración del flujo en segundos
+
+    Lanza:
+        ValueError: Si fps es menor que MIN_FPS o el flujo supera MAX_DURACION
+    """
+    if fps < MIN_FPS:
+        raise ValueError(f'fps debe ser al menos {MIN_FPS}')
+    duracion = -(-total_puntos // puntos_por_frame) / fps
+    if duracion > MAX_DURACION:
+        raise ValueError(f'El flujo duraría {duracion:.0f} s y el máximo es {MAX_DURACION:.0f} s. '
+                         f'Aumente fps o puntos_por_frame.')
+    return duracion
+
+
+def verificar_extremos(crear_filas, total_puntos):
+    """
+    Revisa que la primera y la última fila sean finitas antes de abrir el
+    flujo (las curvas son monótonas: si los extremos caben, caben todas).
+
+    Parámetros:
+        crear_filas (callable): crear_filas(inicio) -> generador de filas
+        total_puntos (int): Número total de filas de la simulación
+
+    Lanza:
+        OverflowError: Si algún valor de la curva no cabe en un float
+    """
+    for inicio in (0, total_puntos - 1):
+        if not all(math.isfinite(v) for v in next(crear_filas(inicio))):
+            raise OverflowError('El resultado es demasiado grande para estos parámetros')
+
+
+def generar_cuadros(crear_filas, total_puntos, fps, puntos_por_frame,
+                    reloj=time.monotonic, dormir=time.sleep):
+    """
+    Genera los eventos SSE de una simulación.
+
+    Parámetros:
+        crear_filas (callable): crear_filas(inicio) -> generador de filas
+                                desde el índice inicio de la malla
+        total_puntos (int): Número total de filas de la simulación
+        fps (float): Cuadros por segundo
+        puntos_por_frame (int): Filas que avanza cada cuadro
+        reloj (callable): Función de tiempo monótono
+        dormir (callable): Función de espera
+
+    Retorna:
+        generator: Eventos SSE en texto
+    """
+    total_cuadros = -(-total_puntos // puntos_por_frame)
+    periodo = 1.0 / fps
+    inicio_reloj = reloj()
+    filas = crear_filas(0)
+    siguiente_fila = 0
+    cuadro = 0
+    descartados = 0
+
+    while cuadro < total_cuadros:
+        primera = cuadro * puntos_por_frame
+        if primera != siguiente_fila:
+            # Salto por cuadros descartados: se reancla el motor incremental
+            filas = crear_filas(primera)
+        cantidad = min(puntos_por_frame, total_puntos - primera)
+        lote = [list(fila) for fila in itertools.islice(filas, cantidad)]
+        siguiente_fila = primera + cantidad
+
+        yield evento_sse('frame', {
+            'frame': cuadro,
+            'filas': lote,
+            'descartados': descartados
+        }, id_evento=cuadro)
+
+        # Esperar al siguiente cuadro o saltar los que ya vencieron
+        objetivo = cuadro + 1
+        atrasado = int((reloj() - inicio_reloj) / periodo)
+        if atrasado > objetivo:
+            saltar = min(atrasado, total_cuadros - 1) - objetivo
+            if saltar > 0:
+                descartados += saltar
+                objetivo += saltar
+        else:
+            espera = inicio_reloj + objetivo * periodo - reloj()
+            if espera > 0:
+                dormir(espera)
+        cuadro = objetivo
+
+    yield evento_sse('fin', {'cuadros': total_cuadros, 'descartados': descartados})
+
+
+def respuesta_sse(eventos, al_cerrar=None):
+    """
+    Envuelve un generador de eventos en una respuesta SSE de Flask.
+
+    Parámetros:
+        eventos (generator): Generador de eventos SSE en texto
+        al_cerrar (callable): Se llama al cerrar la respuesta, aunque el
+                              cliente se desconecte (opcional)
+
+    Retorna:
+        Response: Respuesta con mimetype text/event-stream
+    """
+    respuesta = Response(stream_with_context(eventos), mimetype='text/event-stream')
+    if al_cerrar is not None:
+        respuesta.call_on_close(al_cerrar)
+    respuesta.headers['Cache-Control'] = 'no-cache'
+    respuesta.headers['X-Accel-Buffering'] = 'no'
+    return respuesta
@@ -0,0 +1,202 @@
+"""
+=====================================================================
+    TIMING - Cabecera Server-Timing y perfilador de peticiones lentas
+=====================================================================
+Añade a cada respuesta la cabecera Server-Timing con la duración de
+cada fase. Además, un perfilador por muestreo observa una fracción de
+las peticiones y, si superan un umbral de latencia, guarda sus pilas
+en formato "collapsed" (una línea por pila) en un archivo rotativo,
+listo para generar flamegraphs.
+
+Configuración por variables de entorno:
+    EC_PERFIL_FRACCION   Fracción de peticiones muestreadas (0.01)
+    EC_PERFIL_UMBRAL_MS  Latencia mínima para guardar la pila (1000)
+    EC_PERFIL_ARCHIVO    Archivo de salida (perfiles/peticiones_lentas.folded)
+=====================================================================
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+from flask import g, request
+
+from .phases import cerrar_fases, instalar_fases
+
+INTERVALO_MUESTREO = 0.005  # segundos entre muestras
+MAX_BYTES_ARCHIVO = 5 * 1024 * 1024
+RESPALDOS_ARCHIVO = 5
+
+
+def cabecera_server_timing(fases, total):
+    """
+    Construye el valor de la cabecera Server-Timing.
+
+    Parámetros:
+        fases (dict): Nombre de fase -> segundos
+        total (float): Duración total de la petición en segundos
+
+    Retorna:
+        str: Valor de la cabecera (duraciones en milisegundos)
+    """
+    partes = [f"{fase};dur={segundos * 1000:.3f}" for fase, segundos in fases.items()]
+    partes.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(partes)
+
+
+class PerfiladorMuestreo:
+    """
+    Perfilador por muestreo de hilos de petición.
+
+    Un único hilo de fondo toma, cada INTERVALO_MUESTREO segundos, la pila
+    de los hilos registrados y acumula cuántas veces aparece cada pila.
+
+    Parámetros:
+        archivo (str): Archivo rotativo donde se guardan las pilas
+        intervalo (float): Segundos entre muestras
+    """
+
+    def __init__(self, archivo, intervalo=INTERVALO_MUESTREO):
+        self.archivo = archivo
+        self.intervalo = intervalo
+        self._activos = {}
+        self._lock = threading.Lock()
+        self._hilo = None
+        self._logger = None
+
+    def iniciar(self, id_hilo):
+        """
+        Empieza a muestrear un hilo.
+
+        Parámetros:
+            id_hilo (int): Identificador del hilo (threading.get_ident())
+        """
+        with self._lock:
+            self._activos[id_hilo] = {}
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._bucle, name='perfilador', daemon=True)
+                self._hilo.start()
+
+    def detener(self, id_hilo):
+        """
+        Deja de muestrear un hilo.
+
+        Parámetros:
+            id_hilo (int): Identificador del hilo
+
+        Retorna:
+            dict: Pila colapsada -> número de muestras
+        """
+        with self._lock:
+            return self._activos.pop(id_hilo, {})
+
+    def _bucle(self):
+        """Bucle del hilo de muestreo."""
+        while True:
+            time.sleep(self.intervalo)
+            with self._lock:
+                if not self._activos:
+                    continue
+                marcos = sys._current_frames()
+                for id_hilo, pilas in self._activos.items():
+                    marco = marcos.get(id_hilo)
+                    if marco is None:
+                        continue
+                    pila = _colapsar(marco)
+                    pilas[pila] = pilas.get(pila, 0) + 1
+
+    def guardar(self, raiz, pilas):
+        """
+        Escribe las pilas en el archivo rotativo en formato collapsed.
+
+        Parámetros:
+            raiz (str): Marco raíz de cada pila (p. ej. "POST /api/generar-tabla")
+            pilas (dict): Pila colapsada -> número de muestras
+        """
+        if not pilas:
+            return
+        logger = self._obtener_logger()
+        for pila, muestras in pilas.items():
+            logger.info("%s;%s %d", raiz, pila, muestras)
+
+    def _obtener_logger(self):
+        """Crea el logger con archivo rotativo la primera vez que se usa."""
+        if self._logger is None:
+            directorio = os.path.dirname(self.archivo)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            logger = logging.getLogger(f"ec.perfilador.{self.archivo}")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            manejador = RotatingFileHandler(self.archivo, maxBytes=MAX_BYTES_ARCHIVO,
+                                            backupCount=RESPALDOS_ARCHIVO, encoding='utf-8')
+            manejador.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(manejador)
+            self._logger = logger
+        return self._logger
+
+
+def _colapsar(marco):
+    """Convierte un marco de pila en "archivo:funcion;..." desde la raíz."""
+    nombres = []
+    while marco is not None:
+        codigo = marco.f_code
+        nombres.append(f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}")
+        marco = marco.f_back
+    nombres.reverse()
+    return ";".join(nombres)
+
+
+def instalar_server_timing(app, fraccion=None, umbral_ms=None, archivo=None):
+    """
+    Instala la cabecera Server-Timing y el perfilador de peticiones lentas.
+
+    Parámetros:
+        app (Flask): Aplicación Flask
+        fraccion (float): Fracción de peticiones muestreadas (opcional)
+        umbral_ms (float): Latencia mínima para guardar pilas (opcional)
+        archivo (str): Archivo de salida de las pilas (opcional)
+    """
+    if fraccion is None:
+        fraccion = float(os.environ.get('EC_PERFIL_FRACCION', '0.01'))
+    if umbral_ms is None:
+        umbral_ms = float(os.environ.get('EC_PERFIL_UMBRAL_MS', '1000'))
+    if archivo is None:
+        archivo = os.environ.get('EC_PERFIL_ARCHIVO', os.path.join('perfiles', 'peticiones_lentas.folded'))
+
+    instalar_fases(app)
+    perfilador = PerfiladorMuestreo(archivo)
+
+    @app.before_request
+    def _iniciar_perfil():
+        if fraccion > 0 and random.random() < fraccion:
+            g.id_hilo_perfil = threading.get_ident()
+            perfilador.iniciar(g.id_hilo_perfil)
+
+    @app.after_request
+    def _agregar_server_timing(response):
+        fases, total = cerrar_fases()
+        if fases is None:
+            return response
+
+        response.headers['Server-Timing'] = cabecera_server_timing(fases, total)
+
+        id_hilo = g.pop('id_hilo_perfil', None)
+        if id_hilo is not None:
+            pilas = perfilador.detener(id_hilo)
+            if total * 1000 >= umbral_ms:
+                perfilador.guardar(f"{request.method} {request.path}", pilas)
+        return response
+
+    @app.teardown_request
+    def _detener_perfil(_error=None):
+        # Si la vista lanzó una excepción after_request no se ejecuta
+        id_hilo = g.pop('id_hilo_perfil', None)
+        if id_hilo is not None:
+            perfilador.detener(id_hilo)
+
+    return perfilador